@@ -0,0 +1,152 @@
+"""
+A pool of audience connections, shared across Actors and tests.
+"""
+
+import threading
+import time
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+import pollster
+
+
+def connect_to_audience() -> Any:
+    """Open a brand-new connection to the audience."""
+    return pollster.connect_to_audience()
+
+
+def is_open(connection: Any) -> bool:
+    """The default health check: the connection hasn't been closed."""
+    return getattr(connection, "closed", False) is not True
+
+
+class PoolStats(NamedTuple):
+    """How much use the pool is getting."""
+
+    hits: int
+    misses: int
+    evictions: int
+    unhealthy: int
+    checked_out: int
+    idle: int
+
+
+class AudiencePool:
+    """Keep audience connections open between Actors, so each test needn't.
+
+    Checking out reuses the most recently returned healthy connection (a
+    hit) or opens a new one (a miss). Up to ``size`` connections are kept
+    around once they are checked back in; any more are closed, as are any
+    that sit idle for longer than ``max_idle`` seconds.
+
+    Examples::
+
+        pool = AudiencePool(size=4, max_idle=30)
+        the_actor.can(PollTheAudience(pool=pool))
+    """
+
+    def __init__(
+        self,
+        size: int = 8,
+        max_idle: float = 60.0,
+        connect: Callable[[], Any] = connect_to_audience,
+        is_healthy: Callable[[Any], bool] = is_open,
+    ) -> None:
+        self.size = size
+        self.max_idle = max_idle
+        self.connect = connect
+        self.is_healthy = is_healthy
+        self.idle: List[Tuple[Any, float]] = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.unhealthy = 0
+        self.checked_out = 0
+        self._lock = threading.Lock()
+
+    def _evict_idle(self, now: float) -> List[Any]:
+        """Pull out the connections that have been idle too long."""
+        stale = [c for c, last_used in self.idle if now - last_used > self.max_idle]
+        if stale:
+            self.idle = [(c, t) for c, t in self.idle if now - t <= self.max_idle]
+            self.evictions += len(stale)
+        return stale
+
+    def checkout(self) -> Any:
+        """Get a connection to the audience, reusing an idle one if we can."""
+        to_close = []
+        reused: Optional[Tuple[Any, float]] = None
+        with self._lock:
+            to_close.extend(self._evict_idle(time.monotonic()))
+            while self.idle and reused is None:
+                candidate = self.idle.pop()
+                if self.is_healthy(candidate[0]):
+                    reused = candidate
+                else:
+                    self.unhealthy += 1
+                    to_close.append(candidate[0])
+
+        try:
+            for stale in to_close:
+                stale.close()
+            connection = self.connect() if reused is None else reused[0]
+        except BaseException:
+            if reused is not None:
+                with self._lock:
+                    self.idle.append(reused)
+            raise
+
+        # only count the checkout once there's a connection to check back in
+        with self._lock:
+            if reused is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            self.checked_out += 1
+        return connection
+
+    def checkin(self, connection: Any) -> None:
+        """Give a connection back to the pool, or close it if the pool is full."""
+        to_close = []
+        with self._lock:
+            if any(idle is connection for idle, _ in self.idle):
+                # already given back; two Actors mustn't end up sharing it
+                return
+            now = time.monotonic()
+            self.checked_out -= 1
+            to_close.extend(self._evict_idle(now))
+            if len(self.idle) < self.size and self.is_healthy(connection):
+                self.idle.append((connection, now))
+            else:
+                to_close.append(connection)
+
+        for stale in to_close:
+            stale.close()
+
+    def discard(self, connection: Any) -> None:
+        """Close a checked-out connection instead of giving it back."""
+        with self._lock:
+            self.checked_out -= 1
+        connection.close()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self.idle = self.idle, []
+        for connection, _ in idle:
+            connection.close()
+
+    @property
+    def stats(self) -> PoolStats:
+        """Hit, miss, and eviction counts, and how many connections are out."""
+        with self._lock:
+            return PoolStats(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.unhealthy,
+                self.checked_out,
+                len(self.idle),
+            )
+
+
+the_audience_pool = AudiencePool()
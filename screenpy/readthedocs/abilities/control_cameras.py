@@ -1,19 +1,93 @@
+import threading
+from typing import Callable, List, Optional
+
 import cam_py
 
 
 class ControlCameras:
     """Enable an Actor to control cameras through cam_py.
 
+    The recording session isn't opened until the Actor first reaches for
+    it, so Actors who never touch a camera never pay for one. If you know
+    the cameras will be needed, the session can be warmed up ahead of time
+    on a background thread.
+
+    An Actor who controls cameras asynchronously gets an AsyncRecordingSession,
+    which the Actions' ``perform_as_async`` coroutines can drive from an
+    event loop without any threads.
+
     Examples::
 
         the_actor.can(ControlCameras())
+
+        the_actor.can(ControlCameras.prewarmed())
+
+        the_actor.can(ControlCameras.using(cam_py.RecordingSession(latency=0.1)))
+
+        the_actor.can(ControlCameras.asynchronously(latency=0.1))
     """
 
-    def __init__(self) -> None:
-        self.campy_session = cam_py.RecordingSession()
-        self.cameras = []
+    @staticmethod
+    def using(campy_session: cam_py.RecordingSession) -> "ControlCameras":
+        """Control the cameras of an already-created session."""
+        return ControlCameras(campy_session)
+
+    @staticmethod
+    def asynchronously(latency: float = 0.0) -> "ControlCameras":
+        """Control the cameras through an asyncio-friendly session."""
+        return ControlCameras(
+            open_session=lambda: cam_py.AsyncRecordingSession(latency=latency)
+        )
+
+    @staticmethod
+    def prewarmed() -> "ControlCameras":
+        """Start opening the session in the background right away."""
+        return ControlCameras().prewarm()
+
+    def __init__(
+        self,
+        campy_session: Optional[cam_py.RecordingSession] = None,
+        open_session: Callable[[], cam_py.RecordingSession] = cam_py.RecordingSession,
+    ) -> None:
+        self._campy_session = campy_session
+        self._open_session = open_session
+        self._opening = threading.Lock()
+        self._prewarming: Optional[threading.Thread] = None
+
+    @property
+    def campy_session(self) -> cam_py.RecordingSession:
+        """The recording session, opened the first time it is needed."""
+        if self._campy_session is None:
+            with self._opening:
+                if self._campy_session is None:
+                    self._campy_session = self._open_session()
+        return self._campy_session
+
+    @property
+    def session_is_open(self) -> bool:
+        """Whether the recording session has been opened yet."""
+        return self._campy_session is not None
+
+    def prewarm(self) -> "ControlCameras":
+        """Open the session on a background thread."""
+        if self._campy_session is None and self._prewarming is None:
+            self._prewarming = threading.Thread(
+                target=lambda: self.campy_session, daemon=True
+            )
+            self._prewarming.start()
+        return self
+
+    @property
+    def cameras(self) -> List[cam_py.Camera]:
+        """All the cameras on set in this Actor's session."""
+        if self._campy_session is None:
+            return []
+        return self._campy_session.cameras
 
     def forget(self) -> None:
-        for camera in self.cameras:
-            camera.stop()
-        self.campy_session.wrap()
+        if self._prewarming is not None:
+            self._prewarming.join()
+        if self._campy_session is None:
+            return
+        self._campy_session.stop_recording()
+        self._campy_session.wrap()
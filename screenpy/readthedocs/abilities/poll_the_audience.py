@@ -1,16 +1,260 @@
-import pollster
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Deque, List, NamedTuple, Optional
+
+import cam_py
+from screenpy.exceptions import UnableToAnswer
+
+from . import audience_pool
+from .audience_pool import AudiencePool
+
+
+class StreamStats(NamedTuple):
+    """How well a mood stream is keeping up with the audience."""
+
+    received: int
+    dropped: int
+    backlog: int
+    high_water_mark: int
+    overflows: int
+
+
+class MoodWindow(NamedTuple):
+    """The audience's mood, summed up over several packets."""
+
+    top_mood: str
+    saturation: float
+    packets: int
+
+
+class MoodStream:
+    """Read mood packets in the background into a bounded ring buffer.
+
+    When the buffer is full, the oldest packet makes room for the newest.
+    A packet that is pushed out before anyone looked at it counts as dropped.
+
+    The audience is polled every ``poll_interval`` seconds. If it goes quiet
+    (its poll raises StopIteration), the packets already read can still be
+    looked at. If polling fails any other way, every read after that raises.
+    """
+
+    def __init__(
+        self, connection: Any, buffer_size: int, poll_interval: float
+    ) -> None:
+        self.connection = connection
+        self.poll_interval = poll_interval
+        self.packets: Deque[Any] = deque(maxlen=buffer_size)
+        self.error: Optional[BaseException] = None
+        self.received = 0
+        self.dropped = 0
+        self.backlog = 0
+        self.high_water_mark = 0
+        self.overflows = 0
+        self._arrived = threading.Condition()
+        self._stopped = threading.Event()
+        self._consumer = threading.Thread(target=self._consume, daemon=True)
+
+    def start(self) -> None:
+        """Start listening to the audience."""
+        self._consumer.start()
+
+    def stop(self) -> bool:
+        """Stop listening to the audience. Returns whether it has stopped."""
+        self._stopped.set()
+        if self._consumer.is_alive():
+            self._consumer.join(timeout=1)
+        return not self._consumer.is_alive()
+
+    def _consume(self) -> None:
+        """Keep reading packets until told to stop or the audience goes quiet."""
+        while not self._stopped.is_set():
+            try:
+                packet = self.connection.poll_mood()
+            except StopIteration:
+                return
+            except Exception as exc:  # pylint: disable=broad-except
+                with self._arrived:
+                    self.error = exc
+                    self._arrived.notify_all()
+                return
+
+            with self._arrived:
+                if len(self.packets) == self.packets.maxlen:
+                    self.overflows += 1
+                    if self.backlog == self.packets.maxlen:
+                        self.dropped += 1
+                self.packets.append(packet)
+                self.received += 1
+                self.backlog = min(self.backlog + 1, len(self.packets))
+                self.high_water_mark = max(self.high_water_mark, self.backlog)
+                self._arrived.notify_all()
+
+            if self.poll_interval:
+                self._stopped.wait(self.poll_interval)
+
+    def _wait_for_packets(self, timeout: float) -> None:
+        """Wait for the first packet to arrive. Call while holding the lock."""
+        self._arrived.wait_for(lambda: self.packets or self.error, timeout)
+        if not self.packets:
+            raise UnableToAnswer(f"The audience sent no mood packets: {self.error}")
+        if self.error is not None:
+            raise UnableToAnswer(
+                f"The audience stopped sending mood packets: {self.error}"
+            ) from self.error
+
+    def latest(self, timeout: float) -> Any:
+        """Get the most recent packet."""
+        with self._arrived:
+            self._wait_for_packets(timeout)
+            self.backlog = 0
+            return self.packets[-1]
+
+    def window(self, num_packets: int, timeout: float) -> List[Any]:
+        """Get up to the last ``num_packets`` packets, oldest first."""
+        with self._arrived:
+            self._wait_for_packets(timeout)
+            self.backlog = 0
+            return list(self.packets)[-num_packets:]
+
+    @property
+    def stats(self) -> StreamStats:
+        """How the stream is doing, right now."""
+        with self._arrived:
+            return StreamStats(
+                self.received,
+                self.dropped,
+                self.backlog,
+                self.high_water_mark,
+                self.overflows,
+            )
 
 
 class PollTheAudience:
     """Enable Actors to poll the audience.
 
+    Connections to the audience come from a pool, and go back to it when
+    the Actor forgets this Ability. Without a ``pool``, that's the one shared
+    by every Actor, ``audience_pool.the_audience_pool``, looked up when the
+    Ability is created.
+
+    By default, every question polls the audience afresh. A ``cached`` poll
+    keeps its answer for a while instead, so several questions asked
+    together share a single round-trip to the audience. A cached poll
+    ``watching`` a recording session forgets its answer whenever the shot
+    changes, because the audience's mood may have changed with it.
+
+    A streaming Ability instead reads mood packets in the background, and
+    answers from the latest packet (or a window of recent packets) without
+    waiting.
+
     Examples::
 
         the_actor.can(PollTheAudience())
+
+        the_actor.can(PollTheAudience.cached(ttl=1.0).watching(campy_session))
+
+        the_actor.can(PollTheAudience(pool=AudiencePool(size=2)))
+
+        the_actor.can(PollTheAudience.streaming(buffer_size=1_000))
     """
 
-    def __init__(self):
-        self.poll_connection = pollster.connect_to_audience()
+    DEFAULT_BUFFER_SIZE = 256
+    DEFAULT_POLL_INTERVAL = 0.05
+    DEFAULT_CACHE_TTL = 1.0
+    WAIT_FOR_FIRST_PACKET = 5.0
+
+    @staticmethod
+    def cached(
+        ttl: float = DEFAULT_CACHE_TTL, pool: Optional[AudiencePool] = None
+    ) -> "PollTheAudience":
+        """Keep each poll's answer for ``ttl`` seconds."""
+        return PollTheAudience(cache_ttl=ttl, pool=pool)
+
+    @staticmethod
+    def streaming(
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        pool: Optional[AudiencePool] = None,
+    ) -> "PollTheAudience":
+        """Stream the audience's mood in the background."""
+        ability = PollTheAudience(pool=pool)
+        ability.mood_stream = MoodStream(
+            ability.poll_connection, buffer_size, poll_interval
+        )
+        ability.mood_stream.start()
+        return ability
+
+    def current_mood(self) -> Any:
+        """Get the audience's mood right now (or as of a moment ago)."""
+        if self.mood_stream is not None:
+            return self.mood_stream.latest(self.WAIT_FOR_FIRST_PACKET)
+
+        now = time.monotonic()
+        if self.cached_at is None or now - self.cached_at >= self.cache_ttl:
+            self.cached_mood = self.poll_connection.poll_mood()
+            self.cached_at = now
+        return self.cached_mood
+
+    def invalidate(self) -> None:
+        """Forget the cached poll answer."""
+        self.cached_mood = None
+        self.cached_at = None
+
+    def watching(self, campy_session: cam_py.RecordingSession) -> "PollTheAudience":
+        """Forget the cached poll answer whenever this session's shot changes."""
+        campy_session.watch(self.invalidate)
+        self.watched_sessions.append(campy_session)
+        return self
+
+    def mood_over_the_last(self, num_packets: int) -> MoodWindow:
+        """Sum up the audience's mood over the last several packets."""
+        if self.mood_stream is None:
+            raise UnableToAnswer("Only a streaming poll can look back over time.")
+        if num_packets < 1:
+            raise UnableToAnswer(
+                f"Can't sum up the mood over {num_packets} packets; ask for 1 or more."
+            )
+        packets = self.mood_stream.window(num_packets, self.WAIT_FOR_FIRST_PACKET)
+        moods = Counter(packet.top_mood for packet in packets)
+        saturation = sum(packet.saturation for packet in packets) / len(packets)
+        return MoodWindow(moods.most_common(1)[0][0], saturation, len(packets))
+
+    def mood_history(self) -> List[Any]:
+        """Every packet still in the stream's buffer, oldest first."""
+        if self.mood_stream is None:
+            raise UnableToAnswer("Only a streaming poll can look back over time.")
+        buffer_size = self.mood_stream.packets.maxlen or len(self.mood_stream.packets)
+        return self.mood_stream.window(buffer_size, self.WAIT_FOR_FIRST_PACKET)
+
+    @property
+    def stream_stats(self) -> Optional[StreamStats]:
+        """Backpressure and drop counts for the mood stream, if streaming."""
+        return None if self.mood_stream is None else self.mood_stream.stats
+
+    def __init__(
+        self,
+        cache_ttl: float = 0.0,
+        pool: Optional[AudiencePool] = None,
+    ):
+        if pool is None:
+            pool = audience_pool.the_audience_pool
+        self.pool = pool
+        self.poll_connection = pool.checkout()
+        self.mood_stream: Optional[MoodStream] = None
+        self.cache_ttl = cache_ttl
+        self.cached_mood: Any = None
+        self.cached_at: Optional[float] = None
+        self.watched_sessions: List[cam_py.RecordingSession] = []
 
     def forget(self):
-        self.poll_connection.close()
+        stopped = self.mood_stream is None or self.mood_stream.stop()
+        self.invalidate()
+        for campy_session in self.watched_sessions:
+            campy_session.unwatch(self.invalidate)
+        self.watched_sessions = []
+        if stopped:
+            self.pool.checkin(self.poll_connection)
+        else:
+            # the stream is still waiting on this connection; don't share it
+            self.pool.discard(self.poll_connection)
@@ -1,4 +1,6 @@
+from .asynchronously import attempts_to_async, perform_async
 from .dolly import Dolly
+from .in_one_take import InOneTake
 from .jump_to_camera import JumpToCamera
 from .pan import Pan
 from .simultaneously import Simultaneously
@@ -9,6 +11,7 @@ from .zoom import Zoom
 
 __all__ = [
     "Dolly",
+    "InOneTake",
     "JumpToCamera",
     "Pan",
     "Simultaneously",
@@ -16,4 +19,6 @@ __all__ = [
     "StartRecording",
     "StopRecording",
     "Zoom",
+    "attempts_to_async",
+    "perform_async",
 ]
@@ -0,0 +1,32 @@
+"""
+Perform Actions from inside an asyncio event loop.
+"""
+
+import asyncio
+
+from screenpy import Actor
+from screenpy.protocols import Performable
+
+
+async def perform_async(the_actor: Actor, action: Performable) -> None:
+    """Perform an Action without blocking the event loop.
+
+    Actions with a ``perform_as_async`` coroutine are awaited directly; any
+    others are performed on a worker thread.
+    """
+    perform_as_async = getattr(action, "perform_as_async", None)
+    if perform_as_async is None:
+        await asyncio.to_thread(the_actor.perform, action)
+    else:
+        await perform_as_async(the_actor)
+
+
+async def attempts_to_async(the_actor: Actor, *actions: Performable) -> None:
+    """Perform a list of Actions, one after another, on the event loop.
+
+    Examples::
+
+        await attempts_to_async(the_actor, Dolly().forward(), Zoom.in_())
+    """
+    for action in actions:
+        await perform_async(the_actor, action)
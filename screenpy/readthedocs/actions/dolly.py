@@ -2,12 +2,14 @@
 Dolly a camera in a direction.
 """
 
-from screenpy.exceptions import UnableToAct
+from typing import Optional
 
+import cam_py
 from screenpy import Actor
-from screenpy.pacing import beat
+from screenpy.exceptions import UnableToAct
 
 from ..abilities import ControlCameras
+from ..narration import beat
 
 
 class Dolly:
@@ -20,6 +22,8 @@ class Dolly:
         the_actor.attempts_to(Dolly().backwards())
 
         the_actor.attempts_to(Dolly().forward().right())
+
+        the_actor.attempts_to(Dolly().forward().on_camera(CameraGroup(*extras)))
     """
 
     def forward(self) -> "Dolly":
@@ -42,6 +46,11 @@ class Dolly:
         self.vector = (self.vector[0] + 1, self.vector[1])
         return self
 
+    def on_camera(self, camera: cam_py.AnyCamera) -> "Dolly":
+        """Dolly a specific camera (or group of cameras)."""
+        self.camera = camera
+        return self
+
     @property
     def description(self) -> str:
         direction = ""
@@ -60,16 +69,28 @@ class Dolly:
 
         return direction
 
-    @beat("{} dollies the active camera {description}.")
-    def perform_as(self, the_actor: Actor) -> None:
-        """Direct the actor to dolly their active camera."""
+    def _camera_to_move(self, the_actor: Actor) -> cam_py.AnyCamera:
+        """Make sure there's somewhere to go, and find the camera to move."""
         if self.vector == (0, 0):
             raise UnableToAct("No direction was given to Dolly!")
 
+        if self.camera is not None:
+            return self.camera
         campy_session = the_actor.ability_to(ControlCameras).campy_session
-        camera = campy_session.get_active_camera()
+        return campy_session.get_active_camera()
 
-        camera.dolly(*self.vector)
+    @beat("{} dollies the active camera {description}.")
+    def perform_as(self, the_actor: Actor) -> None:
+        """Direct the actor to dolly their active camera."""
+        self._camera_to_move(the_actor).dolly(*self.vector)
+
+    @beat("{} dollies the active camera {description}.")
+    async def perform_as_async(self, the_actor: Actor) -> None:
+        """Direct the actor to dolly their active camera, without blocking."""
+        camera = self._camera_to_move(the_actor)
+        campy_session = the_actor.ability_to(ControlCameras).campy_session
+        await campy_session.move_async(cam_py.MovementCommand(camera, *self.vector))
 
     def __init__(self) -> None:
         self.vector = (0, 0)
+        self.camera: Optional[cam_py.AnyCamera] = None
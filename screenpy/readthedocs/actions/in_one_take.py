@@ -0,0 +1,120 @@
+"""
+Perform a run of camera moves in one take, with one trip to each camera.
+"""
+
+from typing import Dict, List, Optional
+
+import cam_py
+from screenpy import Actor
+from screenpy.protocols import Performable
+
+from ..abilities import ControlCameras
+from ..narration import beat
+from .dolly import Dolly
+from .jump_to_camera import JumpToCamera
+from .pan import Pan
+from .zoom import Zoom
+
+
+class MovementPlan:
+    """Fold a run of camera moves into one net move per camera.
+
+    The plan follows JumpToCamera along the way, so moves on "the active
+    camera" land on whichever camera was active at that point in the run.
+    Moves that cancel each other out, even within a single Dolly (like
+    ``Dolly().left().right()``), are dropped entirely.
+    """
+
+    def __init__(self, campy_session: cam_py.RecordingSession) -> None:
+        self.campy_session = campy_session
+        self.active_camera = campy_session.active_camera
+        self.net_moves: Dict[cam_py.AnyCamera, List[float]] = {}
+
+    def _net_move_for(self, camera: Optional[cam_py.AnyCamera]) -> List[float]:
+        """Get the running [x, y, pan, zoom] total for a camera."""
+        if camera is None:
+            camera = self.active_camera
+        if camera is None:
+            raise cam_py.CamPyError("There is no active camera.")
+        if camera.session is not self.campy_session:
+            raise cam_py.CamPyError(f"The camera on {camera.character} is not on set.")
+        return self.net_moves.setdefault(camera, [0.0, 0.0, 0.0, 0.0])
+
+    def add(self, action: Performable) -> bool:
+        """Fold an action into the plan, if it is a camera move we can fold."""
+        if isinstance(action, Dolly):
+            if action.vector == (0, 0):
+                return True
+            net_move = self._net_move_for(action.camera)
+            net_move[0] += action.vector[0]
+            net_move[1] += action.vector[1]
+        elif isinstance(action, Pan):
+            self._net_move_for(action.camera)[2] += action.direction
+        elif isinstance(action, Zoom):
+            self._net_move_for(action.camera)[3] += action.direction
+        elif isinstance(action, JumpToCamera):
+            self._net_move_for(action.camera)
+            self.active_camera = action.camera
+        else:
+            return False
+        return True
+
+    @property
+    def commands(self) -> List[cam_py.MovementCommand]:
+        """One command for each camera that actually has to move."""
+        return [
+            cam_py.MovementCommand(camera, *net_move)
+            for camera, net_move in self.net_moves.items()
+            if any(net_move)
+        ]
+
+    def send(self) -> int:
+        """Send the plan to the rig. Returns how many commands were sent."""
+        commands = self.commands
+        self.campy_session.send(commands)
+        if self.active_camera is not self.campy_session.active_camera:
+            self.campy_session.set_active_camera(self.active_camera)
+        self.net_moves.clear()
+        return len(commands)
+
+
+class InOneTake:
+    """Perform a run of camera moves with a single command per camera.
+
+    Dolly, Pan, Zoom, and JumpToCamera are folded together into each
+    camera's net movement, which is sent to the rig all at once. Any other
+    action is performed normally, in order, between the folded moves.
+
+    Examples::
+
+        the_actor.attempts_to(
+            InOneTake(
+                Zoom.in_().on_camera(one),
+                JumpToCamera(two),
+                Pan.left(),
+            )
+        )
+    """
+
+    @beat("{} performs {num_actions} camera actions in one take.")
+    def perform_as(self, the_actor: Actor) -> None:
+        """Direct the actor to perform the camera moves as a single take."""
+        campy_session = the_actor.ability_to(ControlCameras).campy_session
+        plan = MovementPlan(campy_session)
+
+        self.commands_sent = 0
+        for action in self.actions:
+            if not plan.add(action):
+                self.commands_sent += plan.send()
+                the_actor.attempts_to(action)
+                plan = MovementPlan(campy_session)
+        self.commands_sent += plan.send()
+
+    @property
+    def num_actions(self) -> int:
+        """How many actions are in this take, for the logged beat."""
+        return len(self.actions)
+
+    def __init__(self, *actions: Performable) -> None:
+        self.actions = actions
+        self.commands_sent = 0
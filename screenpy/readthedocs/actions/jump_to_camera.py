@@ -4,9 +4,9 @@ Set the active camera.
 
 import cam_py
 from screenpy import Actor
-from screenpy.pacing import beat
 
 from ..abilities import ControlCameras
+from ..narration import beat
 
 
 class JumpToCamera:
@@ -17,11 +17,20 @@ class JumpToCamera:
         the_actor.attempts_to(JumpToCamera(two))
     """
 
+    def _cut(self, the_actor: Actor) -> None:
+        """Make our camera the active one."""
+        campy_session = the_actor.ability_to(ControlCameras).campy_session
+        campy_session.set_active_camera(self.camera)
+
     @beat("{} jumps to the camera on {character}!")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the actor to jump to another camera."""
-        campy_session = the_actor.ability_to(ControlCameras).campy_session
-        campy_session.set_active_camera(self.camera)
+        self._cut(the_actor)
+
+    @beat("{} jumps to the camera on {character}!")
+    async def perform_as_async(self, the_actor: Actor) -> None:
+        """Direct the actor to jump to another camera. Cutting is instant."""
+        self._cut(the_actor)
 
     def __init__(self, camera: cam_py.Camera) -> None:
         self.camera = camera
@@ -2,10 +2,13 @@
 Pan using the active camera.
 """
 
+from typing import Optional
+
+import cam_py
 from screenpy import Actor
-from screenpy.pacing import beat
 
 from ..abilities import ControlCameras
+from ..narration import beat
 
 
 class Pan:
@@ -16,6 +19,8 @@ class Pan:
         the_actor.attempts_to(Pan.left())
 
         the_actor.attempts_to(Pan.right())
+
+        the_actor.attempts_to(Pan.left().on_camera(CameraGroup(*extras)))
     """
 
     @staticmethod
@@ -28,14 +33,33 @@ class Pan:
         """Pan right!"""
         return Pan(1, "right")
 
+    def on_camera(self, camera: cam_py.AnyCamera) -> "Pan":
+        """Pan a specific camera (or group of cameras)."""
+        self.camera = camera
+        return self
+
+    def _camera_to_pan(self, the_actor: Actor) -> cam_py.AnyCamera:
+        """Find the camera to pan: the one we were given, or the active one."""
+        if self.camera is not None:
+            return self.camera
+        campy_session = the_actor.ability_to(ControlCameras).campy_session
+        return campy_session.get_active_camera()
+
     @beat("{} pans {description}.")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the actor to pan the active camera."""
-        campy_session = the_actor.ability_to(ControlCameras).campy_session
-        camera = campy_session.get_active_camera()
+        self._camera_to_pan(the_actor).pan(self.direction)
 
-        camera.pan(self.direction)
+    @beat("{} pans {description}.")
+    async def perform_as_async(self, the_actor: Actor) -> None:
+        """Direct the actor to pan the active camera, without blocking."""
+        camera = self._camera_to_pan(the_actor)
+        campy_session = the_actor.ability_to(ControlCameras).campy_session
+        await campy_session.move_async(
+            cam_py.MovementCommand(camera, pan=self.direction)
+        )
 
     def __init__(self, direction: int, description: str) -> None:
         self.direction = direction
         self.description = description
+        self.camera: Optional[cam_py.AnyCamera] = None
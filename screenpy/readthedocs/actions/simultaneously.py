@@ -2,16 +2,47 @@
 Perform one or more camera actions simultaneously.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import List, Tuple
+
 from screenpy import Actor
-from screenpy.pacing import beat
+from screenpy.exceptions import UnableToAct
 from screenpy.protocols import Performable
 
 from ..abilities import ControlCameras
+from ..constants import ASYNCIO, THREADS
+from ..narration import beat
+from .asynchronously import perform_async
+
+Failure = Tuple[Performable, BaseException]
+
+
+def event_loop_is_running() -> bool:
+    """Whether we were called from inside a running asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
 
 
 class Simultaneously:
     """Simultaneously perform many camera actions.
 
+    Each action is sent off to its own worker, either on a thread pool (the
+    default) or on an asyncio event loop. The Actor waits for all of them
+    (up to the timeout) and then reports every action that failed at once.
+
+    On an event loop, actions with a ``perform_as_async`` coroutine are
+    awaited directly. Awaiting ``perform_as_async`` on Simultaneously itself
+    runs them all on the caller's own event loop.
+
+    Python can't stop a thread partway through, so an action that runs past
+    the timeout is reported as failed but left to finish in the background.
+    It may still move its camera after ``perform_as`` has raised.
+
     Examples::
 
         the_actor.attempts_to(
@@ -21,15 +52,141 @@ class Simultaneously:
                 Zoom.out(),
             )
         )
+
+        the_actor.attempts_to(
+            Simultaneously(Dolly().backward(), Zoom.in_()).using_asyncio()
+        )
+
+        the_actor.attempts_to(
+            Simultaneously(Dolly().backward(), Zoom.in_()).within(2.5)
+        )
+
+        await Simultaneously(Dolly().backward(), Zoom.in_()).perform_as_async(
+            the_actor
+        )
     """
 
+    DEFAULT_TIMEOUT = 30.0
+
+    def using_threads(self) -> "Simultaneously":
+        """Run the actions on a thread pool."""
+        self.backend = THREADS
+        return self
+
+    def using_asyncio(self) -> "Simultaneously":
+        """Run the actions on an asyncio event loop."""
+        self.backend = ASYNCIO
+        return self
+
+    def within(self, seconds: float) -> "Simultaneously":
+        """Set how long to wait for all the actions to finish."""
+        self.timeout = seconds
+        return self
+
+    def _perform_on_threads(self, the_actor: Actor) -> List[Failure]:
+        """Perform each action on its own thread."""
+        executor = ThreadPoolExecutor(max_workers=len(self.actions))
+        try:
+            # each thread carries on in a copy of our context, so anything
+            # tracking what's in progress (like a Profiler) follows it there
+            futures = [
+                executor.submit(copy_context().run, the_actor.perform, action)
+                for action in self.actions
+            ]
+            wait(futures, timeout=self.timeout)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        failures: List[Failure] = []
+        for action, future in zip(self.actions, futures):
+            if not future.done():
+                failures.append((action, TimeoutError("it did not finish in time")))
+            elif future.exception() is not None:
+                failures.append((action, future.exception()))
+        return failures
+
+    async def _gather(self, the_actor: Actor) -> List[Failure]:
+        """Perform each action as its own task on the event loop."""
+        tasks = [
+            asyncio.create_task(perform_async(the_actor, action))
+            for action in self.actions
+        ]
+        await asyncio.wait(tasks, timeout=self.timeout)
+
+        failures: List[Failure] = []
+        for action, task in zip(self.actions, tasks):
+            if not task.done():
+                task.cancel()
+                failures.append((action, TimeoutError("it did not finish in time")))
+            elif task.exception() is not None:
+                failures.append((action, task.exception()))
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return failures
+
+    def _perform_on_event_loop(self, the_actor: Actor) -> List[Failure]:
+        """Perform each action on a fresh asyncio event loop.
+
+        The loop gets an executor of its own for the actions without a
+        ``perform_as_async``, which isn't waited for on the way out, so that
+        an action still running on it can't hold us past the timeout.
+        """
+        loop = asyncio.new_event_loop()
+        executor = ThreadPoolExecutor(max_workers=len(self.actions))
+        loop.set_default_executor(executor)
+        try:
+            return loop.run_until_complete(self._gather(the_actor))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            loop.close()
+
     @beat("{} performs some thrilling camerawork simultaneously!")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the actor to perform several actions at once."""
+        if not self.actions:
+            return
+
+        if self.backend == ASYNCIO and event_loop_is_running():
+            raise UnableToAct(
+                "Simultaneously can't start an event loop inside one that is"
+                " already running. Await its perform_as_async instead."
+            )
+
         campy_session = the_actor.ability_to(ControlCameras).campy_session
 
         with campy_session.simultaneous_movement:
-            the_actor.attempts_to(*self.actions)
+            if self.backend == ASYNCIO:
+                failures = self._perform_on_event_loop(the_actor)
+            else:
+                failures = self._perform_on_threads(the_actor)
+
+        self._report(failures)
+
+    @beat("{} performs some thrilling camerawork simultaneously!")
+    async def perform_as_async(self, the_actor: Actor) -> None:
+        """Direct the actor to perform several actions at once, on this loop."""
+        if not self.actions:
+            return
+
+        campy_session = the_actor.ability_to(ControlCameras).campy_session
+
+        with campy_session.simultaneous_movement:
+            failures = await self._gather(the_actor)
+
+        self._report(failures)
+
+    def _report(self, failures: List[Failure]) -> None:
+        """Raise one error describing every action that failed, if any did."""
+        if failures:
+            details = "\n".join(
+                f"    {action.__class__.__name__}: {error.__class__.__name__}: {error}"
+                for action, error in failures
+            )
+            raise UnableToAct(
+                f"{len(failures)} of {len(self.actions)} simultaneous actions"
+                f" failed:\n{details}"
+            )
 
     def __init__(self, *actions: Performable) -> None:
         self.actions = actions
+        self.backend = THREADS
+        self.timeout = self.DEFAULT_TIMEOUT
@@ -2,27 +2,48 @@
 Skip to a specific scene while recording.
 """
 
+import cam_py
 from screenpy import Actor
-from screenpy.pacing import beat
+from screenpy.exceptions import UnableToAct
 
 from ..abilities import ControlCameras
+from ..narration import beat
+from ..scripts import Screenplay
 
 
 class SkipToScene:
     """Skips to a numbered scene in a screenplay.
 
+    Each script on set is checked against its scene index, so skipping to a
+    scene a script doesn't have fails before any camera moves. Scripts with
+    no sluglines at all can't be checked, and are skipped along anyway.
+
     Examples::
 
         the_actor.attempts_to(SkipToScene(2))
     """
 
+    def _skip(self, campy_session: cam_py.RecordingSession) -> None:
+        """Check the scene against every script on set, then skip to it."""
+        for script in campy_session.scripts:
+            if not isinstance(script, Screenplay) or not script.num_scenes:
+                continue
+            if not script.has_scene(self.scene_num):
+                raise UnableToAct(
+                    f"{script.title} has no scene #{self.scene_num}; "
+                    f"it has {script.num_scenes} scenes."
+                )
+        campy_session.set_the_scene(self.scene_num)
+
     @beat("{} skips to scene #{scene_num}.")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the actor to skip to a specific scene."""
-        cameras = the_actor.ability_to(ControlCameras).cameras
+        self._skip(the_actor.ability_to(ControlCameras).campy_session)
 
-        for camera in cameras:
-            camera.set_the_scene(self.scene_num)
+    @beat("{} skips to scene #{scene_num}.")
+    async def perform_as_async(self, the_actor: Actor) -> None:
+        """Direct the actor to skip to a specific scene. Skipping is instant."""
+        self._skip(the_actor.ability_to(ControlCameras).campy_session)
 
     def __init__(self, scene_num: int) -> None:
         self.scene_num = scene_num
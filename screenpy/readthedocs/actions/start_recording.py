@@ -2,11 +2,14 @@
 Start recording a screenplay on one or more cameras!
 """
 
+from typing import Optional
+
 import cam_py
 from screenpy import Actor
-from screenpy.pacing import beat
 
 from ..abilities import ControlCameras
+from ..constants import DEFAULT_WORKERS
+from ..narration import beat
 
 
 class StartRecording:
@@ -22,15 +25,22 @@ class StartRecording:
         camera1 = Camera("Character1")
         camera2 = Camera("Character2")
         the_actor.attempts_to(StartRecording.on(camera1).and_(camera2))
+
+        the_actor.attempts_to(StartRecording.on(*extras).in_parallel(workers=8))
     """
 
-    def on(self, camera: cam_py.Camera) -> "StartRecording":
-        """Record on an already-created camera."""
-        self.cameras.append(camera)
+    def on(self, *cameras: cam_py.Camera) -> "StartRecording":
+        """Record on already-created cameras."""
+        self.cameras.extend(cameras)
         return self
 
     and_ = on
 
+    def in_parallel(self, workers: int = DEFAULT_WORKERS) -> "StartRecording":
+        """Start the cameras in shards, on several workers at once."""
+        self.workers = workers
+        return self
+
     @beat("{} starts recording on {cameras_to_log}.")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the actor to start recording on their cameras."""
@@ -38,9 +48,9 @@ class StartRecording:
             self.cameras = [cam_py.Camera("Main")]
 
         campy_session = the_actor.ability_to(ControlCameras).campy_session
-        for camera in self.cameras:
-            camera.record(self.script)
-            campy_session.add_camera(camera)
+        self.report = campy_session.start_recording(
+            self.cameras, self.script, workers=self.workers
+        )
 
     @property
     def cameras_to_log(self) -> str:
@@ -50,3 +60,5 @@ class StartRecording:
     def __init__(self, script: str) -> None:
         self.script = script
         self.cameras = []
+        self.workers = 1
+        self.report: Optional[cam_py.RecordingReport] = None
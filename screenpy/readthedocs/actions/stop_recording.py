@@ -2,10 +2,14 @@
 That's a wrap! Stop recording on all cameras.
 """
 
+from typing import Optional
+
+import cam_py
 from screenpy import Actor
-from screenpy.pacing import beat
 
 from ..abilities import ControlCameras
+from ..constants import DEFAULT_WORKERS
+from ..narration import beat
 
 
 class StopRecording:
@@ -14,11 +18,21 @@ class StopRecording:
     Examples::
 
         the_actor.attempts_to(StopRecording())
+
+        the_actor.attempts_to(StopRecording().in_parallel(workers=8))
     """
 
+    def in_parallel(self, workers: int = DEFAULT_WORKERS) -> "StopRecording":
+        """Stop the cameras in shards, on several workers at once."""
+        self.workers = workers
+        return self
+
     @beat("{} stops recording.")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the actor to stop recording on all cameras."""
         campy_session = the_actor.ability_to(ControlCameras).campy_session
-        for camera in campy_session.cameras:
-            camera.thats_a_wrap()
+        self.report = campy_session.stop_recording(workers=self.workers)
+
+    def __init__(self) -> None:
+        self.workers = 1
+        self.report: Optional[cam_py.RecordingReport] = None
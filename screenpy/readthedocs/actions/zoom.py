@@ -2,11 +2,13 @@
 Zoom in/out on the active camera.
 """
 
+from typing import Optional
+
 import cam_py
 from screenpy import Actor
-from screenpy.pacing import beat
 
 from ..abilities import ControlCameras
+from ..narration import beat
 
 
 class Zoom:
@@ -19,6 +21,8 @@ class Zoom:
         the_actor.attempts_to(Zoom.in_())
 
         the_actor.attempts_to(Zoom.in_().on("Norman Bates"))
+
+        the_actor.attempts_to(Zoom.out().on_camera(CameraGroup(*extras)))
     """
 
     @staticmethod
@@ -31,21 +35,33 @@ class Zoom:
         """Zoom in!"""
         return Zoom(1, "in")
 
-    def on_camera(self, camera: cam_py.Camera) -> "Zoom":
-        """Zoom in on a specific camera (camera)."""
+    def on_camera(self, camera: cam_py.AnyCamera) -> "Zoom":
+        """Zoom in on a specific camera (or group of cameras)."""
         self.camera = camera
         return self
 
+    def _camera_to_zoom(self, the_actor: Actor) -> cam_py.AnyCamera:
+        """Find the camera to zoom: the one we were given, or the active one."""
+        if self.camera is not None:
+            return self.camera
+        campy_session = the_actor.ability_to(ControlCameras).campy_session
+        return campy_session.get_active_camera()
+
     @beat("{} zooms {description}.")
     def perform_as(self, the_actor: Actor) -> None:
-        """Direct the actor to pan the active camera."""
-        campy_session = the_actor.ability_to(ControlCameras).campy_session
-        if self.camera is None:
-            self.camera = campy_session.get_active_camera()
+        """Direct the actor to zoom the active camera."""
+        self._camera_to_zoom(the_actor).zoom(self.direction)
 
-        self.camera.zoom(self.direction)
+    @beat("{} zooms {description}.")
+    async def perform_as_async(self, the_actor: Actor) -> None:
+        """Direct the actor to zoom the active camera, without blocking."""
+        camera = self._camera_to_zoom(the_actor)
+        campy_session = the_actor.ability_to(ControlCameras).campy_session
+        await campy_session.move_async(
+            cam_py.MovementCommand(camera, zoom=self.direction)
+        )
 
     def __init__(self, direction: int, description: str) -> None:
         self.direction = direction
         self.description = description
-        self.camera = None
+        self.camera: Optional[cam_py.AnyCamera] = None
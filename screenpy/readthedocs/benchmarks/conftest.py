@@ -0,0 +1,27 @@
+"""
+Setup for our benchmarks.
+"""
+
+import pytest
+from screenpy import AnActor
+
+from cam_py import Camera, RecordingSession
+
+from ..actions import StartRecording
+from ..scripts import GOOD_WILL_HUNTING
+
+
+@pytest.fixture
+def Cameron(Cameron: AnActor) -> AnActor:
+    """Cameron, with a camera already rolling."""
+    Cameron.attempts_to(StartRecording(GOOD_WILL_HUNTING).on(Camera("Will")))
+    return Cameron
+
+
+@pytest.fixture
+def crowded_set(num_cameras: int) -> RecordingSession:
+    """A set with a camera on every extra in the scene."""
+    session = RecordingSession()
+    for num in range(num_cameras):
+        session.add_camera(Camera(f"Extra #{num}"))
+    return session
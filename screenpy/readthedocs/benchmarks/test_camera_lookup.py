@@ -0,0 +1,54 @@
+"""
+Benchmark finding cameras on a crowded set.
+"""
+
+from typing import Callable
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from cam_py import Camera, RecordingSession
+
+
+def linear_lookup(session: RecordingSession) -> Callable[[str], Camera]:
+    """Find the camera the way we used to: check every camera on set."""
+
+    def get_camera_on_character(character: str) -> Camera:
+        return next(c for c in session.cameras if c.character == character)
+
+    return get_camera_on_character
+
+
+@pytest.mark.parametrize("num_cameras", [10, 100, 10_000])
+@pytest.mark.parametrize("lookup", ["indexed", "linear"])
+def test_get_camera_on_character(
+    lookup: str,
+    num_cameras: int,
+    crowded_set: RecordingSession,
+    benchmark: BenchmarkFixture,
+) -> None:
+    """The character index beats scanning the set, and the gap grows."""
+    session = crowded_set
+    last_extra = f"Extra #{num_cameras - 1}"
+    if lookup == "indexed":
+        get_camera_on_character = session.get_camera_on_character
+    else:
+        get_camera_on_character = linear_lookup(session)
+
+    benchmark.group = f"get_camera_on_character, {num_cameras} cameras"
+    camera = benchmark(get_camera_on_character, last_extra)
+
+    assert camera is session.cameras[-1]
+
+
+@pytest.mark.parametrize("num_cameras", [10, 100, 10_000])
+def test_set_active_camera(
+    num_cameras: int, crowded_set: RecordingSession, benchmark: BenchmarkFixture
+) -> None:
+    """Jumping between cameras costs the same no matter how many there are."""
+    session = crowded_set
+
+    benchmark.group = "set_active_camera"
+    benchmark(session.set_active_camera, session.cameras[-1])
+
+    assert session.get_active_camera() is session.cameras[-1]
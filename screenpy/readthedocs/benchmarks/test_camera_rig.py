@@ -0,0 +1,34 @@
+"""
+Benchmark moving a whole rig of cameras at once.
+"""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from cam_py import CameraGroup, RecordingSession
+
+
+@pytest.mark.parametrize("num_cameras", [10, 1_000, 10_000])
+@pytest.mark.parametrize("move", ["camera by camera", "camera group"])
+def test_dolly_the_rig(
+    move: str,
+    num_cameras: int,
+    crowded_set: RecordingSession,
+    benchmark: BenchmarkFixture,
+) -> None:
+    """Dollying a camera group is one update, however big the group gets."""
+    session = crowded_set
+    extras = CameraGroup(*session.cameras)
+
+    def dolly_camera_by_camera() -> None:
+        for camera in session.cameras:
+            camera.dolly(0, 1)
+
+    benchmark.group = f"dolly {num_cameras} cameras"
+    if move == "camera group":
+        benchmark(extras.dolly, 0, 1)
+    else:
+        benchmark(dolly_camera_by_camera)
+
+    assert (extras.positions[:, 1] == extras.positions[0, 1]).all()
+    assert extras.positions[0, 1] > 0
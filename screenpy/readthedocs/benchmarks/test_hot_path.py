@@ -0,0 +1,97 @@
+"""
+Benchmark the parts of the Screenplay Pattern every test goes through.
+
+Everything here is real: real cameras, and a stand-in audience rather than
+a mock one, so the numbers are ScreenPy's (and ours), not MagicMock's.
+"""
+
+from typing import Any, Dict, Generator, List, Tuple
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from screenpy import AnActor, Actor
+from screenpy.actions import See
+from screenpy.resolutions import Equals
+
+from cam_py import Camera
+from pollster import StandInAudience
+
+from ..abilities import ControlCameras, PollTheAudience
+from ..abilities.audience_pool import AudiencePool
+from ..actions import Pan, StartRecording
+from ..constants import TENSE
+from ..questions import TopAudienceReaction
+from ..scripts import GOOD_WILL_HUNTING
+
+
+@pytest.fixture
+def stand_in_pool() -> Generator:
+    """A pool of connections to an audience that's always tense."""
+    pool = AudiencePool(connect=StandInAudience)
+    yield pool
+    pool.close()
+
+
+@pytest.mark.parametrize("ability", ["ControlCameras", "PollTheAudience"])
+def test_actor_creation(
+    ability: str, stand_in_pool: AudiencePool, benchmark: BenchmarkFixture
+) -> None:
+    """Casting an Actor costs little, and opens nothing it doesn't need."""
+    cast: List[Actor] = []
+
+    def cast_an_actor() -> None:
+        if ability == "ControlCameras":
+            cast.append(AnActor.named("Cameron").who_can(ControlCameras()))
+        else:
+            cast.append(
+                AnActor.named("Polly").who_can(PollTheAudience(pool=stand_in_pool))
+            )
+
+    benchmark.group = "actor creation"
+    benchmark(cast_an_actor)
+
+    for the_actor in cast:
+        the_actor.exit()
+
+
+@pytest.mark.parametrize("num_actions", [1, 10, 1_000])
+def test_attempts_to(
+    num_actions: int, Cameron: AnActor, benchmark: BenchmarkFixture
+) -> None:
+    """Dispatch costs the same for every Action, however many there are."""
+    actions = [Pan.left() for _ in range(num_actions)]
+
+    benchmark.group = f"attempts_to with {num_actions} actions"
+    benchmark(Cameron.attempts_to, *actions)
+
+
+@pytest.mark.parametrize("cache_ttl", [0, PollTheAudience.DEFAULT_CACHE_TTL])
+def test_see_the(
+    cache_ttl: float, stand_in_pool: AudiencePool, benchmark: BenchmarkFixture
+) -> None:
+    """Asking a Question and resolving the answer, polling or from the cache."""
+    Polly = AnActor.named("Polly").who_can(
+        PollTheAudience(cache_ttl=cache_ttl, pool=stand_in_pool)
+    )
+    question = See.the(TopAudienceReaction(), Equals(TENSE))
+
+    benchmark.group = "See.the"
+    benchmark(Polly.should, question)
+    Polly.exit()
+
+
+def test_teardown(stand_in_pool: AudiencePool, benchmark: BenchmarkFixture) -> None:
+    """Exiting an Actor forgets every Ability: cameras wrap, connections return."""
+
+    def cast_for_a_scene() -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        the_actor = AnActor.named("Cameron").who_can(
+            ControlCameras(), PollTheAudience(pool=stand_in_pool)
+        )
+        extras = [Camera(f"Extra #{num}") for num in range(10)]
+        the_actor.attempts_to(StartRecording(GOOD_WILL_HUNTING).on(*extras))
+        return (the_actor,), {}
+
+    benchmark.group = "teardown"
+    benchmark.pedantic(Actor.exit, setup=cast_for_a_scene, rounds=200)
+
+    assert stand_in_pool.stats.checked_out == 0
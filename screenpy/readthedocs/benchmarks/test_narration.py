@@ -0,0 +1,26 @@
+"""
+Benchmark how much narrating a beat adds to each Action.
+"""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from screenpy import AnActor
+
+from ..actions import Dolly
+from ..constants import DEFERRED, NARRATED, SILENT
+from ..narration import set_narration_mode
+
+
+@pytest.mark.parametrize("mode", [NARRATED, SILENT, DEFERRED])
+def test_dolly_narration(
+    mode: str, Cameron: AnActor, benchmark: BenchmarkFixture
+) -> None:
+    """Deferred narration costs about as little as no narration at all."""
+    dolly = Dolly().forward().right()
+    previous_mode = set_narration_mode(mode)
+
+    benchmark.group = "dolly, narrated or not"
+    try:
+        benchmark(dolly.perform_as, Cameron)
+    finally:
+        set_narration_mode(previous_mode)
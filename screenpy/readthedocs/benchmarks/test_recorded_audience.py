@@ -0,0 +1,93 @@
+"""
+Load-test polling the audience against millions of recorded mood packets.
+"""
+
+import itertools
+from pathlib import Path
+from typing import Generator
+
+import numpy as np
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from screenpy import AnActor
+
+from pollster import PACKET_DTYPE, MoodRecording, ReplayedAudience
+
+from ..abilities import PollTheAudience
+from ..abilities.audience_pool import AudiencePool
+from ..questions import AudienceTension, TopAudienceReaction
+from ..resolutions.matchers.has_saturations_greater_than import stays_palpable
+
+NUM_PACKETS = 2_000_000
+
+
+@pytest.fixture(scope="module")
+def premiere(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A recording of a long, tense premiere."""
+    rng = np.random.default_rng(seed=35)
+    packets = np.zeros(NUM_PACKETS, PACKET_DTYPE)
+    packets["saturation"] = rng.uniform(86, 100, NUM_PACKETS)
+    path = tmp_path_factory.mktemp("recordings") / "premiere.npy"
+    MoodRecording(packets).save(path)
+    return path
+
+
+@pytest.fixture
+def replayed_pool(premiere: Path) -> Generator:
+    """Connections to the recorded premiere, each starting somewhere new."""
+    recording = MoodRecording.load(premiere)
+    starts = itertools.cycle(range(0, NUM_PACKETS, NUM_PACKETS // 16))
+    pool = AudiencePool(
+        connect=lambda: ReplayedAudience(recording, loop=True).seek(next(starts))
+    )
+    yield pool
+    pool.close()
+
+
+def test_open_a_recording(premiere: Path, benchmark: BenchmarkFixture) -> None:
+    """Opening a recording maps it, however many packets it has."""
+    benchmark.group = "recorded audience"
+    recording = benchmark(MoodRecording.load, premiere)
+    assert len(recording) == NUM_PACKETS
+
+
+def test_poll_a_replayed_audience(
+    replayed_pool: AudiencePool, benchmark: BenchmarkFixture
+) -> None:
+    """Polling with no cache gets a new recorded packet every time."""
+    Polly = AnActor.named("Polly").who_can(PollTheAudience(pool=replayed_pool))
+    question = TopAudienceReaction()
+
+    benchmark.group = "recorded audience"
+    benchmark(question.answered_by, Polly)
+    Polly.exit()
+
+
+@pytest.mark.parametrize("window", [8, 256])
+def test_stream_a_replayed_audience(
+    window: int, replayed_pool: AudiencePool, benchmark: BenchmarkFixture
+) -> None:
+    """A streaming poll keeps up with the recording, and answers from its buffer."""
+    Polly = AnActor.named("Polly").who_can(
+        PollTheAudience.streaming(
+            buffer_size=window, poll_interval=0.0, pool=replayed_pool
+        )
+    )
+    question = AudienceTension.over_the_last(window)
+
+    benchmark.group = "recorded audience"
+    benchmark(question.answered_by, Polly)
+
+    assert Polly.ability_to(PollTheAudience).stream_stats.received > window
+    Polly.exit()
+
+
+def test_whole_premiere_stays_palpable(
+    premiere: Path, benchmark: BenchmarkFixture
+) -> None:
+    """Every recorded packet can be checked at once, straight off the disk."""
+    recording = MoodRecording.load(premiere)
+    matcher = stays_palpable()
+
+    benchmark.group = "recorded audience"
+    assert benchmark(matcher.matches, recording.packets)
@@ -0,0 +1,38 @@
+"""
+Benchmark starting a big shoot's cameras on a rig with real latency.
+"""
+
+from typing import Any, Dict, Tuple
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from screenpy import AnActor
+
+from cam_py import Camera, RecordingSession
+
+from ..abilities import ControlCameras
+from ..actions import StartRecording
+from ..scripts import SHAUN_OF_THE_DEAD
+
+LATENCY = 0.002
+NUM_CAMERAS = 200
+
+
+@pytest.mark.parametrize("workers", [1, 2, 4, 8])
+def test_start_recording(workers: int, benchmark: BenchmarkFixture) -> None:
+    """Setting up every camera takes less time with every worker added."""
+
+    def new_shoot() -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        the_actor = AnActor.named("Cameron").who_can(
+            ControlCameras.using(RecordingSession(latency=LATENCY))
+        )
+        extras = [Camera(f"Zombie #{num}") for num in range(NUM_CAMERAS)]
+        start_recording = StartRecording(SHAUN_OF_THE_DEAD).on(*extras)
+        return (the_actor, start_recording.in_parallel(workers)), {}
+
+    def start(the_actor: AnActor, start_recording: StartRecording) -> None:
+        the_actor.attempts_to(start_recording)
+        assert start_recording.report.recording == NUM_CAMERAS
+
+    benchmark.group = f"start recording {NUM_CAMERAS} cameras"
+    benchmark.pedantic(start, setup=new_shoot, rounds=5)
@@ -0,0 +1,33 @@
+"""
+Benchmark checking a whole session's worth of mood packets.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from ..resolutions.matchers.has_saturation_greater_than import is_palpable
+from ..resolutions.matchers.has_saturations_greater_than import stays_palpable
+
+NUM_PACKETS = 100_000
+
+
+@pytest.mark.parametrize("check", ["packet by packet", "bulk packets", "bulk array"])
+def test_tension_stays_palpable(check: str, benchmark: BenchmarkFixture) -> None:
+    """One vectorized pass beats one hamcrest call per packet."""
+    saturations = np.random.default_rng(1138).integers(85, 100, NUM_PACKETS)
+    packets = [SimpleNamespace(saturation=int(s)) for s in saturations]
+    matcher = is_palpable()
+    bulk_matcher = stays_palpable()
+
+    benchmark.group = f"palpable tension over {NUM_PACKETS} packets"
+    if check == "packet by packet":
+        result = benchmark(lambda: all(matcher.matches(p) for p in packets))
+    elif check == "bulk packets":
+        result = benchmark(bulk_matcher.matches, packets)
+    else:
+        result = benchmark(bulk_matcher.matches, saturations)
+
+    assert result
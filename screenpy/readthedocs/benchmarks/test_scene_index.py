@@ -0,0 +1,27 @@
+"""
+Benchmark finding a scene in a feature-length screenplay.
+"""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from ..scripts import GOOD_WILL_HUNTING
+from ..scripts.screenplay import find_scenes
+
+
+@pytest.mark.parametrize("lookup", ["scan the script", "scene index"])
+def test_find_the_last_scene(lookup: str, benchmark: BenchmarkFixture) -> None:
+    """The index finds a scene without reading the script at all."""
+    script = GOOD_WILL_HUNTING
+    last_scene = script.num_scenes
+
+    def scan_the_script() -> int:
+        return int(find_scenes(script.path.read_bytes())[last_scene - 1])
+
+    benchmark.group = "find the last scene"
+    if lookup == "scene index":
+        offset = benchmark(script.scene_offset, last_scene)
+    else:
+        offset = benchmark(scan_the_script)
+
+    assert offset == script.scene_offset(last_scene)
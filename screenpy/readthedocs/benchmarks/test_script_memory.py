@@ -0,0 +1,70 @@
+"""
+Benchmark how much memory a shoot spends holding its script.
+"""
+
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from ..scripts import GOOD_WILL_HUNTING, Screenplay
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover
+    psutil = None
+
+
+def memory_spent(load: Callable[[], List]) -> Dict[str, int]:
+    """How much memory loading the scripts costs, while they're held.
+
+    ``python_heap_bytes`` is tracemalloc's peak, which can't see pages of a
+    memory-mapped file. ``unique_resident_bytes`` is how much the process's
+    USS grew, which can (only measured if psutil is installed).
+    """
+    process = psutil.Process() if psutil is not None else None
+    uss_before = process.memory_full_info().uss if process is not None else 0
+    tracemalloc.start()
+    try:
+        scripts = load()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    spent = {"python_heap_bytes": peak}
+    if process is not None:
+        spent["unique_resident_bytes"] = process.memory_full_info().uss - uss_before
+    del scripts
+    return spent
+
+
+@pytest.fixture(params=[1, 2], ids=lambda copies: f"{copies}x script")
+def long_script(request: pytest.FixtureRequest, tmp_path: Path) -> Path:
+    """A screenplay that's some multiple of Good Will Hunting's length."""
+    path = tmp_path / "long_script.txt"
+    path.write_bytes(GOOD_WILL_HUNTING.path.read_bytes() * request.param)
+    return path
+
+
+@pytest.mark.parametrize("num_cameras", [10, 50])
+@pytest.mark.parametrize("storage", ["copy per camera", "shared mmap"])
+def test_script_memory(
+    storage: str, num_cameras: int, long_script: Path, benchmark: BenchmarkFixture
+) -> None:
+    """A shared mapping costs the same however many cameras are recording."""
+    script = Screenplay.from_file(long_script)
+
+    def copy_per_camera() -> List:
+        return [long_script.read_bytes() for _ in range(num_cameras)]
+
+    def shared_mmap() -> List:
+        return [script.scene_view(1) for _ in range(num_cameras)]
+
+    load = shared_mmap if storage == "shared mmap" else copy_per_camera
+    benchmark.group = f"script memory, {long_script.stat().st_size:,} bytes"
+    benchmark.group += f", {num_cameras} cameras"
+    benchmark.extra_info.update(memory_spent(load))
+    benchmark.pedantic(load, rounds=3)
+
+    script.close()
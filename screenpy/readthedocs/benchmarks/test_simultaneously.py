@@ -0,0 +1,98 @@
+"""
+Benchmark simultaneous camerawork on a rig with real latency.
+"""
+
+import asyncio
+from typing import Callable
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from screenpy import AnActor
+
+from cam_py import AsyncRecordingSession, Camera, RecordingSession
+
+from ..abilities import ControlCameras
+from ..actions import (
+    Dolly,
+    Simultaneously,
+    StartRecording,
+    StopRecording,
+    Zoom,
+    attempts_to_async,
+    perform_async,
+)
+from ..constants import ASYNCIO, THREADS
+from ..scripts import GOOD_WILL_HUNTING
+from ..tasks import DollyZoom
+
+LATENCY = 0.05
+NUM_EXTRAS = 100
+
+
+def camerawork(style: str, the_actor: AnActor) -> Callable[[], None]:
+    """Dolly back and zoom in, in one of a few styles."""
+    if style == "one after another":
+        return lambda: the_actor.attempts_to(Dolly().backward(), Zoom.in_())
+    if style == ASYNCIO:
+        shot = Simultaneously(Dolly().backward(), Zoom.in_()).using_asyncio()
+        return lambda: the_actor.attempts_to(shot)
+    return lambda: the_actor.attempts_to(DollyZoom())
+
+
+@pytest.mark.parametrize("style", ["one after another", THREADS, ASYNCIO])
+def test_dolly_zoom_on_a_slow_rig(style: str, benchmark: BenchmarkFixture) -> None:
+    """A simultaneous dolly zoom takes as long as one move, not both."""
+    Cameron = AnActor.named("Cameron").who_can(
+        ControlCameras.using(RecordingSession(latency=LATENCY))
+    )
+    Cameron.attempts_to(StartRecording(GOOD_WILL_HUNTING).on(Camera("Will")))
+
+    benchmark.group = f"dolly zoom, {LATENCY}s rig latency"
+    benchmark.pedantic(camerawork(style, Cameron), rounds=5)
+    Cameron.exit()
+
+
+@pytest.mark.parametrize("session", ["threads", "event loop"])
+def test_many_cameras_on_a_slow_rig(session: str, benchmark: BenchmarkFixture) -> None:
+    """One event loop can keep a whole rig moving, without a thread apiece."""
+    if session == "event loop":
+        rig = AsyncRecordingSession(latency=LATENCY)
+    else:
+        rig = RecordingSession(latency=LATENCY)
+    Cameron = AnActor.named("Cameron").who_can(ControlCameras.using(rig))
+    extras = [Camera(f"Extra #{num}") for num in range(NUM_EXTRAS)]
+    Cameron.attempts_to(
+        StartRecording(GOOD_WILL_HUNTING).on(*extras).in_parallel(NUM_EXTRAS)
+    )
+    shot = Simultaneously(*(Dolly().forward().on_camera(extra) for extra in extras))
+
+    def camerawork() -> None:
+        if session == "event loop":
+            asyncio.run(perform_async(Cameron, shot))
+        else:
+            Cameron.attempts_to(shot)
+
+    benchmark.group = f"dolly {NUM_EXTRAS} cameras, {LATENCY}s rig latency"
+    benchmark.pedantic(camerawork, rounds=5)
+
+    Cameron.attempts_to(StopRecording().in_parallel(NUM_EXTRAS))
+    Cameron.exit()
+
+
+def test_a_dolly_zoom_on_an_event_loop(benchmark: BenchmarkFixture) -> None:
+    """Moves awaited on an asynchronous rig all wait for the rig together."""
+    Cameron = AnActor.named("Cameron").who_can(
+        ControlCameras.asynchronously(latency=LATENCY)
+    )
+    extras = [Camera(f"Extra #{num}") for num in range(20)]
+    Cameron.attempts_to(StartRecording(GOOD_WILL_HUNTING).on(*extras).in_parallel(20))
+    shot = Simultaneously(*(Dolly().forward().on_camera(extra) for extra in extras))
+
+    def camerawork() -> None:
+        asyncio.run(attempts_to_async(Cameron, shot, DollyZoom()))
+
+    benchmark.group = f"dolly zoom, {LATENCY}s rig latency"
+    benchmark.pedantic(camerawork, rounds=5)
+
+    Cameron.attempts_to(StopRecording().in_parallel(20))
+    Cameron.exit()
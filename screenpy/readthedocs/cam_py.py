@@ -1,14 +1,626 @@
 """
-Our camera-controlling mock-library for the example!
+Our camera-controlling library for the example!
 
-This library *purportedly* allows you to control cameras. But it's a mock.
+This library *purportedly* allows you to control cameras. There's no real rig
+behind it, but it does keep track of where every camera is pointed, so the
+Actions in this example have something real (and cheap!) to talk to.
 """
 
-from unittest import mock
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
+import numpy as np
 
-def Camera(character: str) -> mock.MagicMock:
-    return mock.MagicMock(character=character)
+# Cameras share this many locks, so a crowded set doesn't need one per camera.
+LOCK_STRIPES = 16
 
+# How many cameras a new session has room for before its arrays must grow.
+INITIAL_CAPACITY = 8
+CAMERA_ARRAYS = ("positions", "pan_angles", "zoom_levels", "recording", "scenes")
 
-RecordingSession = mock.MagicMock()
+
+class CamPyError(Exception):
+    """Something went wrong on set."""
+
+
+class Camera:
+    """A camera, pointed at a character.
+
+    A Camera doesn't hold its own position, zoom, or scene; that state lives
+    in the arrays of the RecordingSession it has been added to. The Camera
+    only remembers where its row in those arrays is.
+
+    Examples::
+
+        camera = Camera("Dorothy")
+    """
+
+    __slots__ = ("_character", "script", "session", "index")
+
+    def __init__(self, character: str) -> None:
+        self._character = character
+        self.script: Any = None
+        self.session: Optional["RecordingSession"] = None
+        self.index = -1
+
+    @property
+    def character(self) -> str:
+        """The character this camera is pointed at."""
+        return self._character
+
+    @character.setter
+    def character(self, character: str) -> None:
+        if self.session is not None:
+            self.session.recast(self, character)
+        self._character = character
+
+    def _attached_session(self) -> "RecordingSession":
+        """Get the session this camera belongs to, or complain."""
+        if self.session is None:
+            raise CamPyError(f"The camera on {self.character} is not on set.")
+        return self.session
+
+    def record(self, script: Any) -> None:
+        """Start recording the given script."""
+        self.script = script
+        if self.session is not None:
+            self.session.recording[self.index] = True
+
+    def dolly(self, x: int, y: int) -> None:
+        """Move the camera along the floor."""
+        session = self._attached_session()
+        session.wait_for_the_rig()
+        with session.lock_for(self):
+            session.positions[self.index, 0] += x
+            session.positions[self.index, 1] += y
+        session.shot_changed()
+
+    def pan(self, direction: int) -> None:
+        """Swivel the camera left (negative) or right (positive)."""
+        session = self._attached_session()
+        session.wait_for_the_rig()
+        with session.lock_for(self):
+            session.pan_angles[self.index] += direction
+        session.shot_changed()
+
+    def zoom(self, direction: int) -> None:
+        """Zoom the camera out (negative) or in (positive)."""
+        session = self._attached_session()
+        session.wait_for_the_rig()
+        with session.lock_for(self):
+            session.zoom_levels[self.index] += direction
+        session.shot_changed()
+
+    def set_the_scene(self, scene_num: int) -> None:
+        """Skip to a scene in the script."""
+        session = self._attached_session()
+        session.wait_for_the_rig()
+        with session.lock_for(self):
+            session.scenes[self.index] = scene_num
+        session.shot_changed()
+
+    def thats_a_wrap(self) -> None:
+        """Stop recording."""
+        if self.session is not None:
+            self.session.recording[self.index] = False
+            self.session.shot_changed()
+
+    stop = thats_a_wrap
+
+    @property
+    def position(self) -> Tuple[float, float]:
+        """Where the camera is on the floor."""
+        x, y = self._attached_session().positions[self.index].tolist()
+        return (x, y)
+
+    @property
+    def pan_angle(self) -> float:
+        """How far the camera has swiveled."""
+        return float(self._attached_session().pan_angles[self.index])
+
+    @property
+    def zoom_level(self) -> float:
+        """How far the camera has zoomed."""
+        return float(self._attached_session().zoom_levels[self.index])
+
+    @property
+    def scene(self) -> int:
+        """Which scene the camera is on."""
+        return int(self._attached_session().scenes[self.index])
+
+    @property
+    def pages(self) -> Any:
+        """The part of the script this camera is on, shared with the others.
+
+        A script that can hand out its scenes (like a memory-mapped
+        Screenplay) gives a view of just this camera's scene. Any other kind
+        of script, or a scene the script doesn't mark out (it may have no
+        sluglines at all), is given back whole.
+        """
+        if (
+            self.scene
+            and hasattr(self.script, "scene_view")
+            and self.script.has_scene(self.scene)
+        ):
+            return self.script.scene_view(self.scene)
+        return getattr(self.script, "contents", self.script)
+
+    @property
+    def is_recording(self) -> bool:
+        """Whether the camera is rolling."""
+        return self.session is not None and bool(
+            self.session.recording[self.index]
+        )
+
+    def __repr__(self) -> str:
+        return f"Camera({self.character!r})"
+
+
+class CameraGroup:
+    """A group of cameras on the same set, moved together like one camera.
+
+    Moving a group is a single vectorized update to the session's arrays,
+    however many cameras are in it. A CameraGroup can be given to anything
+    that takes a Camera to move, like ``Dolly().on_camera(...)``.
+
+    Examples::
+
+        extras = CameraGroup(*session.cameras)
+        extras.dolly(0, 1)
+    """
+
+    def __init__(self, *cameras: Camera) -> None:
+        if not cameras:
+            raise CamPyError("A camera group needs at least one camera.")
+        session = cameras[0].session
+        if session is None or any(c.session is not session for c in cameras):
+            raise CamPyError("Every camera in a group must be on the same set.")
+
+        self.cameras = cameras
+        self.session: RecordingSession = session
+        self.character = ", ".join(camera.character for camera in cameras)
+        self._find_rows()
+
+    def _find_rows(self) -> None:
+        """Note down which rows of the session's arrays are the group's."""
+        self._take = self.session.take
+        self._index = np.unique(
+            np.fromiter((c.index for c in self.cameras), np.intp)
+        )
+        self._stripes = sorted(set((self._index % LOCK_STRIPES).tolist()))
+
+    def _attached_session(self) -> "RecordingSession":
+        """Get the session this group belongs to, or complain.
+
+        If the session wrapped and every camera has been added back to it
+        since, they're in new rows, so the group finds them again.
+        """
+        if self._take != self.session.take:
+            if any(camera.session is not self.session for camera in self.cameras):
+                raise CamPyError("This camera group's session has wrapped.")
+            self._find_rows()
+        return self.session
+
+    @property
+    def index(self) -> np.ndarray:
+        """The group's rows in the session's arrays."""
+        self._attached_session()
+        return self._index
+
+    @property
+    def stripes(self) -> List[int]:
+        """The lock stripes the group's cameras are under."""
+        self._attached_session()
+        return self._stripes
+
+    def dolly(self, x: int, y: int) -> None:
+        """Move every camera in the group along the floor."""
+        session = self._attached_session()
+        session.wait_for_the_rig()
+        with session.lock_for(self):
+            session.positions[self.index] += (x, y)
+        session.shot_changed()
+
+    def pan(self, direction: int) -> None:
+        """Swivel every camera in the group."""
+        session = self._attached_session()
+        session.wait_for_the_rig()
+        with session.lock_for(self):
+            session.pan_angles[self.index] += direction
+        session.shot_changed()
+
+    def zoom(self, direction: int) -> None:
+        """Zoom every camera in the group."""
+        session = self._attached_session()
+        session.wait_for_the_rig()
+        with session.lock_for(self):
+            session.zoom_levels[self.index] += direction
+        session.shot_changed()
+
+    def set_the_scene(self, scene_num: int) -> None:
+        """Skip every camera in the group to a scene in the script."""
+        session = self._attached_session()
+        session.wait_for_the_rig()
+        with session.lock_for(self):
+            session.scenes[self.index] = scene_num
+        session.shot_changed()
+
+    def thats_a_wrap(self) -> None:
+        """Stop recording on every camera in the group."""
+        session = self._attached_session()
+        with session.lock_for(self):
+            session.recording[self.index] = False
+        session.shot_changed()
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Where each camera in the group is on the floor."""
+        return self._attached_session().positions[self.index]
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __repr__(self) -> str:
+        return f"CameraGroup({len(self)} cameras)"
+
+
+AnyCamera = Union[Camera, CameraGroup]
+
+
+class MovementCommand(NamedTuple):
+    """Everything one camera should do, sent to the rig all at once."""
+
+    camera: AnyCamera
+    x: float = 0.0
+    y: float = 0.0
+    pan: float = 0.0
+    zoom: float = 0.0
+
+
+class ShardReport(NamedTuple):
+    """How one worker got on, starting or stopping its share of the cameras."""
+
+    shard: int
+    cameras: int
+    seconds: float
+
+
+class RecordingReport(NamedTuple):
+    """The merged status of every shard, and of the set as a whole."""
+
+    shards: Tuple[ShardReport, ...]
+    cameras: int
+    recording: int
+    seconds: float
+
+
+class RecordingSession:
+    """A recording session, which keeps track of all the cameras on set.
+
+    Each camera gets one row in a handful of contiguous NumPy arrays, rather
+    than carrying its own set of Python objects around. The arrays have room
+    to spare and grow as cameras are added; only the first ``len(cameras)``
+    rows mean anything.
+
+    Real rigs take a moment to answer; pass a ``latency`` (in seconds) to have
+    every camera move (and every camera starting or stopping) wait that long,
+    like a motor controller would.
+
+    Anyone who needs to know when the shot changes (a camera moves, cuts,
+    skips to a scene, or starts or stops rolling) can ``watch`` the session.
+
+    Examples::
+
+        session = RecordingSession()
+        session.add_camera(Camera("Toto"))
+
+        slow_rig = RecordingSession(latency=0.25)
+
+        session.watch(lambda: print("The shot changed!"))
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.moving_simultaneously = 0
+        self.observers: List[Callable[[], None]] = []
+        self.locks = tuple(threading.Lock() for _ in range(LOCK_STRIPES))
+        # counts the wraps, since cameras added back get new rows
+        self.take = 0
+        self._strike_the_set()
+
+    def _strike_the_set(self) -> None:
+        """Clear every camera (and its state) out of the session."""
+        self.cameras: List[Camera] = []
+        self.cameras_by_character: Dict[str, Camera] = {}
+        self.active_camera: Optional[Camera] = None
+        self.positions = np.zeros((INITIAL_CAPACITY, 2))
+        self.pan_angles = np.zeros(INITIAL_CAPACITY)
+        self.zoom_levels = np.zeros(INITIAL_CAPACITY)
+        self.recording = np.zeros(INITIAL_CAPACITY, dtype=bool)
+        self.scenes = np.zeros(INITIAL_CAPACITY, dtype=np.int64)
+
+    def _make_room(self) -> None:
+        """Double the size of the camera arrays."""
+        with self._all_cameras_locked():
+            capacity = 2 * len(self.pan_angles)
+            for name in CAMERA_ARRAYS:
+                old = getattr(self, name)
+                new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+                new[: len(old)] = old
+                setattr(self, name, new)
+
+    def add_camera(self, camera: Camera) -> None:
+        """Bring a camera onto the set. The first one becomes active."""
+        if camera.session is self:
+            return
+        if camera.session is not None:
+            raise CamPyError(f"The camera on {camera.character} is on another set.")
+
+        if len(self.cameras) == len(self.pan_angles):
+            self._make_room()
+
+        camera.session = self
+        camera.index = len(self.cameras)
+        self.cameras.append(camera)
+        self.cameras_by_character.setdefault(camera.character, camera)
+        self.recording[camera.index] = camera.script is not None
+
+        if self.active_camera is None:
+            self.active_camera = camera
+
+    def lock_for(self, camera: AnyCamera) -> ContextManager:
+        """Get the lock a worker must hold while it touches this camera."""
+        if isinstance(camera, CameraGroup):
+            return self._locked(camera.stripes)
+        return self.locks[camera.index % LOCK_STRIPES]
+
+    @contextmanager
+    def _locked(self, stripes: Iterable[int]) -> Generator:
+        """Hold several lock stripes, always taken in the same order."""
+        with ExitStack() as stack:
+            for stripe in stripes:
+                stack.enter_context(self.locks[stripe])
+            yield
+
+    def _all_cameras_locked(self) -> ContextManager:
+        """Hold every camera still while the whole set changes at once."""
+        return self._locked(range(LOCK_STRIPES))
+
+    def watch(self, observer: Callable[[], None]) -> None:
+        """Call ``observer`` every time the shot changes."""
+        self.observers.append(observer)
+
+    def unwatch(self, observer: Callable[[], None]) -> None:
+        """Stop calling ``observer`` when the shot changes."""
+        if observer in self.observers:
+            self.observers.remove(observer)
+
+    def shot_changed(self) -> None:
+        """Tell everyone watching that the shot has changed."""
+        for observer in list(self.observers):
+            observer()
+
+    def wait_for_the_rig(self, trips: int = 1) -> None:
+        """Wait for the rig's motors to answer, if they are slow.
+
+        This happens *before* taking the camera's lock, so two moves on the
+        same camera (say, a dolly and a zoom) can be in flight together; the
+        lock only guards writing down where the camera ended up.
+        """
+        if self.latency:
+            time.sleep(self.latency * trips)
+
+    @property
+    def scripts(self) -> List[Any]:
+        """Every script being recorded on set, each one only once."""
+        scripts = {id(camera.script): camera.script for camera in self.cameras}
+        scripts.pop(id(None), None)
+        return list(scripts.values())
+
+    def get_active_camera(self) -> Camera:
+        """Get the camera that is currently live."""
+        if self.active_camera is None:
+            raise CamPyError("There is no active camera.")
+        return self.active_camera
+
+    def set_active_camera(self, camera: Camera) -> None:
+        """Cut to a different camera."""
+        if camera.session is not self:
+            raise CamPyError(f"The camera on {camera.character} is not on set.")
+        self.active_camera = camera
+        self.shot_changed()
+
+    def get_camera_on_character(self, character: str) -> Camera:
+        """Find the (first) camera pointed at a specific character."""
+        try:
+            return self.cameras_by_character[character]
+        except KeyError:
+            raise CamPyError(f"There is no camera on {character}.") from None
+
+    def recast(self, camera: Camera, character: str) -> None:
+        """Keep the character index up to date when a camera is re-pointed."""
+        old_character = camera.character
+        if character == old_character:
+            return
+        if self.cameras_by_character.get(old_character) is camera:
+            del self.cameras_by_character[old_character]
+            for other in self.cameras:
+                if other is not camera and other.character == old_character:
+                    self.cameras_by_character[old_character] = other
+                    break
+        self.cameras_by_character.setdefault(character, camera)
+
+    def _check_on_set(self, camera: AnyCamera) -> None:
+        """Complain if a camera isn't on this set."""
+        if camera.session is not self:
+            raise CamPyError(f"The camera on {camera.character} is not on set.")
+
+    def _write_move(self, command: MovementCommand) -> None:
+        """Write down where a camera ended up, once the rig has answered."""
+        camera = command.camera
+        with self.lock_for(camera):
+            self.positions[camera.index] += (command.x, command.y)
+            self.pan_angles[camera.index] += command.pan
+            self.zoom_levels[camera.index] += command.zoom
+        self.shot_changed()
+
+    def move(self, command: MovementCommand) -> None:
+        """Dolly, pan, and zoom one camera in a single trip to the rig."""
+        self._check_on_set(command.camera)
+        self.wait_for_the_rig()
+        self._write_move(command)
+
+    def send(self, commands: Iterable[MovementCommand]) -> None:
+        """Send a batch of movement commands, one trip per camera."""
+        for command in commands:
+            self.move(command)
+
+    async def move_async(self, command: MovementCommand) -> None:
+        """Move one camera without blocking the event loop.
+
+        This rig only knows how to wait for its motors by blocking, so the
+        move happens on a worker thread. AsyncRecordingSession does better.
+        """
+        await asyncio.to_thread(self.move, command)
+
+    async def send_async(self, commands: Iterable[MovementCommand]) -> None:
+        """Send a batch of movement commands, with every trip in flight at once."""
+        await asyncio.gather(*(self.move_async(command) for command in commands))
+
+    def set_the_scene(self, scene_num: int) -> None:
+        """Skip every camera on set to a scene in the script."""
+        with self._all_cameras_locked():
+            self.scenes[: len(self.cameras)] = scene_num
+        self.shot_changed()
+
+    def _roll_shard(
+        self, shard_num: int, shard: List[Camera], rolling: bool
+    ) -> ShardReport:
+        """Start (or stop) one shard of cameras, one trip to the rig apiece."""
+        started = time.perf_counter()
+        group = CameraGroup(*shard)
+        self.wait_for_the_rig(trips=len(shard))
+        with self.lock_for(group):
+            self.recording[group.index] = rolling
+        return ShardReport(shard_num, len(shard), time.perf_counter() - started)
+
+    def _roll_in_shards(
+        self, cameras: List[Camera], rolling: bool, workers: int
+    ) -> RecordingReport:
+        """Split the cameras into shards and roll each shard on its own worker.
+
+        The workers are threads, because every shard writes to this session's
+        arrays; the rig's latency is spent waiting, not holding the GIL.
+        """
+        started = time.perf_counter()
+        shard_size = -(-len(cameras) // max(workers, 1)) or 1
+        shards = [
+            cameras[start : start + shard_size]
+            for start in range(0, len(cameras), shard_size)
+        ]
+        if len(shards) <= 1:
+            reports = [self._roll_shard(0, shard, rolling) for shard in shards]
+        else:
+            with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+                rolls = [
+                    pool.submit(self._roll_shard, shard_num, shard, rolling)
+                    for shard_num, shard in enumerate(shards)
+                ]
+                reports = [roll.result() for roll in rolls]
+
+        self.shot_changed()
+        num_cameras = len(self.cameras)
+        return RecordingReport(
+            tuple(reports),
+            num_cameras,
+            int(np.count_nonzero(self.recording[:num_cameras])),
+            time.perf_counter() - started,
+        )
+
+    def start_recording(
+        self, cameras: Iterable[Camera], script: Any, workers: int = 1
+    ) -> RecordingReport:
+        """Bring cameras on set and start them recording the script.
+
+        Every camera takes its own trip to the rig to start. With more than
+        one worker, the cameras are split into that many shards, which are
+        started side by side.
+        """
+        cameras = list(cameras)
+        for camera in cameras:
+            self.add_camera(camera)
+            camera.script = script
+        return self._roll_in_shards(cameras, True, workers)
+
+    def stop_recording(self, workers: int = 1) -> RecordingReport:
+        """Stop recording on every camera on set, ``workers`` shards at a time.
+
+        Cameras that have already stopped don't need a trip to the rig.
+        """
+        rolling = np.flatnonzero(self.recording[: len(self.cameras)])
+        return self._roll_in_shards(
+            [self.cameras[index] for index in rolling], False, workers
+        )
+
+    @contextmanager
+    def _moving_simultaneously(self) -> Generator:
+        """Note that the camera moves happening now are one movement."""
+        self.moving_simultaneously += 1
+        try:
+            yield self
+        finally:
+            self.moving_simultaneously -= 1
+
+    @property
+    def simultaneous_movement(self) -> Any:
+        """Context in which all camera moves happen together."""
+        return self._moving_simultaneously()
+
+    def wrap(self) -> None:
+        """That's a wrap on the whole session! Send every camera home."""
+        for camera in self.cameras:
+            camera.session = None
+            camera.index = -1
+        self._strike_the_set()
+        self.take += 1
+
+
+class AsyncRecordingSession(RecordingSession):
+    """A recording session for rigs driven from an asyncio event loop.
+
+    Waiting for the rig is an ``await`` rather than a blocking sleep, so one
+    event loop can keep many cameras moving at once, with no threads. The
+    blocking methods still work, for Actions that don't know about asyncio.
+
+    Examples::
+
+        session = AsyncRecordingSession(latency=0.25)
+        await session.send_async(commands)
+    """
+
+    async def wait_for_the_rig_async(self, trips: int = 1) -> None:
+        """Wait for the rig's motors to answer, letting other tasks run."""
+        if self.latency:
+            await asyncio.sleep(self.latency * trips)
+
+    async def move_async(self, command: MovementCommand) -> None:
+        """Dolly, pan, and zoom one camera in a single trip to the rig."""
+        self._check_on_set(command.camera)
+        await self.wait_for_the_rig_async()
+        self._write_move(command)
@@ -0,0 +1,39 @@
+"""
+Setup shared by our feature tests and our benchmarks.
+"""
+
+from typing import Generator, List
+
+import pytest
+from pytest_benchmark.utils import get_tag
+from screenpy import AnActor
+
+from .abilities import ControlCameras
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    """Save every benchmark run as JSON, so the next run can compare to it.
+
+    A run that collected no benchmarks (like ``pytest features/``) has
+    nothing to save, so it isn't asked to.
+    """
+    saving = config.getoption("benchmark_save") or config.getoption(
+        "benchmark_autosave"
+    )
+    if saving or config.getoption("benchmark_disable"):
+        return
+    if any("benchmark" in getattr(item, "fixturenames", ()) for item in items):
+        # pytest-benchmark read its options before anything was collected
+        # pylint: disable=protected-access
+        config._benchmarksession.autosave = get_tag()  # type: ignore[attr-defined]
+
+
+@pytest.fixture
+def Cameron() -> Generator:
+    """Generate our cameraman, Cameron."""
+    the_actor = AnActor.named("Cameron").who_can(ControlCameras())
+    yield the_actor
+    the_actor.exit()
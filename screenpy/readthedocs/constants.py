@@ -4,3 +4,12 @@ Constants for magic strings.
 
 TENSE = "tense"
 LAUGHING = "laughter"
+
+THREADS = "threads"
+ASYNCIO = "asyncio"
+
+NARRATED = "narrated"
+SILENT = "silent"
+DEFERRED = "deferred"
+
+DEFAULT_WORKERS = 4
@@ -2,21 +2,23 @@
 Setup and fixtures for our feature tests.
 """
 
+from pathlib import Path
 from typing import Generator
 
 import pytest
 from screenpy import AnActor
 
-from ..abilities import ControlCameras, PollTheAudience
+from ..abilities import PollTheAudience
+from ..abilities.audience_pool import the_audience_pool
+from ..profiling import Profiler
 from pollster import laughter_packet, tense_packet, connect_to_audience
 
 
-@pytest.fixture
-def Cameron() -> Generator:
-    """Generate our cameraman, Cameron."""
-    the_actor = AnActor.named("Cameron").who_can(ControlCameras())
-    yield the_actor
-    the_actor.exit()
+@pytest.fixture(scope="session", autouse=True)
+def audience_pool() -> Generator:
+    """Share audience connections across every test, closing them at the end."""
+    yield the_audience_pool
+    the_audience_pool.close()
 
 
 @pytest.fixture
@@ -27,6 +29,16 @@ def Polly() -> Generator:
     the_actor.exit()
 
 
+@pytest.fixture
+def StreamingPolly() -> Generator:
+    """Generate Polly, listening to a live stream of the audience's mood."""
+    the_actor = AnActor.named("Polly").who_can(
+        PollTheAudience.streaming(buffer_size=8)
+    )
+    yield the_actor
+    the_actor.exit()
+
+
 @pytest.hookimpl(hookwrapper=True, tryfirst=True)
 def pytest_runtest_setup(item: pytest.Item) -> Generator:
     """This function makes the tests work in any order.
@@ -41,3 +53,27 @@ def pytest_runtest_setup(item: pytest.Item) -> Generator:
         side_effect = tense_packet
     connect_to_audience().poll_mood.side_effect = [side_effect]
     yield
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Let the tests be profiled from the command line."""
+    parser.addoption(
+        "--profile-beats",
+        metavar="DIR",
+        default=None,
+        help="save a flame-graph stack file and a JSON summary for each test",
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item) -> Generator:
+    """Profile each test's beats, if asked to."""
+    profile_dir = item.config.getoption("--profile-beats")
+    if profile_dir is None:
+        yield
+        return
+
+    profiler = Profiler(item.name)
+    with profiler.attached():
+        yield
+    profiler.save(Path(profile_dir))
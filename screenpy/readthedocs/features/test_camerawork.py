@@ -0,0 +1,269 @@
+"""
+Test the camerawork itself, no audience required.
+"""
+
+import asyncio
+import logging
+import threading
+
+import pytest
+from cam_py import Camera, CameraGroup
+from screenpy import AnActor, given, when
+from screenpy.exceptions import UnableToAct
+from screenpy.pacing import the_narrator
+
+from ..abilities import ControlCameras
+from ..actions import (
+    Dolly,
+    InOneTake,
+    JumpToCamera,
+    Pan,
+    Simultaneously,
+    SkipToScene,
+    StartRecording,
+    StopRecording,
+    Zoom,
+    attempts_to_async,
+)
+from ..constants import ASYNCIO, DEFERRED, THREADS
+from ..narration import set_narration_mode
+from ..scripts import GOOD_WILL_HUNTING, SHAUN_OF_THE_DEAD
+from ..tasks import DollyZoom
+
+
+def test_cameras_stay_packed_away(Cameron: AnActor) -> None:
+    """No recording session is opened until a camera is needed."""
+    control_cameras = Cameron.ability_to(ControlCameras)
+    assert not control_cameras.session_is_open
+
+    given(Cameron).was_able_to(StartRecording(SHAUN_OF_THE_DEAD).on(Camera("Shaun")))
+
+    assert control_cameras.session_is_open
+
+
+def test_simultaneous_mistakes(Cameron: AnActor) -> None:
+    """Every botched move in a simultaneous shot is reported together."""
+    given(Cameron).was_able_to(StartRecording(SHAUN_OF_THE_DEAD).on(Camera("Shaun")))
+
+    with pytest.raises(UnableToAct) as actual:
+        when(Cameron).attempts_to(
+            Simultaneously(
+                Dolly(),
+                Pan.left(),
+                Zoom.in_().on_camera(Camera("Ed")),
+            )
+        )
+
+    assert "2 of 3 simultaneous actions failed" in str(actual.value)
+    assert "Dolly: UnableToAct" in str(actual.value)
+    assert "Zoom: CamPyError" in str(actual.value)
+
+
+class HoldTheShot:
+    """Hold the shot until the director calls cut (or five seconds pass)."""
+
+    def perform_as(self, the_actor: AnActor) -> None:
+        """Wait for the cut."""
+        self.cut.wait(5)
+        self.finished.set()
+
+    def __init__(self) -> None:
+        self.cut = threading.Event()
+        self.finished = threading.Event()
+
+
+@pytest.mark.parametrize("backend", [THREADS, ASYNCIO])
+def test_simultaneous_timeout(backend: str, Cameron: AnActor) -> None:
+    """A simultaneous shot gives up once its time is up, on either backend."""
+    given(Cameron).was_able_to(StartRecording(SHAUN_OF_THE_DEAD).on(Camera("Shaun")))
+    held_shot = HoldTheShot()
+    simultaneously = Simultaneously(held_shot, Pan.left()).within(0.1)
+    simultaneously.backend = backend
+
+    try:
+        with pytest.raises(UnableToAct) as actual:
+            when(Cameron).attempts_to(simultaneously)
+
+        assert not held_shot.finished.is_set()
+        assert "HoldTheShot: TimeoutError" in str(actual.value)
+    finally:
+        held_shot.cut.set()
+
+
+def test_moves_in_one_take(Cameron: AnActor) -> None:
+    """A take sends each camera its net move, skipping moves that cancel out."""
+    one = Camera("Shaun")
+    two = Camera("Ed")
+    take = InOneTake(
+        Zoom.in_().on_camera(one),
+        JumpToCamera(two),
+        Pan.left().on_camera(two),
+        Zoom.out().on_camera(two),
+        Pan.right().on_camera(two),
+        JumpToCamera(one),
+        Pan.left(),
+        Dolly().forward(),
+        Zoom.in_().on_camera(two),
+    )
+    given(Cameron).was_able_to(StartRecording(SHAUN_OF_THE_DEAD).on(one).and_(two))
+
+    when(Cameron).attempts_to(take)
+
+    campy_session = one.session
+    assert take.commands_sent == 1
+    assert (one.position, one.pan_angle, one.zoom_level) == ((0, 1), -1, 1)
+    assert (two.position, two.pan_angle, two.zoom_level) == ((0, 0), 0, 0)
+    assert campy_session.get_active_camera() is one
+
+
+def test_zooming_whichever_camera_is_active(Cameron: AnActor) -> None:
+    """A Zoom with no camera of its own zooms the active one, every time."""
+    one, two = Camera("Shaun"), Camera("Ed")
+    given(Cameron).was_able_to(StartRecording(SHAUN_OF_THE_DEAD).on(one, two))
+    zoom_in = Zoom.in_()
+
+    when(Cameron).attempts_to(zoom_in, JumpToCamera(two), zoom_in)
+
+    assert (one.zoom_level, two.zoom_level) == (1, 1)
+
+
+def test_a_take_that_goes_nowhere(Cameron: AnActor) -> None:
+    """Moves that cancel each other out in one take aren't sent at all."""
+    one = Camera("Shaun")
+    given(Cameron).was_able_to(StartRecording(SHAUN_OF_THE_DEAD).on(one))
+    take = InOneTake(Pan.left(), Dolly().left().right(), Pan.right())
+
+    when(Cameron).attempts_to(take)
+
+    assert take.commands_sent == 0
+    assert (one.position, one.pan_angle) == ((0, 0), 0)
+
+
+def test_moving_a_camera_group(Cameron: AnActor) -> None:
+    """A group of cameras moves together, like a single camera."""
+    extras = [Camera(f"Zombie #{num}") for num in range(100)]
+    given(Cameron).was_able_to(StartRecording(SHAUN_OF_THE_DEAD).on(*extras))
+    horde = CameraGroup(*extras)
+
+    when(Cameron).attempts_to(
+        Dolly().forward().left().on_camera(horde),
+        Pan.right().on_camera(horde),
+        Zoom.out().on_camera(horde),
+    )
+
+    assert all(extra.position == (-1, 1) for extra in extras)
+    assert all(extra.pan_angle == 1 for extra in extras)
+    assert all(extra.zoom_level == -1 for extra in extras)
+
+
+def test_a_camera_group_after_a_wrap(Cameron: AnActor) -> None:
+    """A group finds its cameras again once they're back on set."""
+    shaun, ed = Camera("Shaun"), Camera("Ed")
+    given(Cameron).was_able_to(StartRecording(SHAUN_OF_THE_DEAD).on(shaun, ed))
+    flatmates = CameraGroup(ed)
+    Cameron.ability_to(ControlCameras).campy_session.wrap()
+    given(Cameron).was_able_to(StartRecording(SHAUN_OF_THE_DEAD).on(ed))
+
+    when(Cameron).attempts_to(Dolly().right().on_camera(flatmates))
+
+    assert ed.position == (1, 0)
+
+
+def test_recording_in_parallel(Cameron: AnActor) -> None:
+    """Many cameras can be started and stopped in shards, with one report."""
+    extras = [Camera(f"Zombie #{num}") for num in range(10)]
+    start_recording = StartRecording(SHAUN_OF_THE_DEAD).on(*extras).in_parallel(4)
+    stop_recording = StopRecording().in_parallel(4)
+
+    given(Cameron).was_able_to(start_recording)
+    assert all(extra.is_recording for extra in extras)
+
+    when(Cameron).attempts_to(stop_recording)
+    assert not any(extra.is_recording for extra in extras)
+
+    assert [shard.cameras for shard in start_recording.report.shards] == [3, 3, 3, 1]
+    assert start_recording.report.recording == 10
+    assert stop_recording.report.recording == 0
+
+
+def test_skipping_to_a_scene(Cameron: AnActor) -> None:
+    """Cameras can skip to any scene the script has, and no further."""
+    will = Camera("Will")
+    given(Cameron).was_able_to(StartRecording(GOOD_WILL_HUNTING).on(will))
+
+    when(Cameron).attempts_to(SkipToScene(3))
+    with pytest.raises(UnableToAct):
+        Cameron.attempts_to(SkipToScene(GOOD_WILL_HUNTING.num_scenes + 1))
+
+    assert will.scene == 3
+    assert GOOD_WILL_HUNTING.scene(3).strip().startswith("INT. M.I.T. CLASSROOM")
+    assert will.pages.obj is GOOD_WILL_HUNTING.contents.obj
+
+
+def test_camerawork_on_an_event_loop() -> None:
+    """Moves on an asynchronous rig all wait for the rig together."""
+    Cameron = AnActor.named("Cameron").who_can(
+        ControlCameras.asynchronously(latency=0.05)
+    )
+    extras = [Camera(f"Zombie #{num}") for num in range(20)]
+    try:
+        given(Cameron).was_able_to(
+            StartRecording(SHAUN_OF_THE_DEAD).on(*extras).in_parallel(len(extras))
+        )
+
+        asyncio.run(
+            attempts_to_async(
+                Cameron,
+                Simultaneously(*(Dolly().forward().on_camera(e) for e in extras)),
+                DollyZoom(),
+            )
+        )
+
+        assert all(extra.position == (0, 1) for extra in extras[1:])
+        assert extras[0].position == (0, 0)
+        assert extras[0].zoom_level == 1
+        Cameron.attempts_to(StopRecording().in_parallel(len(extras)))
+    finally:
+        Cameron.exit()
+
+
+def test_simultaneously_inside_an_event_loop(Cameron: AnActor) -> None:
+    """A blocking Simultaneously on the asyncio backend won't nest loops."""
+    given(Cameron).was_able_to(StartRecording(SHAUN_OF_THE_DEAD).on(Camera("Ed")))
+    shot = Simultaneously(Dolly().forward(), Zoom.in_()).using_asyncio()
+
+    async def perform_blocking() -> None:
+        Cameron.attempts_to(shot)
+
+    with pytest.raises(UnableToAct, match="perform_as_async"):
+        asyncio.run(perform_blocking())
+
+
+def test_deferred_narration(Cameron: AnActor, caplog: pytest.LogCaptureFixture) -> None:
+    """Deferred beats are only written out when someone is listening."""
+    previous_mode = set_narration_mode(DEFERRED)
+    try:
+        given(Cameron).was_able_to(StartRecording(SHAUN_OF_THE_DEAD).on(Camera("Ed")))
+        assert not caplog.messages
+
+        with caplog.at_level(logging.INFO, logger="screenpy"):
+            when(Cameron).attempts_to(Dolly().forward())
+    finally:
+        set_narration_mode(previous_mode)
+
+    assert caplog.messages == ["Cameron dollies the active camera forward."]
+
+
+def test_deferred_narration_tells_it_as_it_began(
+    Cameron: AnActor, caplog: pytest.LogCaptureFixture
+) -> None:
+    """A deferred beat describes its Action as it was when the beat started."""
+    previous_mode = set_narration_mode(DEFERRED)
+    try:
+        with caplog.at_level(logging.INFO, logger="screenpy"):
+            with the_narrator.mic_cable_kinked():
+                when(Cameron).attempts_to(StartRecording(SHAUN_OF_THE_DEAD))
+    finally:
+        set_narration_mode(previous_mode)
+
+    assert caplog.messages == ["Cameron starts recording on ."]
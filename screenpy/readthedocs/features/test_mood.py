@@ -5,18 +5,22 @@ Test our ability to influence the audience's mood with skillful camerawork.
 from cam_py import Camera
 from screenpy import AnActor, given, then, when
 from screenpy.actions import See
+from screenpy.pacing import the_narrator
 from screenpy.resolutions import Equals
 
 from ..actions import (
     JumpToCamera,
     Dolly,
+    InOneTake,
     Pan,
     SkipToScene,
     StartRecording,
     StopRecording,
     Zoom,
 )
-from ..constants import LAUGHING
+from ..constants import LAUGHING, SILENT
+from ..narration import set_narration_mode
+from ..profiling import Profiler
 from ..tasks import CutToCloseup, DollyZoom
 from ..questions import AudienceTension, TopAudienceReaction
 from ..resolutions import IsPalpable
@@ -63,3 +67,73 @@ def test_comedic_timing(Cameron: AnActor, Polly: AnActor) -> None:
     )
 
     then(Polly).should(See.the(TopAudienceReaction(), Equals(LAUGHING)))
+    assert len(one.pages) == len(SHAUN_OF_THE_DEAD.contents)
+
+
+def test_comedic_timing_in_one_take(Cameron: AnActor, Polly: AnActor) -> None:
+    """We can make the same funny moment with one trip to each camera."""
+    Cameron.has_cleanup_tasks(StopRecording())
+    one = Camera("Shaun")
+    two = Camera("Ed")
+
+    given(Cameron).was_able_to(
+        StartRecording(SHAUN_OF_THE_DEAD).on(one).and_(two),
+        SkipToScene(20),
+    )
+
+    when(Cameron).attempts_to(
+        InOneTake(
+            Zoom.in_().on_camera(one),
+            JumpToCamera(two),
+            Zoom.out().on_camera(two),
+            JumpToCamera(one),
+            Pan.left(),
+            JumpToCamera(two),
+            JumpToCamera(one),
+        )
+    )
+
+    then(Polly).should(See.the(TopAudienceReaction(), Equals(LAUGHING)))
+
+
+def test_dramatic_profile(Cameron: AnActor, Polly: AnActor) -> None:
+    """Every beat is timed where it ran, inside tasks and questions too."""
+    profiler = Profiler("dramatic moment")
+
+    with profiler.attached():
+        given(Cameron).was_able_to(
+            StartRecording(GOOD_WILL_HUNTING).on(Camera("Will"))
+        )
+        when(Cameron).attempts_to(DollyZoom())
+        then(Polly).should(See.the(AudienceTension(), IsPalpable()))
+
+    stacks = [line.rsplit(" ", 1)[0] for line in profiler.collapsed_stacks()]
+    assert (
+        "dramatic moment;DollyZoom.perform_as;Simultaneously.perform_as;"
+        "Dolly.perform_as" in stacks
+    )
+    assert "dramatic moment;See.perform_as;AudienceTension.answered_by" in stacks
+    assert profiler.summary()["beats"]["Zoom.perform_as"]["calls"] == 1
+
+
+def test_silent_dramatic_profile(Cameron: AnActor, Polly: AnActor) -> None:
+    """Beats are timed even when no one narrates them."""
+    profiler = Profiler("silent moment")
+
+    previous_mode = set_narration_mode(SILENT)
+    try:
+        with profiler.attached(), the_narrator.off_the_air():
+            given(Cameron).was_able_to(
+                StartRecording(GOOD_WILL_HUNTING).on(Camera("Will"))
+            )
+            when(Cameron).attempts_to(DollyZoom())
+            then(Polly).should(See.the(AudienceTension(), IsPalpable()))
+    finally:
+        set_narration_mode(previous_mode)
+
+    stacks = [line.rsplit(" ", 1)[0] for line in profiler.collapsed_stacks()]
+    assert (
+        "silent moment;DollyZoom.perform_as;Simultaneously.perform_as;"
+        "Dolly.perform_as" in stacks
+    )
+    assert "silent moment;See.perform_as;AudienceTension.answered_by" in stacks
@@ -0,0 +1,169 @@
+"""
+Test the different ways we can poll the audience.
+"""
+
+from pathlib import Path
+
+from cam_py import Camera
+import numpy as np
+import pytest
+from hamcrest.core.string_description import StringDescription
+from pollster import MoodPacket, MoodRecording, ReplayedAudience, StandInAudience
+from screenpy import AnActor, given, then, when
+from screenpy.actions import See
+from screenpy.exceptions import UnableToAnswer
+from screenpy.resolutions import Equals
+
+from ..abilities import ControlCameras, PollTheAudience
+from ..abilities.audience_pool import AudiencePool
+from ..actions import Pan, StartRecording
+from ..constants import LAUGHING, TENSE
+from ..questions import AudienceTension, TopAudienceReaction
+from ..resolutions import IsPalpable, StaysPalpable
+from ..scripts import GOOD_WILL_HUNTING
+
+
+def test_dramatic_tension_in_one_poll() -> None:
+    """Questions asked together share a single poll of the audience."""
+    Polly = AnActor.named("Polly").who_can(PollTheAudience.cached())
+    try:
+        then(Polly).should(
+            See.the(AudienceTension(), IsPalpable()),
+            See.the(TopAudienceReaction(), Equals(TENSE)),
+        )
+    finally:
+        Polly.exit()
+
+
+def test_dramatic_camerawork_invalidates_polls(Cameron: AnActor) -> None:
+    """Moving the camera means the audience has to be polled again."""
+    campy_session = Cameron.ability_to(ControlCameras).campy_session
+    poll = PollTheAudience.cached().watching(campy_session)
+    Polly = AnActor.named("Polly").who_can(poll)
+    try:
+        given(Cameron).was_able_to(
+            StartRecording(GOOD_WILL_HUNTING).on(Camera("Will"))
+        )
+        given(Polly).was_able_to(See.the(AudienceTension(), IsPalpable()))
+
+        when(Cameron).attempts_to(Pan.left())
+
+        assert poll.cached_at is None
+    finally:
+        Polly.exit()
+    assert not campy_session.observers
+
+
+def test_dramatic_tension_from_a_stream(StreamingPolly: AnActor) -> None:
+    """A streaming poll answers from the packets it has already read."""
+    then(StreamingPolly).should(
+        See.the(AudienceTension(), IsPalpable()),
+        See.the(AudienceTension.over_the_last(8), IsPalpable()),
+        See.the(AudienceTension.throughout_the_scene(), StaysPalpable()),
+    )
+
+    stats = StreamingPolly.ability_to(PollTheAudience).stream_stats
+    assert stats.received == 1
+    assert stats.dropped == 0
+
+
+def test_tension_that_slips() -> None:
+    """A failed check says how many moods fell short, and by how much."""
+    matcher = StaysPalpable().matcher
+    slipping = np.array([90.0, 80.0, 95.0, 70.0])
+    mismatch = StringDescription()
+
+    assert not matcher.matches(slipping)
+    assert matcher.matches(np.array([90.0, 95.0]))
+    matcher.describe_mismatch(slipping, mismatch)
+
+    assert str(mismatch) == (
+        "2 of 4 saturation levels were less than 85 (the first at index 1);"
+        " they ranged from 70 to 95"
+    )
+
+
+def test_a_stream_that_breaks_off() -> None:
+    """Once the audience stops answering, a streaming poll says so."""
+    recording = MoodRecording.of([MoodPacket(TENSE, 90)] * 3)
+    pool = AudiencePool(connect=lambda: ReplayedAudience(recording))
+    Polly = AnActor.named("Polly").who_can(
+        PollTheAudience.streaming(buffer_size=8, poll_interval=0.0, pool=pool)
+    )
+    try:
+        mood_stream = Polly.ability_to(PollTheAudience).mood_stream
+        mood_stream._consumer.join(timeout=1)  # pylint: disable=protected-access
+
+        with pytest.raises(UnableToAnswer, match="recording is over"):
+            AudienceTension.over_the_last(3).answered_by(Polly)
+        with pytest.raises(UnableToAnswer, match="1 or more"):
+            AudienceTension.over_the_last(0).answered_by(Polly)
+    finally:
+        Polly.exit()
+        pool.close()
+
+
+def test_audience_connections_are_reused(audience_pool: AudiencePool) -> None:
+    """Actors hand their connections back to the pool for the next Actor."""
+    before = audience_pool.stats
+
+    for _ in range(3):
+        AnActor.named("Polly").who_can(PollTheAudience()).exit()
+
+    after = audience_pool.stats
+    assert after.hits - before.hits >= 2
+    assert after.checked_out == before.checked_out
+
+
+def test_a_failed_checkout_keeps_the_count() -> None:
+    """A connection that can't be opened, or closed, isn't counted as out."""
+
+    def audience_that_stays_home() -> StandInAudience:
+        raise ConnectionError("The audience stayed home.")
+
+    pool = AudiencePool(connect=audience_that_stays_home)
+    with pytest.raises(ConnectionError):
+        pool.checkout()
+    assert pool.stats.checked_out == 0
+
+    healthy, broken = StandInAudience(), StandInAudience()
+    broken.close = audience_that_stays_home  # type: ignore[method-assign]
+    pool = AudiencePool(connect=StandInAudience, max_idle=0)
+    pool.idle = [(broken, 0.0), (healthy, float("inf"))]
+    with pytest.raises(ConnectionError):
+        pool.checkout()
+    assert pool.stats.checked_out == 0
+    assert pool.checkout() is healthy
+
+
+def test_checking_a_connection_in_twice() -> None:
+    """A connection given back twice is only idle once."""
+    pool = AudiencePool(connect=StandInAudience)
+    connection = pool.checkout()
+
+    pool.checkin(connection)
+    pool.checkin(connection)
+
+    assert (pool.stats.checked_out, pool.stats.idle) == (0, 1)
+    assert pool.checkout() is not pool.checkout()
+
+
+def test_replaying_a_recorded_audience(tmp_path: Path) -> None:
+    """A recorded audience reacts just as it did, from whichever packet."""
+    premiere = tmp_path / "premiere.npy"
+    MoodRecording.of(
+        [MoodPacket(TENSE, 90)] * 10 + [MoodPacket(LAUGHING, 50)] * 10
+    ).save(premiere)
+    recording = MoodRecording.load(premiere)
+    pool = AudiencePool(connect=lambda: ReplayedAudience(recording).seek(8))
+    Polly = AnActor.named("Polly").who_can(PollTheAudience(pool=pool))
+
+    try:
+        then(Polly).should(
+            See.the(TopAudienceReaction(), Equals(TENSE)),
+            See.the(AudienceTension(), IsPalpable()),
+            See.the(TopAudienceReaction(), Equals(LAUGHING)),
+        )
+    finally:
+        Polly.exit()
+        pool.close()
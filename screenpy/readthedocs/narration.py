@@ -0,0 +1,188 @@
+"""
+A ``beat`` for our Actions that only writes out its line if anyone reads it.
+"""
+
+import inspect
+import re
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from screenpy.narration.adapters.stdout_adapter import StdOutAdapter
+from screenpy.narration.gravitas import LIGHT
+from screenpy.pacing import Function, aside, the_narrator
+from screenpy.pacing import beat as narrated_beat
+
+from .constants import DEFERRED, NARRATED, SILENT
+from .profiling import measuring_beat
+
+NARRATION_MODES = (NARRATED, SILENT, DEFERRED)
+narration_mode = NARRATED
+
+
+def set_narration_mode(mode: str) -> str:
+    """Choose how beats are narrated. Returns the mode it replaced.
+
+    * ``NARRATED`` formats every beat's line up front, just like ScreenPy.
+    * ``SILENT`` never narrates a beat at all.
+    * ``DEFERRED`` hands the adapters a line which is only formatted when an
+      adapter reads it, and skips narrating entirely if no one is listening.
+    """
+    global narration_mode  # pylint: disable=global-statement
+    if mode not in NARRATION_MODES:
+        raise ValueError(f'"{mode}" is not one of {", ".join(NARRATION_MODES)}.')
+    narration_mode, previous_mode = mode, narration_mode
+    return previous_mode
+
+
+def anyone_is_listening(gravitas: Optional[str] = None) -> bool:
+    """Whether narrating a beat could end up anywhere at all.
+
+    A StdOutAdapter whose logger would throw the line away isn't listening.
+    Any other adapter, or a kinked cable holding narrations for later, is.
+    """
+    if not the_narrator.on_air:
+        return False
+    if the_narrator.cable_kinked:
+        return True
+    for adapter in the_narrator.adapters:
+        if not isinstance(adapter, StdOutAdapter):
+            return True
+        level = adapter.GRAVITAS[gravitas or LIGHT]
+        if adapter.manager.logger.isEnabledFor(level):
+            return True
+    return False
+
+
+class DeferredLine:
+    """A beat's line, written out from its template the first time it's read.
+
+    Anything that treats it as a string (logging it, formatting it into
+    another string, calling a string method on it) gets the finished line.
+    The ``cues`` filling in its markers are looked up when the beat starts,
+    so the line describes the Action as it was then; only the formatting
+    waits.
+    """
+
+    __slots__ = ("template", "args", "cues", "_line")
+
+    @staticmethod
+    def cued_by(
+        template: str, args: Tuple[Any, ...], action: Any, markers: Tuple[str, ...]
+    ) -> "DeferredLine":
+        """A line whose markers are filled in from the Action, as it is now."""
+        cues = {mark: getattr(action, mark) for mark in markers}
+        return DeferredLine(template, args, cues)
+
+    def __str__(self) -> str:
+        if self._line is None:
+            self._line = self.template.format(*self.args, **self.cues)
+        return self._line
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __eq__(self, other: object) -> bool:
+        return str(self) == str(other)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __len__(self) -> int:
+        return len(str(self))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(str(self), name)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> str:
+        # a kinked cable deep-copies its narrations; a cue may hold things
+        # (like the rig's locks) that can't be copied, so copy the line
+        return str(self)
+
+    def __init__(
+        self,
+        template: str,
+        args: Tuple[Any, ...],
+        cues: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.template = template
+        self.args = args
+        self.cues = cues or {}
+        self._line: Optional[str] = None
+
+
+def beat(line: str, gravitas: Optional[str] = None) -> Callable[[Function], Function]:
+    """Describe a beat (a step in a test), narrated according to the mode.
+
+    Works just like ScreenPy's ``beat``: "{}" is replaced by the Actor, and
+    "{marker}" by the Action's ``marker`` property. The markers are found
+    once, when the method is decorated, instead of on every call.
+
+    Coroutines can be beats too; their line stays open while they're awaited.
+
+    Examples::
+
+        @beat("{} dollies the active camera {description}.")
+        def perform_as(self, the_actor: Actor) -> None:
+            ...
+
+        @beat("{} dollies the active camera {description}.")
+        async def perform_as_async(self, the_actor: Actor) -> None:
+            ...
+    """
+    markers = tuple(re.findall(r"\{([^0-9\}]+)}", line))
+
+    def line_for(args: Tuple[Any, ...]) -> Optional[DeferredLine]:
+        """Get the line for this call, or None if it shouldn't be narrated."""
+        if narration_mode == SILENT or not the_narrator.on_air:
+            return None
+        if narration_mode == DEFERRED and not anyone_is_listening(gravitas):
+            return None
+        action = args[0] if len(args) > 0 else None
+        actor = args[1] if len(args) > 1 else ""
+        return DeferredLine.cued_by(line, (actor,), action, markers)
+
+    def async_decorator(func: Function) -> Function:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            deferred_line = line_for(args)
+            if deferred_line is None:
+                with measuring_beat(func):
+                    return await func(*args, **kwargs)
+
+            spoken_line = deferred_line
+            if narration_mode == NARRATED:
+                spoken_line = str(deferred_line)
+            with the_narrator.stating_a_beat(func, spoken_line, gravitas) as n_func:
+                retval = await n_func(*args, **kwargs)
+                if retval is not None:
+                    aside(DeferredLine("=> {}", (retval,)))
+            return retval
+
+        return wrapper
+
+    def decorator(func: Function) -> Function:
+        if inspect.iscoroutinefunction(func):
+            return async_decorator(func)
+        narrated_func = narrated_beat(line, gravitas)(func)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if narration_mode == NARRATED:
+                return narrated_func(*args, **kwargs)
+            deferred_line = line_for(args)
+            if deferred_line is None:
+                with measuring_beat(func):
+                    return func(*args, **kwargs)
+
+            with the_narrator.stating_a_beat(func, deferred_line, gravitas) as n_func:
+                retval = n_func(*args, **kwargs)
+                if retval is not None:
+                    aside(DeferredLine("=> {}", (retval,)))
+            return retval
+
+        return wrapper
+
+    return decorator
@@ -2,10 +2,18 @@
 Our audience-polling mock-library for the example!
 
 This library *purportedly* lets you to do polls on audiences. But it's a mock.
+For when a mock is too slow (or too magic), there's also a stand-in audience,
+which answers every poll with the same real packet, and a replayed audience,
+which answers with packets from a recording, in order.
 """
 
+import time
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional, Union
 from unittest import mock
 
+import numpy as np
+
 import constants
 
 
@@ -18,3 +26,156 @@ laughter_packet.top_mood = constants.LAUGHING
 laughter_packet.saturation = 50
 
 connect_to_audience = mock.Mock()
+
+
+class MoodPacket(NamedTuple):
+    """One reading of the audience's mood."""
+
+    top_mood: str
+    saturation: float
+
+
+class StandInAudience:
+    """A connection to an audience that always feels the same way.
+
+    Examples::
+
+        AudiencePool(connect=StandInAudience)
+
+        AudiencePool(connect=lambda: StandInAudience(MoodPacket("laughter", 50)))
+    """
+
+    def poll_mood(self) -> MoodPacket:
+        """Poll the audience, who haven't changed their mind."""
+        if self.closed:
+            raise ConnectionError("The audience has gone home.")
+        return self.packet
+
+    def close(self) -> None:
+        """Hang up on the audience."""
+        self.closed = True
+
+    def __init__(self, packet: MoodPacket = MoodPacket(constants.TENSE, 90)) -> None:
+        self.packet = packet
+        self.closed = False
+
+
+# moods are recorded as their index in here, to keep recordings compact
+MOODS = (constants.TENSE, constants.LAUGHING)
+PACKET_DTYPE = np.dtype([("mood", "u1"), ("saturation", "<f4")])
+
+
+class MoodRecording:
+    """A recorded stream of mood packets, five bytes apiece.
+
+    Recordings are saved as a NumPy ``.npy`` file and memory-mapped when
+    loaded, so a recording of millions of packets costs almost nothing to
+    open, and only the packets actually replayed are ever read.
+
+    Examples::
+
+        MoodRecording.of([MoodPacket(TENSE, 90)] * 1_000).save("tense.npy")
+
+        recording = MoodRecording.load("tense.npy")
+    """
+
+    @staticmethod
+    def of(packets: Iterable[MoodPacket]) -> "MoodRecording":
+        """Record these packets."""
+        packets = list(packets)
+        recorded = np.empty(len(packets), PACKET_DTYPE)
+        recorded["mood"] = [MOODS.index(packet.top_mood) for packet in packets]
+        recorded["saturation"] = [packet.saturation for packet in packets]
+        return MoodRecording(recorded)
+
+    @staticmethod
+    def load(path: Union[str, Path]) -> "MoodRecording":
+        """Open a saved recording, without reading it all in."""
+        return MoodRecording(np.load(path, mmap_mode="r"))
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the recording, to replay later."""
+        with open(path, "wb") as recording_file:
+            np.save(recording_file, self.packets)
+
+    def __len__(self) -> int:
+        return len(self.packets)
+
+    def __getitem__(self, packet_num: int) -> MoodPacket:
+        mood, saturation = self.packets[packet_num].item()
+        return MoodPacket(MOODS[mood], saturation)
+
+    def __init__(self, packets: np.ndarray) -> None:
+        if packets.dtype != PACKET_DTYPE:
+            raise ValueError(f"Mood packets must be recorded as {PACKET_DTYPE}.")
+        self.packets = packets
+
+
+class ReplayedAudience:
+    """A connection to an audience that feels exactly what was recorded.
+
+    Each poll gets the next packet in the recording. With a ``rate``, packets
+    are only sent that many times a second, and a poll waits for the next one
+    to be due, like a live audience would. Without one, they're sent as fast
+    as they're polled. When the recording runs out, the audience goes home,
+    unless it's told to ``loop``.
+
+    Examples::
+
+        AudiencePool(connect=lambda: ReplayedAudience(recording))
+
+        ReplayedAudience(recording, rate=1_000).seek(50_000)
+    """
+
+    def seek(self, packet_num: int) -> "ReplayedAudience":
+        """Skip to a packet in the recording."""
+        if not 0 <= packet_num <= len(self.recording):
+            raise IndexError(f"The recording has no packet #{packet_num}.")
+        self.position = packet_num
+        self.started = None
+        self.sent = 0
+        return self
+
+    def _wait_for_the_next_packet(self) -> None:
+        """Wait until the next packet is due, if packets have a rate."""
+        if self.rate is None:
+            return
+        if self.started is None:
+            self.started = time.monotonic()
+        due = self.started + self.sent / self.rate
+        wait = due - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+    def poll_mood(self) -> MoodPacket:
+        """Poll the audience, who react just as they did the first time."""
+        if self.closed:
+            raise ConnectionError("The audience has gone home.")
+        if self.position >= len(self.recording):
+            if not self.loop or not len(self.recording):
+                raise ConnectionError("The recording is over; the audience went home.")
+            self.position = 0
+
+        self._wait_for_the_next_packet()
+        packet = self.recording[self.position]
+        self.position += 1
+        self.sent += 1
+        return packet
+
+    def close(self) -> None:
+        """Hang up on the audience."""
+        self.closed = True
+
+    def __init__(
+        self,
+        recording: MoodRecording,
+        rate: Optional[float] = None,
+        loop: bool = False,
+    ) -> None:
+        self.recording = recording
+        self.rate = rate
+        self.loop = loop
+        self.closed = False
+        self.position = 0
+        self.started: Optional[float] = None
+        self.sent = 0
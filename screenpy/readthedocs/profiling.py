@@ -0,0 +1,184 @@
+"""
+Time every Action, Task, and Question our Actors perform, nested as they ran.
+"""
+
+import json
+import re
+import threading
+import time
+import tracemalloc
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
+
+from screenpy.pacing import the_narrator
+
+
+class Frame:
+    """One beat in progress, collecting the time its nested beats take."""
+
+    __slots__ = ("profiler", "name", "children_wall")
+
+    def __init__(self, profiler: "Profiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.children_wall = 0.0
+
+
+# the beats in progress in this thread or task, outermost first
+current_frames: ContextVar[Tuple[Frame, ...]] = ContextVar(
+    "current_frames", default=()
+)
+
+
+class StackStats:
+    """Everything measured for one stack of nested beats."""
+
+    __slots__ = ("calls", "wall", "self_wall", "cpu", "net_allocated_bytes")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.wall = 0.0
+        self.self_wall = 0.0
+        self.cpu = 0.0
+        self.net_allocated_bytes = 0
+
+
+# the Profilers measuring every beat right now
+attached_profilers: List["Profiler"] = []
+_attached_lock = threading.Lock()
+
+
+@contextmanager
+def measuring_beat(func: Callable) -> Generator:
+    """Measure a beat with every attached Profiler, narrated or not."""
+    with ExitStack() as stack:
+        for profiler in list(attached_profilers):
+            stack.enter_context(profiler.measuring(func.__qualname__))
+        yield
+
+
+@contextmanager
+def stating_a_measured_beat(
+    func: Callable, line: Any, gravitas: Optional[str] = None
+) -> Generator:
+    """Stand in for the Narrator's ``stating_a_beat``, measuring the beat too."""
+    narrator = type(the_narrator)
+    with measuring_beat(func):
+        with narrator.stating_a_beat(the_narrator, func, line, gravitas) as n_func:
+            yield n_func
+
+
+class Profiler:
+    """Measure the wall time, CPU time, and allocations of each beat.
+
+    Every Action, Task, and Question in this example is a beat. While a
+    Profiler is attached, each beat is measured as it is called, whether it
+    is narrated or not: SILENT beats, and beats off the air, are measured
+    too. Beats are kept in the stack they ran in (a DollyZoom's Dolly is
+    under the DollyZoom), including across Simultaneously's threads and tasks.
+
+    CPU time is the time spent on the beat's own thread. Allocations are the
+    net change in the bytes tracemalloc traces, process-wide: anything freed
+    again before the beat finished is netted out, and anything another thread
+    allocated meanwhile is counted. tracemalloc is started while a Profiler
+    is attached (if it wasn't already), which slows everything down a bit.
+
+    Examples::
+
+        profiler = Profiler("dolly zoom")
+        with profiler.attached():
+            the_actor.attempts_to(DollyZoom())
+        profiler.save(Path("profiles"))
+    """
+
+    @contextmanager
+    def measuring(self, name: str) -> Generator:
+        """Measure everything that happens in this context, as ``name``."""
+        frames = current_frames.get()
+        parent = tuple(f for f in frames if f.profiler is self)
+        frame = Frame(self, name)
+        token = current_frames.set(frames + (frame,))
+        started_bytes, _ = tracemalloc.get_traced_memory()
+        started_cpu = time.thread_time()
+        started = time.perf_counter()
+        try:
+            yield frame
+        finally:
+            wall = time.perf_counter() - started
+            cpu = time.thread_time() - started_cpu
+            net_allocated_bytes = tracemalloc.get_traced_memory()[0] - started_bytes
+            current_frames.reset(token)
+
+            stack = tuple(f.name for f in parent) + (name,)
+            with self._lock:
+                stats = self.stacks.setdefault(stack, StackStats())
+                stats.calls += 1
+                stats.wall += wall
+                stats.self_wall += wall - frame.children_wall
+                stats.cpu += cpu
+                stats.net_allocated_bytes += net_allocated_bytes
+                if parent:
+                    parent[-1].children_wall += wall
+
+    @contextmanager
+    def attached(self) -> Generator:
+        """Profile every beat called in this context."""
+        with _attached_lock:
+            if not attached_profilers:
+                # ScreenPy's own beats (like See's) always go through here
+                the_narrator.stating_a_beat = stating_a_measured_beat  # type: ignore
+            attached_profilers.append(self)
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            with self.measuring(self.name):
+                yield self
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+            with _attached_lock:
+                attached_profilers.remove(self)
+                if not attached_profilers:
+                    del the_narrator.stating_a_beat
+
+    def collapsed_stacks(self) -> List[str]:
+        """Each stack's own time, in microseconds, for a flame graph."""
+        with self._lock:
+            return [
+                f"{';'.join(stack)} {round(stats.self_wall * 1_000_000)}"
+                for stack, stats in self.stacks.items()
+            ]
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals for each kind of beat, however deeply they were nested."""
+        beats: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for stack, stats in self.stacks.items():
+                totals = beats.setdefault(
+                    stack[-1],
+                    {"calls": 0, "wall": 0.0, "cpu": 0.0, "net_allocated_bytes": 0},
+                )
+                totals["calls"] += stats.calls
+                totals["wall"] += stats.wall
+                totals["cpu"] += stats.cpu
+                totals["net_allocated_bytes"] += stats.net_allocated_bytes
+        return {"name": self.name, "beats": beats}
+
+    def save(self, directory: Path) -> Tuple[Path, Path]:
+        """Write the collapsed stacks and the JSON summary into a directory."""
+        directory.mkdir(parents=True, exist_ok=True)
+        file_name = re.sub(r"[^\w.-]+", "_", self.name)
+        stacks_path = directory / f"{file_name}.collapsed"
+        summary_path = directory / f"{file_name}.json"
+        stacks_path.write_text("\n".join(self.collapsed_stacks()) + "\n")
+        summary_path.write_text(json.dumps(self.summary(), indent=2))
+        return stacks_path, summary_path
+
+    def __init__(self, name: str = "profile") -> None:
+        self.name = name
+        self.stacks: Dict[Tuple[str, ...], StackStats] = {}
+        self._lock = threading.Lock()
+
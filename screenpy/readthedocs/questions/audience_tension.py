@@ -2,9 +2,12 @@
 Gather information about the audience's tension.
 """
 
+from typing import Any, Optional
+
 from screenpy import Actor
 
 from ..abilities import PollTheAudience
+from ..narration import beat
 
 
 class AudienceTension:
@@ -13,9 +16,36 @@ class AudienceTension:
     Examples::
 
         the_actor.should(See.the(AudienceTension(), IsPalpable())
+
+        the_actor.should(See.the(AudienceTension.over_the_last(50), IsPalpable())
+
+        the_actor.should(
+            See.the(AudienceTension.throughout_the_scene(), StaysPalpable())
+        )
     """
 
-    def answered_by(self, the_actor: Actor) -> dict:
+    @staticmethod
+    def over_the_last(num_packets: int) -> "AudienceTension":
+        """Sum up the tension over several packets (needs a streaming poll)."""
+        return AudienceTension(num_packets)
+
+    @staticmethod
+    def throughout_the_scene() -> "AudienceTension":
+        """Get every mood packet the stream remembers (needs a streaming poll)."""
+        return AudienceTension(history=True)
+
+    @beat("{} asks how tense the audience is.")
+    def answered_by(self, the_actor: Actor) -> Any:
         """Direct the actor to ask about the audience's tension."""
-        pollster = the_actor.ability_to(PollTheAudience).poll_connection
-        return pollster.poll_mood()
+        poll = the_actor.ability_to(PollTheAudience)
+        if self.history:
+            return poll.mood_history()
+        if self.num_packets is None:
+            return poll.current_mood()
+        return poll.mood_over_the_last(self.num_packets)
+
+    def __init__(
+        self, num_packets: Optional[int] = None, history: bool = False
+    ) -> None:
+        self.num_packets = num_packets
+        self.history = history
@@ -2,9 +2,12 @@
 Gather information about the audience's tension.
 """
 
+from typing import Optional
+
 from screenpy import Actor
 
 from ..abilities import PollTheAudience
+from ..narration import beat
 
 
 class TopAudienceReaction:
@@ -13,9 +16,24 @@ class TopAudienceReaction:
     Examples::
 
         the_actor.should(See.the(TopAudienceReaction(), Equals(LAUGHING))
+
+        the_actor.should(
+            See.the(TopAudienceReaction.over_the_last(50), Equals(LAUGHING))
+        )
     """
 
+    @staticmethod
+    def over_the_last(num_packets: int) -> "TopAudienceReaction":
+        """Find the top reaction over several packets (needs a streaming poll)."""
+        return TopAudienceReaction(num_packets)
+
+    @beat("{} asks how the audience is reacting.")
     def answered_by(self, the_actor: Actor) -> str:
         """Direct the actor to ask about the audience's top mood."""
-        pollster = the_actor.ability_to(PollTheAudience).poll_connection
-        return pollster.poll_mood().top_mood
+        poll = the_actor.ability_to(PollTheAudience)
+        if self.num_packets is None:
+            return poll.current_mood().top_mood
+        return poll.mood_over_the_last(self.num_packets).top_mood
+
+    def __init__(self, num_packets: Optional[int] = None) -> None:
+        self.num_packets = num_packets
@@ -1,5 +1,7 @@
 from .is_palpable import IsPalpable
+from .stays_palpable import StaysPalpable
 
 __all__ = [
     "IsPalpable",
+    "StaysPalpable",
 ]
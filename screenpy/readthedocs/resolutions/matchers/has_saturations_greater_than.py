@@ -0,0 +1,94 @@
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+from hamcrest.core.base_matcher import BaseMatcher
+from hamcrest.core.description import Description
+
+
+class SaturationReport(NamedTuple):
+    """A compact summary of a bulk saturation check."""
+
+    packets: int
+    failures: int
+    first_failure: Optional[int]
+    minimum: float
+    maximum: float
+
+
+def saturations_of(items: Any) -> np.ndarray:
+    """Get every saturation level out of a bunch of mood packets, as an array.
+
+    Accepts an array of saturations (or a structured array with a
+    ``saturation`` field), anything with a ``saturations`` column, or a
+    plain sequence of mood packets.
+    """
+    if isinstance(items, np.ndarray):
+        if items.dtype.names and "saturation" in items.dtype.names:
+            return items["saturation"]
+        return items
+    if hasattr(items, "saturations"):
+        return np.asarray(items.saturations)
+    return np.fromiter((item.saturation for item in items), dtype=float)
+
+
+def saturation_report(items: Any, saturation_level: float) -> SaturationReport:
+    """Check every saturation against the level, and sum up how it went."""
+    saturations = saturations_of(items)
+    failing = np.flatnonzero(saturations < saturation_level)
+    return SaturationReport(
+        packets=len(saturations),
+        failures=len(failing),
+        first_failure=int(failing[0]) if len(failing) else None,
+        minimum=float(saturations.min()) if len(saturations) else float("nan"),
+        maximum=float(saturations.max()) if len(saturations) else float("nan"),
+    )
+
+
+class HasSaturationsGreaterThan(BaseMatcher):
+    """Assert that every mood in a bunch has at least a specific saturation.
+
+    All the saturations are compared in one vectorized pass, and a failure
+    is described with a short report instead of one line per packet. The
+    report is worked out again for the description, so nothing is kept
+    between matches and one matcher can be used for many.
+    """
+
+    def _matches(self, item: Any) -> bool:
+        """Whether the assertion passes."""
+        report = saturation_report(item, self.saturation_level)
+        return report.packets > 0 and report.failures == 0
+
+    def describe_to(self, description: Description) -> None:
+        """Describe the passing case."""
+        description.append_text(
+            f"every mood has a saturation level of at least {self.saturation_level}"
+        )
+
+    def describe_mismatch(self, item: Any, mismatch_description: Description) -> None:
+        """Description used when a match fails."""
+        report = saturation_report(item, self.saturation_level)
+        if not report.packets:
+            mismatch_description.append_text("there were no moods to check")
+            return
+        mismatch_description.append_text(
+            f"{report.failures} of {report.packets} saturation levels were less"
+            f" than {self.saturation_level} (the first at index"
+            f" {report.first_failure}); they ranged from {report.minimum:g}"
+            f" to {report.maximum:g}"
+        )
+
+    def describe_match(self, item: Any, match_description: Description) -> None:
+        """Description used when a negated match fails."""
+        report = saturation_report(item, self.saturation_level)
+        match_description.append_text(
+            f"all {report.packets} saturation levels were at least"
+            f" {self.saturation_level}; they ranged from {report.minimum:g}"
+            f" to {report.maximum:g}"
+        )
+
+    def __init__(self, saturation_level: int) -> None:
+        self.saturation_level = saturation_level
+
+
+def stays_palpable() -> HasSaturationsGreaterThan:
+    return HasSaturationsGreaterThan(85)
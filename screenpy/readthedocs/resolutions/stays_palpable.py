@@ -0,0 +1,16 @@
+from screenpy.resolutions import BaseResolution
+
+from .matchers.has_saturations_greater_than import stays_palpable
+
+
+class StaysPalpable(BaseResolution):
+    """Match a tension level that is very, very high the whole time!!!
+
+    Examples::
+
+        the_actor.should(
+            See.the(AudienceTension.throughout_the_scene(), StaysPalpable())
+        )
+    """
+    line = "a palpable tension throughout!"
+    matcher_function = stays_palpable
@@ -1,8 +1,19 @@
 """
-Pay no attention to the mocks behind the curtain.
+Our screenplays, which are only read a scene at a time.
 """
 
-from unittest import mock
+from pathlib import Path
 
-GOOD_WILL_HUNTING = mock.MagicMock()
-SHAUN_OF_THE_DEAD = mock.MagicMock()
+from .screenplay import Screenplay, ScriptError
+
+SCRIPTS = Path(__file__).parent
+
+GOOD_WILL_HUNTING = Screenplay.from_file(SCRIPTS / "good_will_hunting.txt")
+SHAUN_OF_THE_DEAD = Screenplay.from_file(SCRIPTS / "shaun_of_the_dead.txt")
+
+__all__ = [
+    "GOOD_WILL_HUNTING",
+    "SHAUN_OF_THE_DEAD",
+    "Screenplay",
+    "ScriptError",
+]
@@ -0,0 +1,199 @@
+"""
+A screenplay on disk, with an index of where each of its scenes starts.
+"""
+
+import mmap
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+
+# A scene starts at its slugline, like "INT. M.I.T. CLASSROOM -- DAY".
+SLUGLINE = re.compile(rb"^[ \t]*(?:INT\.|EXT\.|INT/EXT|I/E)", re.MULTILINE)
+INDEX_DTYPE = np.dtype("<u8")
+
+
+class ScriptError(Exception):
+    """Raised when a screenplay doesn't have the scene you asked for."""
+
+
+def find_scenes(text: bytes) -> np.ndarray:
+    """Find the byte offset of every scene's slugline."""
+    return np.fromiter(
+        (match.start() for match in SLUGLINE.finditer(text)), INDEX_DTYPE
+    )
+
+
+class Screenplay:
+    """A screenplay, which can find any of its scenes without reading it all.
+
+    The first time a scene is needed, the script is scanned for sluglines
+    once, and the offset of each scene is saved next to it in a small
+    ``.scenes`` file. After that (even in a new test run), the index is
+    memory-mapped from that file, and seeking to a scene is a single lookup.
+
+    The script itself is memory-mapped too, rather than read into memory, and
+    its scenes are handed out as ``memoryview`` slices of that one mapping.
+    Every camera recording the same Screenplay shares its index and its text.
+
+    Examples::
+
+        script = Screenplay.from_file("scripts/good_will_hunting.txt")
+        script.scene(35)
+
+        bytes(script.scene_view(35)[:80])
+
+        with Screenplay.from_file(path) as script:
+            print(script.num_scenes)
+    """
+
+    INDEX_SUFFIX = ".scenes"
+
+    @staticmethod
+    def from_file(path: Union[str, Path]) -> "Screenplay":
+        """Open the screenplay at this path."""
+        return Screenplay(Path(path))
+
+    @property
+    def index_path(self) -> Path:
+        """Where this screenplay's scene index is kept."""
+        return self.path.with_suffix(self.INDEX_SUFFIX)
+
+    def _index_is_stale(self) -> bool:
+        """Whether the saved index is missing, or older than the script."""
+        try:
+            index_stat = self.index_path.stat()
+        except FileNotFoundError:
+            return True
+        script_stat = self.path.stat()
+        return (
+            index_stat.st_mtime_ns < script_stat.st_mtime_ns
+            or index_stat.st_size == 0
+            or int(np.fromfile(self.index_path, INDEX_DTYPE, count=1)[0])
+            != script_stat.st_size
+        )
+
+    def _save_index(self, scene_offsets: np.ndarray) -> None:
+        """Save the index next to the script, all at once or not at all."""
+        header = np.array([self.path.stat().st_size], INDEX_DTYPE)
+        handle, temp_path = tempfile.mkstemp(dir=self.path.parent)
+        try:
+            with os.fdopen(handle, "wb") as index_file:
+                np.concatenate((header, scene_offsets)).tofile(index_file)
+            os.replace(temp_path, self.index_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _load_index(self) -> np.ndarray:
+        """Map the saved index into memory, building it first if needed."""
+        if self._index_is_stale():
+            scene_offsets = find_scenes(self.contents)
+            try:
+                self._save_index(scene_offsets)
+            except OSError:
+                # nowhere to save it; this run will keep it in memory instead
+                return scene_offsets
+        if self.index_path.stat().st_size == INDEX_DTYPE.itemsize:
+            return np.empty(0, INDEX_DTYPE)
+        return np.memmap(self.index_path, INDEX_DTYPE, mode="r")[1:]
+
+    def _map_the_script(self) -> memoryview:
+        """Map the script's file into memory, read-only."""
+        with self.path.open("rb") as script_file:
+            if os.fstat(script_file.fileno()).st_size == 0:
+                return memoryview(b"")
+            self._mmap = mmap.mmap(script_file.fileno(), 0, access=mmap.ACCESS_READ)
+            return memoryview(self._mmap)
+
+    @property
+    def contents(self) -> memoryview:
+        """The whole script, mapped (not read) into memory."""
+        if self._contents is None:
+            with self._mapping:
+                if self._contents is None:
+                    self._contents = self._map_the_script()
+        return self._contents
+
+    @property
+    def scene_offsets(self) -> np.ndarray:
+        """The byte offset of every scene in the script, in order."""
+        if self._scene_offsets is None:
+            with self._indexing:
+                if self._scene_offsets is None:
+                    self._scene_offsets = self._load_index()
+        return self._scene_offsets
+
+    @property
+    def num_scenes(self) -> int:
+        """How many scenes the script has."""
+        return len(self.scene_offsets)
+
+    def has_scene(self, scene_num: int) -> bool:
+        """Whether there is a scene with this number (counting from 1)."""
+        return 1 <= scene_num <= self.num_scenes
+
+    def scene_offset(self, scene_num: int) -> int:
+        """Find where a scene (counting from 1) starts in the script."""
+        if not self.has_scene(scene_num):
+            raise ScriptError(
+                f"{self.title} has {self.num_scenes} scenes, not #{scene_num}."
+            )
+        return int(self.scene_offsets[scene_num - 1])
+
+    def scene_view(self, scene_num: int) -> memoryview:
+        """Get one scene (counting from 1) of the script, without copying it."""
+        start = self.scene_offset(scene_num)
+        if scene_num < self.num_scenes:
+            return self.contents[start : self.scene_offset(scene_num + 1)]
+        return self.contents[start:]
+
+    def scene(self, scene_num: int) -> str:
+        """Read one scene (counting from 1) of the script."""
+        return str(self.scene_view(scene_num), "utf-8")
+
+    def close(self) -> None:
+        """Unmap the script and its index, until a scene is asked for again.
+
+        Every scene view handed out must be released (or garbage) first, or
+        the mapping can't be closed and this raises BufferError.
+        """
+        with self._mapping:
+            if self._contents is not None:
+                self._contents.release()
+                self._contents = None
+            if self._mmap is not None:
+                try:
+                    self._mmap.close()
+                except BufferError:
+                    self._contents = memoryview(self._mmap)
+                    raise
+                self._mmap = None
+        with self._indexing:
+            self._scene_offsets = None
+
+    @property
+    def title(self) -> str:
+        """The script's title, going by its file name."""
+        return self.path.stem.replace("_", " ").title()
+
+    def __repr__(self) -> str:
+        return f"Screenplay({self.title!r})"
+
+    def __enter__(self) -> "Screenplay":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._contents: Optional[memoryview] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._scene_offsets: Optional[np.ndarray] = None
+        self._mapping = threading.Lock()
+        self._indexing = threading.Lock()
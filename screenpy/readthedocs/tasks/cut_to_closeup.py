@@ -3,10 +3,10 @@ Cut to a closeup for some personal reactions.
 """
 
 from screenpy import Actor
-from screenpy.pacing import beat
 
 from ..abilities import ControlCameras
 from ..actions import JumpToCamera, Zoom
+from ..narration import beat
 
 
 class CutToCloseup:
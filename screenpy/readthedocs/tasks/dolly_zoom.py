@@ -5,11 +5,12 @@ https://en.wikipedia.org/wiki/Dolly_zoom
 
 from typing import Optional
 
+import cam_py
 from screenpy import Actor
-from screenpy.pacing import beat
 
 from ..abilities import ControlCameras
 from ..actions import Dolly, Simultaneously, Zoom
+from ..narration import beat
 
 
 class DollyZoom:
@@ -20,6 +21,8 @@ class DollyZoom:
         the_actor.attempts_to(DollyZoom())
 
         the_actor.attempts_to(DollyZoom.on("Alfred Hitchcock"))
+
+        await DollyZoom().perform_as_async(the_actor)
     """
 
     @staticmethod
@@ -27,22 +30,32 @@ class DollyZoom:
         """Specify the character to put in frame before dolly zooming."""
         return DollyZoom(character)
 
-    @beat("{} executes a thrilling dolly zoom{detail}!")
-    def perform_as(self, the_actor: Actor) -> None:
-        """Direct the actor to dolly zoom on their camera."""
+    def _shot(self, the_actor: Actor) -> Simultaneously:
+        """Plan the dolly and the zoom, which must happen together."""
+        campy_session = the_actor.ability_to(ControlCameras).campy_session
         if self.character:
-            campy_session = the_actor.ability_to(ControlCameras).campy_session
             camera = campy_session.get_camera_on_character(self.character)
             zoom = Zoom.in_().on_camera(camera)
         else:
             zoom = Zoom.in_()
 
-        the_actor.attempts_to(
-            Simultaneously(
-                Dolly().backward(),
-                zoom,
-            ),
+        shot = Simultaneously(
+            Dolly().backward(),
+            zoom,
         )
+        if isinstance(campy_session, cam_py.AsyncRecordingSession):
+            shot.using_asyncio()
+        return shot
+
+    @beat("{} executes a thrilling dolly zoom{detail}!")
+    def perform_as(self, the_actor: Actor) -> None:
+        """Direct the actor to dolly zoom on their camera."""
+        the_actor.attempts_to(self._shot(the_actor))
+
+    @beat("{} executes a thrilling dolly zoom{detail}!")
+    async def perform_as_async(self, the_actor: Actor) -> None:
+        """Direct the actor to dolly zoom on their camera, without blocking."""
+        await self._shot(the_actor).perform_as_async(the_actor)
 
     def __init__(self, character: Optional[str] = None) -> None:
         self.character = character
@@ -0,0 +1,41 @@
+from .cassette import (
+    Cassette,
+    CassetteAdapter,
+    CassetteMiss,
+    CassetteStats,
+    RecordedResponse,
+)
+from .response_history import (
+    DROP_BODIES,
+    KEEP_BODIES,
+    SPILL_BODIES,
+    HistoryStats,
+    ResponseHistory,
+    SpilledResponse,
+)
+from .session_pool import (
+    PooledSession,
+    SessionPool,
+    SessionPoolStats,
+    reset_session,
+    start_afresh,
+)
+
+__all__ = [
+    "DROP_BODIES",
+    "KEEP_BODIES",
+    "SPILL_BODIES",
+    "Cassette",
+    "CassetteAdapter",
+    "CassetteMiss",
+    "CassetteStats",
+    "HistoryStats",
+    "PooledSession",
+    "RecordedResponse",
+    "ResponseHistory",
+    "SessionPool",
+    "SessionPoolStats",
+    "SpilledResponse",
+    "reset_session",
+    "start_afresh",
+]
@@ -0,0 +1,348 @@
+"""
+Record API responses to a cassette, and play them back instead of calling out.
+"""
+
+import hashlib
+import io
+import json
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from http.client import HTTPMessage
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from urllib3 import HTTPResponse
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# headers that describe how the body was sent, not what it is
+TRANSPORT_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class CassetteMiss(RequestsConnectionError):
+    """The request isn't on the cassette, and we may not go out and get it."""
+
+
+def normalized_url(url: str, aliases: Mapping[str, str] = {}) -> str:
+    """Spell a URL the same way every time: lowercase host, sorted query.
+
+    A URL starting with one of the ``aliases`` is spelled with what that
+    alias stands for instead, like a server whose port changes every run.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    normalized = urlunsplit((scheme, host, parts.path or "/", query, ""))
+    for alias, canonical in aliases.items():
+        prefix = normalized_url(alias).rstrip("/")
+        if normalized == prefix or normalized.startswith(f"{prefix}/"):
+            return canonical.rstrip("/") + normalized[len(prefix) :]
+    return normalized
+
+
+def request_key(
+    request: PreparedRequest,
+    match_headers: Sequence[str] = (),
+    aliases: Mapping[str, str] = {},
+) -> Optional[bytes]:
+    """Hash a request's method, URL, and body (and any ``match_headers``).
+
+    Returns None for a request whose body is streamed from an iterator or
+    file, which can't be hashed without sending it.
+    """
+    body = request.body or b""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if not isinstance(body, bytes):
+        return None
+
+    key = hashlib.sha256()
+    key.update((request.method or "GET").upper().encode("ascii"))
+    key.update(b"\0" + normalized_url(request.url or "", aliases).encode("utf-8"))
+    for header in match_headers:
+        key.update(b"\0" + str(request.headers.get(header, "")).encode("utf-8"))
+    key.update(b"\0" + body)
+    return key.digest()
+
+
+class RecordedResponse(NamedTuple):
+    """Everything needed to play a response back."""
+
+    status: int
+    reason: str
+    headers: Tuple[Tuple[str, str], ...]
+    body: bytes
+
+    @staticmethod
+    def of(response: Response) -> "RecordedResponse":
+        """Record a live response, reading its body if it hasn't been read."""
+        body = response.content or b""
+        headers = tuple(
+            (name, value)
+            for name, value in response.raw.headers.items()
+            if name.lower() not in TRANSPORT_HEADERS
+        )
+        return RecordedResponse(
+            response.status_code,
+            response.reason or "",
+            headers + (("Content-Length", str(len(body))),),
+            body,
+        )
+
+
+class CassetteStats(NamedTuple):
+    """Where the cassette's answers came from."""
+
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    stale: int
+    recorded: int
+    size: int
+
+
+class Cassette:
+    """Recorded responses in one append-only file, indexed by request key.
+
+    Each record is a fixed-size header (the request key, when it was
+    recorded, and two lengths), a little JSON for the status and headers,
+    and the raw body. Opening a cassette reads only the fixed headers,
+    skipping over everything else, to index where each response starts. A
+    response recorded again later takes the place of the earlier one.
+
+    The most recently played ``memory_size`` responses are kept in memory,
+    so the suite only touches the disk once per response. Responses older
+    than ``max_age`` seconds are stale, and are recorded again.
+
+    Examples::
+
+        cassette = Cassette("cassettes/httpbin.cassette", max_age=24 * 60 * 60)
+        recording = cassette.get(key)
+        cassette.put(key, RecordedResponse.of(response))
+    """
+
+    RECORD = struct.Struct("<32sdII")
+
+    def _index(self) -> None:
+        """Find every record in the file, and cut off any half-written one."""
+        self._file.seek(0, os.SEEK_END)
+        size = self._file.tell()
+        offset = 0
+        while offset + self.RECORD.size <= size:
+            self._file.seek(offset)
+            key, recorded_at, meta_length, body_length = self.RECORD.unpack(
+                self._file.read(self.RECORD.size)
+            )
+            end = offset + self.RECORD.size + meta_length + body_length
+            if end > size:
+                break
+            self.index[key] = (offset, recorded_at)
+            offset = end
+        if offset < size:
+            self._file.truncate(offset)
+
+    def _read(self, offset: int) -> RecordedResponse:
+        """Read the record that starts at ``offset``. Call with the lock held."""
+        self._file.seek(offset)
+        _, _, meta_length, body_length = self.RECORD.unpack(
+            self._file.read(self.RECORD.size)
+        )
+        meta = json.loads(self._file.read(meta_length))
+        body = self._file.read(body_length)
+        headers = tuple((name, value) for name, value in meta["headers"])
+        return RecordedResponse(meta["status"], meta["reason"], headers, body)
+
+    def _remember(self, key: bytes, recording: RecordedResponse) -> None:
+        """Keep a response in memory, forgetting the least recently played."""
+        self.memory[key] = recording
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_size:
+            self.memory.popitem(last=False)
+
+    def is_stale(self, recorded_at: float) -> bool:
+        """Whether a response recorded at ``recorded_at`` is too old to play."""
+        return self.max_age is not None and time.time() - recorded_at > self.max_age
+
+    def get(self, key: bytes) -> Optional[RecordedResponse]:
+        """Play back the response to a request, if it's on the cassette."""
+        with self._lock:
+            if key not in self.index:
+                self.misses += 1
+                return None
+            offset, recorded_at = self.index[key]
+            if self.is_stale(recorded_at):
+                self.stale += 1
+                return None
+            if key in self.memory:
+                self.memory_hits += 1
+                self.memory.move_to_end(key)
+                return self.memory[key]
+            self.disk_hits += 1
+            recording = self._read(offset)
+            self._remember(key, recording)
+            return recording
+
+    def put(self, key: bytes, recording: RecordedResponse) -> None:
+        """Record the response to a request."""
+        meta = json.dumps(
+            {
+                "status": recording.status,
+                "reason": recording.reason,
+                "headers": recording.headers,
+            }
+        ).encode("utf-8")
+        recorded_at = time.time()
+        header = self.RECORD.pack(key, recorded_at, len(meta), len(recording.body))
+        with self._lock:
+            self._file.seek(0, os.SEEK_END)
+            offset = self._file.tell()
+            self._file.write(header + meta + recording.body)
+            self._file.flush()
+            self.index[key] = (offset, recorded_at)
+            self.recorded += 1
+            self._remember(key, recording)
+
+    def close(self) -> None:
+        """Close the cassette's file."""
+        with self._lock:
+            self._file.close()
+
+    @property
+    def stats(self) -> CassetteStats:
+        """Hits from memory and disk, misses, and how many were recorded."""
+        with self._lock:
+            return CassetteStats(
+                self.memory_hits,
+                self.disk_hits,
+                self.misses,
+                self.stale,
+                self.recorded,
+                len(self.index),
+            )
+
+    def __init__(
+        self, path: str, max_age: Optional[float] = None, memory_size: int = 256
+    ) -> None:
+        self.path = path
+        self.max_age = max_age
+        self.memory_size = memory_size
+        self.index: Dict[bytes, Tuple[int, float]] = {}
+        self.memory: "OrderedDict[bytes, RecordedResponse]" = OrderedDict()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.recorded = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        mode = "r+b" if os.path.exists(path) else "w+b"
+        self._file = open(path, mode)  # pylint: disable=consider-using-with
+        self._index()
+
+
+class ReplayedMessage:
+    """Just enough of an http.client response for cookies to be read from."""
+
+    def close(self) -> None:
+        """There's no connection to close."""
+
+    def isclosed(self) -> bool:
+        """The response was never open."""
+        return True
+
+    def __init__(self, headers: Sequence[Tuple[str, str]]) -> None:
+        self.msg = HTTPMessage()
+        for name, value in headers:
+            self.msg[name] = value
+
+
+class CassetteAdapter(HTTPAdapter):
+    """Play responses back from a Cassette, recording any that aren't on it.
+
+    A request is looked up by its method, URL, body, and the values of the
+    ``match_headers`` (hashed, so credentials never reach the cassette). An
+    offline adapter never goes out to the network: a request that isn't on
+    the cassette raises CassetteMiss instead.
+
+    The host and port are part of the key, so a server whose address changes
+    from run to run (like the stand-in, on a random port) needs an alias for
+    its recordings to be found again.
+
+    Examples::
+
+        adapter = CassetteAdapter(Cassette("cassettes/httpbin.cassette"))
+        session_pool = SessionPool(adapter=adapter)
+
+        CassetteAdapter(cassette, offline=True)
+
+        CassetteAdapter(cassette, aliases={stand_in.base_url: "http://stand-in"})
+    """
+
+    MATCH_HEADERS = ("Authorization", "Cookie")
+
+    def replay(
+        self, request: PreparedRequest, recording: RecordedResponse
+    ) -> Response:
+        """Build a response from a recording, as if it had just arrived."""
+        raw = HTTPResponse(
+            body=io.BytesIO(recording.body),
+            headers=list(recording.headers),
+            status=recording.status,
+            reason=recording.reason,
+            preload_content=False,
+            decode_content=False,
+            original_response=ReplayedMessage(recording.headers),
+        )
+        return self.build_response(request, raw)
+
+    def send(  # type: ignore[override]
+        self, request: PreparedRequest, stream: bool = False, **kwargs: Any
+    ) -> Response:
+        """Play the response to a request back, or record it if we can't."""
+        key = request_key(request, self.match_headers, self.aliases)
+        if key is None:
+            return super().send(request, stream=stream, **kwargs)
+
+        recording = self.cassette.get(key)
+        if recording is not None:
+            return self.replay(request, recording)
+        if self.offline:
+            raise CassetteMiss(
+                f"{request.method} {request.url} is not on {self.cassette.path}.",
+                request=request,
+            )
+
+        response = super().send(request, stream=stream, **kwargs)
+        self.cassette.put(key, RecordedResponse.of(response))
+        return response
+
+    def close(self) -> None:
+        """Close the live connections and the cassette."""
+        super().close()
+        self.cassette.close()
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        offline: bool = False,
+        match_headers: Sequence[str] = MATCH_HEADERS,
+        aliases: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.cassette = cassette
+        self.offline = offline
+        self.match_headers = tuple(match_headers)
+        self.aliases = dict(aliases or {})
@@ -0,0 +1,311 @@
+"""
+Keep an Actor's API responses without letting them fill up memory.
+"""
+
+import tempfile
+import threading
+from collections import deque
+from typing import Any, Deque, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from requests import Response
+from requests.utils import iter_slices
+
+KEEP_BODIES = "keep"
+DROP_BODIES = "drop"
+SPILL_BODIES = "spill"
+
+SPILL_CHUNK_SIZE = 64 * 1024
+
+
+class HistoryStats(NamedTuple):
+    """How much the history is holding on to, and where.
+
+    ``bytes_in_memory`` and ``bytes_spilled`` count the bodies of the
+    responses still kept; ``spill_file_size`` includes any dropped ones
+    that haven't been cleared out of the spill file yet.
+    """
+
+    responses: int
+    dropped: int
+    bytes_in_memory: int
+    bytes_spilled: int
+    spill_file_size: int
+
+
+def is_unread(response: Response) -> bool:
+    """Whether a response was streamed, and its body is still on the wire."""
+    return response._content is False  # pylint: disable=protected-access
+
+
+def body_size(response: Response) -> int:
+    """How many bytes of body a response is holding in memory."""
+    content = response._content  # pylint: disable=protected-access
+    return len(content) if isinstance(content, bytes) else 0
+
+
+def copy_without_body(response: Response, into: Response) -> Response:
+    """Copy everything but the body of one response into another."""
+    for attr in response.__attrs__:
+        if attr != "_content":
+            setattr(into, attr, getattr(response, attr, None))
+    into.history = [headers_only(redirect) for redirect in response.history]
+    into._content_consumed = True  # pylint: disable=protected-access
+    return into
+
+
+def headers_only(response: Response) -> Response:
+    """A copy of a response with its status and headers, but no body."""
+    slim = copy_without_body(response, Response())
+    slim._content = b""  # pylint: disable=protected-access
+    return slim
+
+
+class SpillFile:
+    """An append-only temporary file that response bodies are moved into."""
+
+    def write(self, chunks: Iterator[bytes]) -> Tuple[int, int]:
+        """Append a body. Returns where it starts and how long it is."""
+        with self._lock:
+            self._file.seek(0, 2)
+            offset = self._file.tell()
+            for chunk in chunks:
+                self._file.write(chunk)
+            length = self._file.tell() - offset
+            self.size = offset + length
+        return offset, length
+
+    def read(self, offset: int, length: int) -> bytes:
+        """Read a body back in."""
+        with self._lock:
+            self._file.seek(offset)
+            return self._file.read(length)
+
+    def read_chunks(self, offset: int, length: int, chunk_size: int) -> Iterator[bytes]:
+        """Read a body back in, a chunk at a time."""
+        end = offset + length
+        while offset < end:
+            chunk = self.read(offset, min(chunk_size, end - offset))
+            if not chunk:
+                break
+            offset += len(chunk)
+            yield chunk
+
+    def clear(self) -> None:
+        """Throw every body away."""
+        with self._lock:
+            self._file.truncate(0)
+            self.size = 0
+
+    def close(self) -> None:
+        """Delete the file."""
+        with self._lock:
+            self._file.close()
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        self._file = tempfile.TemporaryFile(dir=directory)
+        self._lock = threading.Lock()
+        self.size = 0
+
+
+class SpilledResponse(Response):
+    """A response whose body has been moved out of memory, into a SpillFile.
+
+    The body is read back in each time it is asked for, and never kept.
+    Once the history drops (or clears) the response, its body is gone:
+    asking for it raises a ValueError, so read it while it's still kept.
+    """
+
+    def _spill_file(self) -> SpillFile:
+        """The file the body is in, as long as the history still keeps it."""
+        if self.spill is None:
+            raise ValueError(
+                f"The body of the response from {self.url} was thrown away when"
+                " it left the ResponseHistory."
+            )
+        return self.spill
+
+    def forget(self) -> None:
+        """Let go of the body, now that the history no longer keeps it."""
+        self.spill = None
+        self.close()
+
+    @property  # type: ignore[override]
+    def content(self) -> bytes:
+        """Read the body back in from the spill file."""
+        return self._spill_file().read(self.offset, self.length)
+
+    def iter_content(  # type: ignore[override]
+        self, chunk_size: Optional[int] = 1, decode_unicode: bool = False
+    ) -> Iterator[Any]:
+        """Read the body back in, a chunk at a time."""
+        if decode_unicode:
+            return iter_slices(self.text, chunk_size)
+        return self._spill_file().read_chunks(
+            self.offset, self.length, chunk_size or SPILL_CHUNK_SIZE
+        )
+
+    def __init__(self, response: Response, spill: SpillFile) -> None:
+        super().__init__()
+        copy_without_body(response, self)
+        self.spill: Optional[SpillFile] = spill
+        self.offset, self.length = spill.write(
+            response.iter_content(SPILL_CHUNK_SIZE)
+        )
+
+
+def let_go(response: Response) -> None:
+    """Close a response the history no longer keeps, and any body it spilled."""
+    if isinstance(response, SpilledResponse):
+        response.forget()
+    else:
+        response.close()
+
+
+class ResponseHistory:
+    """The responses an Actor has received, kept within a budget.
+
+    Keeps at most ``max_responses`` (or every response, if None), dropping
+    the oldest. The most recent response is always kept whole. Once another
+    arrives, what happens to the older one's body depends on ``bodies``:
+
+    * ``KEEP_BODIES`` keeps it in memory, as usual.
+    * ``DROP_BODIES`` keeps only its status, headers, and so on.
+    * ``SPILL_BODIES`` moves its body into a temporary file, which is read
+      back in whenever the body is asked for. Bodies of dropped responses
+      are cleared out of the file once they take up more than half of it.
+
+    A streamed body that was never read is never read by the history; its
+    connection is let go, and only its status and headers are kept.
+
+    A spilled response is only readable while the history keeps it. Hold on
+    to one after it's dropped (or the history is cleared) and asking for its
+    body raises a ValueError.
+
+    Install one on an Actor's MakeAPIRequests in place of its list.
+
+    Examples::
+
+        ability = the_actor.ability_to(MakeAPIRequests)
+
+        ability.responses = ResponseHistory(max_responses=100)
+
+        ability.responses = ResponseHistory(bodies=DROP_BODIES)
+
+        ability.responses = ResponseHistory(1_000, SPILL_BODIES, directory="/tmp")
+        print(ability.responses.stats.bytes_in_memory)
+    """
+
+    MIN_SPILL_TO_COMPACT = 1024 * 1024
+
+    def _retire(self, response: Response) -> Response:
+        """Make room for a new response by slimming down the previous one."""
+        if self.bodies == KEEP_BODIES:
+            return response
+        if is_unread(response):
+            response.close()
+            return headers_only(response)
+        if self.bodies == DROP_BODIES:
+            return headers_only(response)
+        if self.spill is None:
+            self.spill = SpillFile(self.directory)
+        return SpilledResponse(response, self.spill)
+
+    def _compact(self) -> None:
+        """Move the spilled bodies still kept into a new, smaller spill file."""
+        if self.spill is None or self.spill.size <= max(
+            2 * self.bytes_spilled, self.MIN_SPILL_TO_COMPACT
+        ):
+            return
+        old_spill, self.spill = self.spill, SpillFile(self.directory)
+        for response in self.responses:
+            if isinstance(response, SpilledResponse):
+                chunks = old_spill.read_chunks(
+                    response.offset, response.length, SPILL_CHUNK_SIZE
+                )
+                response.offset, response.length = self.spill.write(chunks)
+                response.spill = self.spill
+        old_spill.close()
+
+    def append(self, response: Response) -> None:
+        """Add the newest response."""
+        with self._lock:
+            if self.responses:
+                self.responses[-1] = self._retire(self.responses[-1])
+                if isinstance(self.responses[-1], SpilledResponse):
+                    self.bytes_spilled += self.responses[-1].length
+            self.responses.append(response)
+            limit = self.max_responses
+            while limit is not None and len(self.responses) > limit:
+                dropped = self.responses.popleft()
+                if isinstance(dropped, SpilledResponse):
+                    self.bytes_spilled -= dropped.length
+                let_go(dropped)
+                self.dropped += 1
+            self._compact()
+
+    def extend(self, responses: List[Response]) -> None:
+        """Add several responses, oldest first."""
+        for response in responses:
+            self.append(response)
+
+    def clear(self) -> None:
+        """Forget every response."""
+        with self._lock:
+            for response in self.responses:
+                let_go(response)
+            self.responses.clear()
+            self.dropped = 0
+            self.bytes_spilled = 0
+            if self.spill is not None:
+                self.spill.clear()
+
+    def close(self) -> None:
+        """Forget every response, and delete the spill file."""
+        self.clear()
+        if self.spill is not None:
+            self.spill.close()
+            self.spill = None
+
+    @property
+    def stats(self) -> HistoryStats:
+        """How many responses are kept, and how many body bytes are where."""
+        with self._lock:
+            return HistoryStats(
+                len(self.responses),
+                self.dropped,
+                sum(body_size(response) for response in self.responses),
+                self.bytes_spilled,
+                0 if self.spill is None else self.spill.size,
+            )
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return list(self.responses)[index]
+        return self.responses[index]
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def __iter__(self) -> Iterator[Response]:
+        return iter(list(self.responses))
+
+    def __init__(
+        self,
+        max_responses: Optional[int] = None,
+        bodies: str = KEEP_BODIES,
+        directory: Optional[str] = None,
+    ) -> None:
+        if bodies not in (KEEP_BODIES, DROP_BODIES, SPILL_BODIES):
+            raise ValueError(f'"{bodies}" is not a way to keep response bodies.')
+        if max_responses is not None and max_responses < 1:
+            raise ValueError(
+                f"A history can't keep {max_responses} responses; keep 1 or more."
+            )
+        self.max_responses = max_responses
+        self.bodies = bodies
+        self.directory = directory
+        self.responses: Deque[Response] = deque()
+        self.dropped = 0
+        self.bytes_spilled = 0
+        self.spill: Optional[SpillFile] = None
+        self._lock = threading.Lock()
@@ -0,0 +1,195 @@
+"""
+A pool of keep-alive HTTP sessions, shared across Actors and tests.
+"""
+
+import threading
+from typing import List, NamedTuple, Optional, Tuple
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.cookies import cookiejar_from_dict
+from requests.hooks import default_hooks
+from requests.models import DEFAULT_REDIRECT_LIMIT
+from requests.utils import default_headers
+from urllib3 import HTTPConnectionPool
+from screenpy_requests.abilities import MakeAPIRequests
+
+from .response_history import is_unread
+
+
+class SessionPoolStats(NamedTuple):
+    """How much use the pool, and its connections, are getting."""
+
+    hits: int
+    misses: int
+    checked_out: int
+    idle: int
+    connections_opened: int
+    requests_sent: int
+
+    @property
+    def connections_reused(self) -> int:
+        """How many requests went over a connection that was already open."""
+        return self.requests_sent - self.connections_opened
+
+
+def reset_session(session: Session) -> None:
+    """Put a session back the way it was made, without closing its connections."""
+    session.headers = default_headers()
+    session.cookies = cookiejar_from_dict({})
+    session.auth = None
+    session.proxies = {}
+    session.hooks = default_hooks()
+    session.params = {}
+    session.stream = False
+    session.verify = True
+    session.cert = None
+    session.max_redirects = DEFAULT_REDIRECT_LIMIT
+    session.trust_env = True
+
+
+def start_afresh(ability: MakeAPIRequests) -> None:
+    """Forget the headers, cookies, and responses of whoever used this last.
+
+    The session's connections stay open, so an Actor who is kept around
+    between tests can start each one as if they had just been cast. Any
+    streamed body that was never read is closed, so its connection goes
+    back to the pool rather than being left hanging.
+
+    Examples::
+
+        start_afresh(the_actor.ability_to(MakeAPIRequests))
+    """
+    if isinstance(ability.session, PooledSession):
+        ability.session.reset()
+    else:
+        reset_session(ability.session)
+    for response in ability.responses:
+        if is_unread(response):
+            response.close()
+    ability.responses.clear()
+
+
+class PooledSession(Session):
+    """A Session whose connections belong to a SessionPool.
+
+    Closing a PooledSession gives it back to its pool, rather than closing
+    the sockets it shares with every other session from the same pool.
+    """
+
+    def close(self) -> None:
+        """Give this session back to its pool."""
+        self.pool.checkin(self)
+
+    def reset(self) -> None:
+        """Forget everything the last Actor told this session."""
+        reset_session(self)
+        self.mount("https://", self.pool.adapter)
+        self.mount("http://", self.pool.adapter)
+
+    def __init__(self, pool: "SessionPool") -> None:
+        super().__init__()
+        self.pool = pool
+        self.mount("https://", pool.adapter)
+        self.mount("http://", pool.adapter)
+
+
+class SessionPool:
+    """Keep connections open between Actors, so each test needn't reconnect.
+
+    Every session checked out of the pool sends its requests through the
+    same transport adapter, so TCP (and TLS) connections opened by one test
+    are reused by the next. Headers, cookies, and the rest of a session's
+    state are not shared: each checkout gets a session that looks brand new.
+
+    ``connections`` is how many hosts to keep connections open to, and
+    ``maxsize`` is how many connections to keep open to each host. Pass an
+    ``adapter`` to send every session's requests through it instead, like a
+    CassetteAdapter to play recorded responses back.
+
+    Examples::
+
+        pool = SessionPool()
+        the_actor.can(MakeAPIRequests.using(pool.checkout()))
+        ...
+        the_actor.exit_stage_left()  # the session goes back to the pool
+        print(pool.stats.connections_reused)
+
+        SessionPool(adapter=CassetteAdapter(Cassette("httpbin.cassette")))
+    """
+
+    def __init__(
+        self,
+        connections: int = 10,
+        maxsize: int = 10,
+        adapter: Optional[HTTPAdapter] = None,
+    ) -> None:
+        if adapter is None:
+            adapter = HTTPAdapter(pool_connections=connections, pool_maxsize=maxsize)
+        self.adapter = adapter
+        self.idle: List[PooledSession] = []
+        self.hits = 0
+        self.misses = 0
+        self.checked_out = 0
+        self._lock = threading.Lock()
+
+    def checkout(self) -> PooledSession:
+        """Get a fresh session, reusing an idle one if we can."""
+        with self._lock:
+            session = self.idle.pop() if self.idle else None
+            if session is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            self.checked_out += 1
+
+        if session is None:
+            session = PooledSession(self)
+        return session
+
+    def checkin(self, session: PooledSession) -> None:
+        """Give a session back to the pool, leaving its connections open."""
+        session.reset()
+        with self._lock:
+            if session in self.idle:
+                return
+            self.checked_out -= 1
+            self.idle.append(session)
+
+    def close(self) -> None:
+        """Close every connection the pool's sessions have opened."""
+        with self._lock:
+            self.idle = []
+        # urllib3 forgets its host pools without closing them, leaving their
+        # sockets open until they're garbage collected
+        for host_pool in self._host_pools():
+            host_pool.close()
+        self.adapter.close()
+
+    def _host_pools(self) -> List[HTTPConnectionPool]:
+        """The connection pool for each host the sessions have talked to."""
+        pools = self.adapter.poolmanager.pools
+        host_pools = [pools.get(key) for key in pools.keys()]
+        return [host_pool for host_pool in host_pools if host_pool is not None]
+
+    def _connection_counts(self) -> Tuple[int, int]:
+        """Sum up the new connections and requests across every host's pool."""
+        host_pools = self._host_pools()
+        return (
+            sum(host_pool.num_connections for host_pool in host_pools),
+            sum(host_pool.num_requests for host_pool in host_pools),
+        )
+
+    @property
+    def stats(self) -> SessionPoolStats:
+        """Checkouts, and how many connections were opened versus reused."""
+        connections_opened, requests_sent = self._connection_counts()
+        with self._lock:
+            return SessionPoolStats(
+                self.hits,
+                self.misses,
+                self.checked_out,
+                len(self.idle),
+                connections_opened,
+                requests_sent,
+            )
@@ -0,0 +1,5 @@
+from .send_concurrent_requests import SendConcurrentRequests
+
+__all__ = [
+    "SendConcurrentRequests",
+]
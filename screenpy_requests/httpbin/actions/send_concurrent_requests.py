@@ -0,0 +1,161 @@
+"""
+Send several API requests at once, keeping their responses in order.
+"""
+
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from typing import Any, Callable, Coroutine, List, Sequence
+
+from requests import Response
+from screenpy import Actor
+from screenpy.pacing import aside, beat, the_narrator
+from screenpy_requests.abilities import MakeAPIRequests
+from screenpy_requests.actions import SendAPIRequest
+from screenpy_requests.exceptions import RequestError
+
+HTTP_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+
+
+def sender_for(
+    ability: MakeAPIRequests, request: SendAPIRequest
+) -> Callable[[], Response]:
+    """Get a call that sends one request through the Ability's session."""
+    if request.method not in HTTP_METHODS:
+        raise RequestError(f'"{request.method}" is not a valid HTTP method.')
+    send = getattr(ability.session, request.method.lower())
+    return lambda: send(request.url, **request.kwargs)
+
+
+def outcome_of(sender: Callable[[], Response]) -> Any:
+    """Send one request, getting back its response or whatever it raised."""
+    try:
+        return sender()
+    except Exception as exc:  # pylint: disable=broad-except
+        return exc
+
+
+AsyncMethod = Callable[..., Coroutine[Any, Any, Any]]
+
+
+def async_beat(line: str) -> Callable[[AsyncMethod], AsyncMethod]:
+    """ScreenPy's ``beat``, for a coroutine: the beat lasts until it's awaited.
+
+    ScreenPy's own ``beat`` would narrate only the creation of the coroutine,
+    not the time spent awaiting it, nor anything it raises.
+    """
+    markers = re.findall(r"\{([^0-9\}]+)}", line)
+
+    def decorator(func: AsyncMethod) -> AsyncMethod:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            action = args[0] if len(args) > 0 else None
+            actor = args[1] if len(args) > 1 else ""
+            cues = {mark: getattr(action, mark) for mark in markers}
+
+            completed_line = f"{line.format(actor, **cues)}"
+            with the_narrator.stating_a_beat(func, completed_line) as n_func:
+                retval = await n_func(*args, **kwargs)
+                if retval is not None:
+                    aside(f"=> {retval}")
+            return retval
+
+        return wrapper
+
+    return decorator
+
+
+class SendConcurrentRequests:
+    """Send several API requests at once, instead of one after another.
+
+    Up to ``limit`` requests are in flight at a time, on a pool of threads,
+    or as tasks on the running event loop when awaited through
+    ``perform_as_async``. The responses are kept in the order the requests
+    were given, not the order they came back in, so the last one is always
+    the response to the last request.
+
+    If any request fails, every other request is still seen through and
+    its response kept, and then the first failure (in the order the
+    requests were given) is raised.
+
+    Abilities Required:
+        :class:`~screenpy_requests.abilities.MakeAPIRequests`
+
+    Examples::
+
+        the_actor.attempts_to(
+            SendConcurrentRequests(
+                SendGETRequest.to(f"{BASE_URL}/get"),
+                SendPOSTRequest.to(f"{BASE_URL}/post").with_(data={"x": 1}),
+            )
+        )
+
+        the_actor.attempts_to(SendConcurrentRequests(*requests).at_most(4))
+
+        await SendConcurrentRequests(*requests).perform_as_async(the_actor)
+    """
+
+    DEFAULT_LIMIT = 8
+
+    def at_most(self, limit: int) -> "SendConcurrentRequests":
+        """Keep no more than ``limit`` requests in flight at once."""
+        if limit < 1:
+            raise ValueError("At least one request has to be in flight.")
+        self.limit = limit
+        return self
+
+    def describe(self) -> str:
+        """Describe the Action in present tense."""
+        return f"Send {self.num_requests} API requests, {self.limit} at a time"
+
+    @property
+    def num_requests(self) -> int:
+        """How many requests will be sent, for the logged beat."""
+        return len(self.requests)
+
+    def _senders(self, the_actor: Actor) -> List[Callable[[], Response]]:
+        """Check every request before any of them are sent."""
+        ability = the_actor.uses_ability_to(MakeAPIRequests)
+        return [sender_for(ability, request) for request in self.requests]
+
+    @staticmethod
+    def _keep(the_actor: Actor, outcomes: Sequence[Any]) -> None:
+        """Keep every response that came back, then raise the first failure."""
+        failures = [out for out in outcomes if isinstance(out, BaseException)]
+        the_actor.uses_ability_to(MakeAPIRequests).responses.extend(
+            [out for out in outcomes if not isinstance(out, BaseException)]
+        )
+        if failures:
+            raise failures[0]
+
+    @beat("{} sends {num_requests} API requests, {limit} at a time.")
+    def perform_as(self, the_actor: Actor) -> None:
+        """Direct the Actor to send every request, several at a time."""
+        senders = self._senders(the_actor)
+        if not senders:
+            return
+
+        workers = min(self.limit, len(senders))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(outcome_of, senders))
+        self._keep(the_actor, outcomes)
+
+    @async_beat("{} sends {num_requests} API requests, {limit} at a time.")
+    async def perform_as_async(self, the_actor: Actor) -> None:
+        """Send every request without blocking the event loop."""
+        senders = self._senders(the_actor)
+        in_flight = asyncio.Semaphore(self.limit)
+
+        async def send(sender: Callable[[], Response]) -> Any:
+            async with in_flight:
+                return await asyncio.to_thread(sender)
+
+        outcomes = await asyncio.gather(
+            *(send(sender) for sender in senders), return_exceptions=True
+        )
+        self._keep(the_actor, outcomes)
+
+    def __init__(self, *requests: SendAPIRequest) -> None:
+        self.requests = requests
+        self.limit = self.DEFAULT_LIMIT
@@ -0,0 +1,77 @@
+"""
+Benchmark the screenpy_requests Actions against a local stand-in for httpbin.
+
+With no network in the way, the difference between sending a request
+through requests directly and through an Actor is what ScreenPy costs.
+"""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from screenpy import AnActor, Actor
+from screenpy_requests.abilities import MakeAPIRequests
+from screenpy_requests.actions import SendGETRequest
+
+from ..abilities import SessionPool, start_afresh
+from ..actions import SendConcurrentRequests
+from ..stand_in import StandInServer
+
+
+def test_requests_alone(
+    stand_in: StandInServer, session_pool: SessionPool, benchmark: BenchmarkFixture
+) -> None:
+    """The baseline: a GET request sent straight through a requests Session."""
+    session = session_pool.checkout()
+    url = f"{stand_in.base_url}/get"
+
+    benchmark.group = "one GET request"
+    benchmark(session.get, url)
+
+    session.close()
+
+
+def test_send_get_request(
+    stand_in: StandInServer, Perry: Actor, benchmark: BenchmarkFixture
+) -> None:
+    """The same GET request, sent by an Actor."""
+    action = SendGETRequest.to(f"{stand_in.base_url}/get")
+
+    benchmark.group = "one GET request"
+    benchmark(Perry.attempts_to, action)
+
+
+@pytest.mark.parametrize("limit", [1, 8])
+def test_send_concurrent_requests(
+    limit: int, stand_in: StandInServer, Perry: Actor, benchmark: BenchmarkFixture
+) -> None:
+    """A hundred GET requests, fanned out ``limit`` at a time."""
+    requests = [SendGETRequest.to(f"{stand_in.base_url}/get") for _ in range(100)]
+    action = SendConcurrentRequests(*requests).at_most(limit)
+
+    benchmark.group = "100 GET requests"
+    benchmark(Perry.attempts_to, action)
+
+
+def test_casting_an_actor(
+    session_pool: SessionPool, benchmark: BenchmarkFixture
+) -> None:
+    """What each test pays for a brand-new Actor, cast and sent home again."""
+
+    def cast_an_actor() -> None:
+        the_actor = AnActor.named("Perry").who_can(
+            MakeAPIRequests.using(session_pool.checkout())
+        )
+        the_actor.exit_stage_left()
+
+    benchmark.group = "per-test setup"
+    benchmark(cast_an_actor)
+
+
+def test_starting_afresh(Perry: Actor, benchmark: BenchmarkFixture) -> None:
+    """What each test pays for an Actor kept around, and reset between tests."""
+
+    def start_the_next_test() -> None:
+        Perry.cleans_up()
+        start_afresh(Perry.ability_to(MakeAPIRequests))
+
+    benchmark.group = "per-test setup"
+    benchmark(start_the_next_test)
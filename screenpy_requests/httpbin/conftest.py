@@ -0,0 +1,151 @@
+"""
+Setup and fixtures shared by our feature tests and our benchmarks.
+"""
+
+from typing import Generator, List
+
+import pytest
+from pytest_benchmark.utils import get_tag
+
+from screenpy import AnActor
+from screenpy_requests.abilities import MakeAPIRequests
+
+from .abilities import Cassette, CassetteAdapter, SessionPool, start_afresh
+from .stand_in import StandInServer
+
+STAND_IN_URL = "http://stand-in"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Let the suite play recorded responses back instead of calling out."""
+    group = parser.getgroup("cassettes")
+    group.addoption(
+        "--cassette",
+        metavar="PATH",
+        help="Play responses back from this cassette, recording any it lacks.",
+    )
+    group.addoption(
+        "--cassette-max-age",
+        type=float,
+        metavar="SECONDS",
+        help="Record responses again once they are this old.",
+    )
+    group.addoption(
+        "--offline",
+        action="store_true",
+        help="Fail any request that isn't on the cassette, instead of sending it.",
+    )
+    group = parser.getgroup("stand-in")
+    group.addoption(
+        "--stand-in",
+        action="store_true",
+        help="Test against a local stand-in for httpbin, instead of httpbin.org.",
+    )
+    group.addoption(
+        "--stand-in-latency",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="Have the stand-in wait this long before every response.",
+    )
+    group.addoption(
+        "--stand-in-error-rate",
+        type=float,
+        default=0.0,
+        metavar="FRACTION",
+        help="Have the stand-in fail this fraction of requests with a 500.",
+    )
+
+
+def stand_in_for(config: pytest.Config) -> StandInServer:
+    """Start a stand-in for httpbin, as the command line describes it."""
+    return StandInServer(
+        latency=config.getoption("stand_in_latency"),
+        error_rate=config.getoption("stand_in_error_rate"),
+    ).start()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Point the suite at the stand-in, before any test module reads the URLs."""
+    if config.getoption("stand_in"):
+        config.stand_in = stand_in_for(config)  # type: ignore[attr-defined]
+        environment = pytest.MonkeyPatch()
+        environment.setenv("HTTPBIN_URL", config.stand_in.base_url)  # type: ignore
+        config.stand_in_environment = environment  # type: ignore[attr-defined]
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    """Save every benchmark run as JSON, so the next run can compare to it.
+
+    A run that collected no benchmarks (like ``pytest features/``) has
+    nothing to save, so it isn't asked to.
+    """
+    saving = config.getoption("benchmark_save") or config.getoption(
+        "benchmark_autosave"
+    )
+    if saving or config.getoption("benchmark_disable"):
+        return
+    if any("benchmark" in getattr(item, "fixturenames", ()) for item in items):
+        # pytest-benchmark read its options before anything was collected
+        # pylint: disable=protected-access
+        config._benchmarksession.autosave = get_tag()  # type: ignore[attr-defined]
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Shut down the stand-in, if there is one, and put HTTPBIN_URL back."""
+    stand_in = getattr(config, "stand_in", None)
+    if stand_in is not None:
+        stand_in.stop()
+        config.stand_in_environment.undo()  # type: ignore[attr-defined]
+
+
+@pytest.fixture(scope="session")
+def stand_in(pytestconfig: pytest.Config) -> Generator:
+    """A local stand-in for httpbin: the suite's own, or one just for us."""
+    configured = getattr(pytestconfig, "stand_in", None)
+    if configured is not None:
+        yield configured
+        return
+    server = stand_in_for(pytestconfig)
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def session_pool(pytestconfig: pytest.Config) -> Generator:
+    """Keep-alive connections (or a cassette), shared by every test's Actors."""
+    adapter = None
+    path = pytestconfig.getoption("cassette")
+    if path:
+        cassette = Cassette(path, max_age=pytestconfig.getoption("cassette_max_age"))
+        stand_in = getattr(pytestconfig, "stand_in", None)
+        # the stand-in's port changes every run, so record it under one name
+        aliases = {} if stand_in is None else {stand_in.base_url: STAND_IN_URL}
+        adapter = CassetteAdapter(
+            cassette, offline=pytestconfig.getoption("offline"), aliases=aliases
+        )
+    pool = SessionPool(adapter=adapter)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="module")
+def returning_Perry(session_pool: SessionPool) -> Generator:
+    """Perry, cast once for every test in a module."""
+    the_actor = AnActor.named("Perry").who_can(
+        MakeAPIRequests.using(session_pool.checkout())
+    )
+    yield the_actor
+    the_actor.exit_stage_left()
+
+
+@pytest.fixture
+def Perry(returning_Perry: AnActor) -> Generator:
+    """An Actor who can make API requests, starting each test afresh."""
+    yield returning_Perry
+    returning_Perry.cleans_up()
+    start_afresh(returning_Perry.ability_to(MakeAPIRequests))
@@ -0,0 +1,72 @@
+"""
+API test example that plays recorded responses back.
+"""
+
+from pathlib import Path
+
+from screenpy import AnActor, given, then, when
+from screenpy.actions import See
+from screenpy.resolutions import ReadsExactly
+from screenpy_requests.abilities import MakeAPIRequests
+from screenpy_requests.actions import SendGETRequest
+from screenpy_requests.questions import BodyOfTheLastResponse
+
+from ..abilities import Cassette, CassetteAdapter, SessionPool
+from ..stand_in import StandInServer
+from ..urls import BASE64_URL
+
+
+def test_replaying_a_recorded_response(tmp_path: Path) -> None:
+    """A recorded response plays back offline, exactly as it was recorded."""
+    path = str(tmp_path / "httpbin.cassette")
+    test_string = "VGhlcmUncyBubyBwbGFjZSBsaWtlIGhvbWU="
+    recording = SessionPool(adapter=CassetteAdapter(Cassette(path)))
+    Perry = AnActor.named("Perry").who_can(MakeAPIRequests.using(recording.checkout()))
+    given(Perry).was_able_to(SendGETRequest.to(f"{BASE64_URL}/{test_string}"))
+    Perry.exit_stage_left()
+    recording.close()
+
+    replaying = SessionPool(adapter=CassetteAdapter(Cassette(path), offline=True))
+    Perry = AnActor.named("Perry").who_can(MakeAPIRequests.using(replaying.checkout()))
+
+    when(Perry).attempts_to(SendGETRequest.to(f"{BASE64_URL}/{test_string}"))
+
+    then(Perry).should(
+        See.the(BodyOfTheLastResponse(), ReadsExactly("There's no place like home"))
+    )
+    assert replaying.adapter.cassette.stats.disk_hits == 1
+    Perry.exit_stage_left()
+    replaying.close()
+
+
+def test_replaying_from_a_server_that_moved(tmp_path: Path) -> None:
+    """A response recorded under an alias plays back from a different port."""
+    path = str(tmp_path / "stand-in.cassette")
+    with StandInServer() as stand_in:
+        adapter = CassetteAdapter(
+            Cassette(path), aliases={stand_in.base_url: "http://stand-in"}
+        )
+        recording = SessionPool(adapter=adapter)
+        Perry = AnActor.named("Perry").who_can(
+            MakeAPIRequests.using(recording.checkout())
+        )
+        given(Perry).was_able_to(SendGETRequest.to(f"{stand_in.base_url}/base64/SGk="))
+        Perry.exit_stage_left()
+        recording.close()
+
+    with StandInServer() as moved:
+        adapter = CassetteAdapter(
+            Cassette(path), offline=True, aliases={moved.base_url: "http://stand-in"}
+        )
+        replaying = SessionPool(adapter=adapter)
+        Perry = AnActor.named("Perry").who_can(
+            MakeAPIRequests.using(replaying.checkout())
+        )
+        try:
+            when(Perry).attempts_to(SendGETRequest.to(f"{moved.base_url}/base64/SGk="))
+
+            then(Perry).should(See.the(BodyOfTheLastResponse(), ReadsExactly("Hi")))
+            assert moved.stats.requests == 0
+        finally:
+            Perry.exit_stage_left()
+            replaying.close()
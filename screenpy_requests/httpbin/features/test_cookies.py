@@ -2,13 +2,15 @@
 API test example that tests cookies.
 """
 
-from screenpy import Actor, then, when
-from screenpy.actions import SeeAllOf
+from screenpy import Actor, AnActor, given, then, when
+from screenpy.actions import See, SeeAllOf
 from screenpy.resolutions import ContainTheEntry, IsEqualTo
-from screenpy_requests.actions import SendGETRequest
+from screenpy_requests.abilities import MakeAPIRequests
+from screenpy_requests.actions import AddHeader, SendGETRequest
 from screenpy_requests.questions import Cookies, StatusCodeOfTheLastResponse
 
-from ..urls import SET_COOKIES_URL
+from ..abilities import CassetteAdapter, SessionPool, start_afresh
+from ..urls import BASE64_URL, SET_COOKIES_URL
 
 
 def test_set_cookies(Perry: Actor) -> None:
@@ -25,3 +27,49 @@ def test_set_cookies(Perry: Actor) -> None:
             (Cookies(), ContainTheEntry(**test_cookie)),
         )
     )
+
+
+def test_cookies_stay_with_their_actor(Perry: Actor, session_pool: SessionPool) -> None:
+    """Actors sharing pooled connections don't share cookies."""
+    Perry.attempts_to(
+        SendGETRequest.to(SET_COOKIES_URL).with_(params={"type": "macaroon"})
+    )
+    Polly = AnActor.named("Polly").who_can(
+        MakeAPIRequests.using(session_pool.checkout())
+    )
+
+    when(Polly).attempts_to(SendGETRequest.to(SET_COOKIES_URL))
+
+    then(Polly).should(See.the(Cookies(), IsEqualTo({})))
+    if not isinstance(session_pool.adapter, CassetteAdapter):
+        # played-back responses never open (or reuse) a connection
+        assert session_pool.stats.connections_reused > 0
+    Polly.exit_stage_left()
+
+
+def test_a_returning_actor_starts_afresh(Perry: Actor) -> None:
+    """Between tests, Perry forgets their headers, cookies, and responses."""
+    given(Perry).was_able_to(
+        AddHeader(X_Returning="yes"),
+        SendGETRequest.to(SET_COOKIES_URL).with_(params={"type": "macaroon"}),
+    )
+
+    # what the Perry fixture does at the end of every test
+    Perry.cleans_up()
+    start_afresh(Perry.ability_to(MakeAPIRequests))
+
+    then(Perry).should(See.the(Cookies(), IsEqualTo({})))
+    assert "X_Returning" not in Perry.ability_to(MakeAPIRequests).session.headers
+    assert Perry.ability_to(MakeAPIRequests).responses == []
+
+
+def test_starting_afresh_lets_go_of_unread_bodies(Perry: Actor) -> None:
+    """A streamed body no one read gives its connection back."""
+    Perry.attempts_to(
+        SendGETRequest.to(f"{BASE64_URL}/SFRUUEJJTg==").with_(stream=True)
+    )
+    response = Perry.ability_to(MakeAPIRequests).responses[-1]
+
+    start_afresh(Perry.ability_to(MakeAPIRequests))
+
+    assert response.raw.closed
@@ -2,21 +2,38 @@
 API test examples that use all the HTTP methods.
 """
 
+import asyncio
+
 import pytest
+from requests.exceptions import ConnectionError as RequestsConnectionError
 
-from screenpy import Actor, then, when
+from screenpy import Actor, and_, then, when
 from screenpy.actions import See
-from screenpy.resolutions import IsEqualTo, ReadsExactly
+from screenpy.resolutions import ContainsTheKey, IsEqualTo, ReadsExactly
+from screenpy_requests.abilities import MakeAPIRequests
 from screenpy_requests.actions import SendAPIRequest, SendGETRequest
 from screenpy_requests.questions import (
     BodyOfTheLastResponse,
     StatusCodeOfTheLastResponse,
 )
 
+from ..abilities import SPILL_BODIES, ResponseHistory
+from ..actions import SendConcurrentRequests
+from ..questions import StatusCodesOfTheLastResponses, StreamedBodyOfTheLastResponse
+from ..resolutions import (
+    HasBodyContaining,
+    HasBodyDigest,
+    HasBodyJSONValue,
+    HasBodyLength,
+    HasBodyMatching,
+    HasBodyThat,
+)
 from ..urls import BASE64_URL, BASE_URL
 
+METHODS = ["DELETE", "GET", "PATCH", "POST", "PUT"]
+
 
-@pytest.mark.parametrize("action", ["DELETE", "GET", "PATCH", "POST", "PUT"])
+@pytest.mark.parametrize("action", METHODS)
 def test_actions(action: str, Perry: Actor) -> None:
     """HTTP-action endpoints all respond with 200s."""
     when(Perry).attempts_to(SendAPIRequest(action, f"{BASE_URL}/{action.lower()}"))
@@ -24,6 +41,35 @@ def test_actions(action: str, Perry: Actor) -> None:
     then(Perry).should(See.the(StatusCodeOfTheLastResponse(), IsEqualTo(200)))
 
 
+def test_actions_all_at_once(Perry: Actor) -> None:
+    """HTTP-action endpoints all respond with 200s, even when asked together."""
+    requests = [SendAPIRequest(a, f"{BASE_URL}/{a.lower()}") for a in METHODS]
+
+    when(Perry).attempts_to(SendConcurrentRequests(*requests))
+
+    then(Perry).should(
+        See.the(StatusCodesOfTheLastResponses(len(METHODS)), IsEqualTo([200] * 5))
+    )
+
+
+@pytest.mark.parametrize("sending", ["on threads", "on an event loop"])
+def test_one_request_failing_among_many(Perry: Actor, sending: str) -> None:
+    """The others' responses are all kept before the failure is raised."""
+    unreachable = SendGETRequest.to("http://127.0.0.1:9/nowhere")
+    requests = [SendAPIRequest(a, f"{BASE_URL}/{a.lower()}") for a in METHODS]
+    send_them = SendConcurrentRequests(unreachable, *requests)
+
+    with pytest.raises(RequestsConnectionError):
+        if sending == "on an event loop":
+            asyncio.run(send_them.perform_as_async(Perry))
+        else:
+            Perry.attempts_to(send_them)
+
+    then(Perry).should(
+        See.the(StatusCodesOfTheLastResponses(len(METHODS)), IsEqualTo([200] * 5))
+    )
+
+
 def test_base64_decoder(Perry: Actor) -> None:
     """Base64 decoder correctly decodes string"""
     test_string = "QSBsb25nIHRpbWUgYWdvIGluIGEgZ2FsYXh5IGZhciwgZmFyIGF3YXk="
@@ -37,3 +83,87 @@ def test_base64_decoder(Perry: Actor) -> None:
             ReadsExactly("A long time ago in a galaxy far, far away"),
         ),
     )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 8])
+def test_streaming_the_base64_decoder(Perry: Actor, chunk_size: int) -> None:
+    """A streamed body can be checked without reading it all into memory."""
+    test_string = "QSBsb25nIHRpbWUgYWdvIGluIGEgZ2FsYXh5IGZhciwgZmFyIGF3YXk="
+    decoded_sha256 = "f0ff62dd6230a204202f45748b7ffb26c6793ae0c02aa5b801dbfd1c05729475"
+
+    when(Perry).attempts_to(
+        SendGETRequest.to(f"{BASE64_URL}/{test_string}").with_(stream=True)
+    )
+
+    then(Perry).should(
+        See.the(
+            StreamedBodyOfTheLastResponse(chunk_size=chunk_size),
+            HasBodyThat(
+                HasBodyLength(41),
+                HasBodyDigest(decoded_sha256),
+                HasBodyContaining("galaxy far"),
+                HasBodyMatching(r"far, +far"),
+            ),
+        )
+    )
+
+
+def test_streaming_a_json_value(Perry: Actor) -> None:
+    """A value can be picked out of a streamed JSON body."""
+    when(Perry).attempts_to(SendGETRequest.to(f"{BASE_URL}/get").with_(stream=True))
+
+    then(Perry).should(
+        See.the(
+            StreamedBodyOfTheLastResponse(chunk_size=16),
+            HasBodyJSONValue("url", f"{BASE_URL}/get"),
+        )
+    )
+
+
+def test_a_streamed_body_that_isnt_json(Perry: Actor) -> None:
+    """Every check that failed is described, even when the body isn't JSON."""
+    test_string = "QSBsb25nIHRpbWUgYWdvIGluIGEgZ2FsYXh5IGZhciwgZmFyIGF3YXk="
+    Perry.attempts_to(
+        SendGETRequest.to(f"{BASE64_URL}/{test_string}").with_(stream=True)
+    )
+
+    with pytest.raises(AssertionError) as failure:
+        Perry.should(
+            See.the(
+                StreamedBodyOfTheLastResponse(),
+                HasBodyThat(HasBodyLength(1), HasBodyJSONValue("url", "nowhere")),
+            )
+        )
+
+    assert "a body 1 bytes long failed: it was 41 bytes long" in str(failure.value)
+    assert "failed: the body was not valid JSON" in str(failure.value)
+
+
+def test_a_bounded_response_history(
+    Perry: Actor, request: pytest.FixtureRequest
+) -> None:
+    """A long-lived Actor keeps only so many responses, and few bodies in memory."""
+    ability = Perry.ability_to(MakeAPIRequests)
+    history = ResponseHistory(max_responses=3, bodies=SPILL_BODIES)
+    ability.responses, kept_responses = history, ability.responses
+
+    def put_the_list_back() -> None:
+        ability.responses = kept_responses
+        history.close()
+
+    request.addfinalizer(put_the_list_back)
+    requests = [SendAPIRequest(a, f"{BASE_URL}/{a.lower()}") for a in METHODS]
+
+    when(Perry).attempts_to(*requests[:2])
+    first_response = history[0]
+    and_(Perry).attempts_to(*requests[2:])
+
+    then(Perry).should(
+        See.the(StatusCodesOfTheLastResponses(3), IsEqualTo([200] * 3)),
+        See.the(BodyOfTheLastResponse(), ContainsTheKey("url")),
+    )
+    assert history[0].json()["url"].endswith("/patch")
+    assert history.stats.dropped == len(METHODS) - 3
+    assert history.stats.bytes_in_memory == len(history[-1].content)
+    with pytest.raises(ValueError):
+        first_response.content  # pylint: disable=pointless-statement
@@ -0,0 +1,11 @@
+from .status_codes_of_the_last_responses import StatusCodesOfTheLastResponses
+from .streamed_body_of_the_last_response import (
+    StreamedBody,
+    StreamedBodyOfTheLastResponse,
+)
+
+__all__ = [
+    "StatusCodesOfTheLastResponses",
+    "StreamedBody",
+    "StreamedBodyOfTheLastResponse",
+]
@@ -0,0 +1,45 @@
+"""
+Investigate the status codes of several recent API responses.
+"""
+
+from typing import List
+
+from screenpy import Actor
+from screenpy.exceptions import UnableToAnswer
+from screenpy.pacing import beat
+from screenpy_requests.abilities import MakeAPIRequests
+
+
+class StatusCodesOfTheLastResponses:
+    """Ask about the status codes of the last few API responses, oldest first.
+
+    After SendConcurrentRequests, these are in the same order as the
+    requests that were sent.
+
+    Abilities Required:
+        :class:`~screenpy_requests.abilities.MakeAPIRequests`
+
+    Examples::
+
+        the_actor.should(
+            See.the(StatusCodesOfTheLastResponses(3), IsEqualTo([200, 201, 204]))
+        )
+    """
+
+    def describe(self) -> str:
+        """Describe the Question."""
+        return f"The HTTP status codes of the last {self.count} responses."
+
+    @beat("{} examines the status codes of the last {count} responses.")
+    def answered_by(self, the_actor: Actor) -> List[int]:
+        """Direct the Actor to investigate the status codes of recent responses."""
+        responses = the_actor.ability_to(MakeAPIRequests).responses
+        if len(responses) < self.count:
+            raise UnableToAnswer(
+                f"{the_actor} has received only {len(responses)} API responses."
+            )
+        recent = responses[len(responses) - self.count :]
+        return [response.status_code for response in recent]
+
+    def __init__(self, count: int) -> None:
+        self.count = count
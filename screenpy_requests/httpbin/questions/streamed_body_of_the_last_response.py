@@ -0,0 +1,85 @@
+"""
+Investigate the body of the last API response, a chunk at a time.
+"""
+
+from typing import Iterator
+from weakref import WeakSet
+
+from requests import Response
+from screenpy import Actor
+from screenpy.exceptions import UnableToAnswer
+from screenpy.pacing import beat
+from screenpy_requests.abilities import MakeAPIRequests
+
+
+class StreamedBody:
+    """The body of a response, which can be read through only once.
+
+    Only one chunk is held in memory at a time. A response sent with
+    ``stream=True`` hasn't been read yet, and once it has been read (even
+    partway) it can't be read again, so check everything in one go.
+    """
+
+    already_read: "WeakSet[Response]" = WeakSet()
+
+    def chunks(self) -> Iterator[bytes]:
+        """Read the body, one chunk at a time."""
+        if self.response in StreamedBody.already_read:
+            raise UnableToAnswer(
+                f"{self} has already been read. Check it all at once, using"
+                " HasBodyThat."
+            )
+        StreamedBody.already_read.add(self.response)
+        yield from self.response.iter_content(self.chunk_size)
+
+    def close(self) -> None:
+        """Stop reading, and let go of the connection."""
+        self.response.close()
+
+    def __repr__(self) -> str:
+        return f"the streamed body of {self.response.url}"
+
+    def __init__(self, response: Response, chunk_size: int) -> None:
+        self.response = response
+        self.chunk_size = chunk_size
+
+
+class StreamedBodyOfTheLastResponse:
+    """Ask about the body of the last response, without reading it all in.
+
+    Send the request with ``stream=True`` so the body is left on the wire,
+    then check it with the resolutions that read it a chunk at a time:
+    HasBodyLength, HasBodyDigest, HasBodyContaining, HasBodyMatching,
+    HasBodyJSONValue, or several of them at once with HasBodyThat.
+
+    Abilities Required:
+        :class:`~screenpy_requests.abilities.MakeAPIRequests`
+
+    Examples::
+
+        the_actor.attempts_to(SendGETRequest.to(EXPORT_URL).with_(stream=True))
+
+        the_actor.should(
+            See.the(
+                StreamedBodyOfTheLastResponse(),
+                HasBodyThat(HasBodyLength(300_000_000), HasBodyContaining("EOF")),
+            )
+        )
+    """
+
+    DEFAULT_CHUNK_SIZE = 64 * 1024
+
+    def describe(self) -> str:
+        """Describe the Question."""
+        return "The body of the last response, streamed."
+
+    @beat("{} streams the body of the last response they received.")
+    def answered_by(self, the_actor: Actor) -> StreamedBody:
+        """Direct the Actor to start reading the body of the last response."""
+        responses = the_actor.ability_to(MakeAPIRequests).responses
+        if len(responses) < 1:
+            raise UnableToAnswer(f"{the_actor} has not yet received any API responses.")
+        return StreamedBody(responses[-1], self.chunk_size)
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.chunk_size = chunk_size
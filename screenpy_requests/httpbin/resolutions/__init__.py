@@ -0,0 +1,15 @@
+from .has_body_containing import HasBodyContaining
+from .has_body_digest import HasBodyDigest
+from .has_body_json_value import HasBodyJSONValue
+from .has_body_length import HasBodyLength
+from .has_body_matching import HasBodyMatching
+from .has_body_that import HasBodyThat
+
+__all__ = [
+    "HasBodyContaining",
+    "HasBodyDigest",
+    "HasBodyJSONValue",
+    "HasBodyLength",
+    "HasBodyMatching",
+    "HasBodyThat",
+]
@@ -0,0 +1,16 @@
+from screenpy.resolutions import BaseResolution
+
+from .matchers.streamed_body import has_body_containing
+
+
+class HasBodyContaining(BaseResolution):
+    """Match a streamed body that contains some text somewhere.
+
+    Examples::
+
+        the_actor.should(
+            See.the(StreamedBodyOfTheLastResponse(), HasBodyContaining("EOF"))
+        )
+    """
+    line = "a body containing {expectation!r}"
+    matcher_function = has_body_containing
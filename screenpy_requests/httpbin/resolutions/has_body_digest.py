@@ -0,0 +1,20 @@
+from screenpy.resolutions import BaseResolution
+
+from .matchers.streamed_body import has_body_digest
+
+
+class HasBodyDigest(BaseResolution):
+    """Match a streamed body by its hash (SHA-256, unless told otherwise).
+
+    Examples::
+
+        the_actor.should(
+            See.the(StreamedBodyOfTheLastResponse(), HasBodyDigest(EXPORT_SHA256))
+        )
+
+        the_actor.should(
+            See.the(StreamedBodyOfTheLastResponse(), HasBodyDigest(md5, "md5"))
+        )
+    """
+    line = "a body with the digest {expectation}"
+    matcher_function = has_body_digest
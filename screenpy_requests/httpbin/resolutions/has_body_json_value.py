@@ -0,0 +1,19 @@
+from screenpy.resolutions import BaseResolution
+
+from .matchers.streamed_body import has_body_json_value
+
+
+class HasBodyJSONValue(BaseResolution):
+    """Match a streamed JSON body with a value at a path (needs ijson).
+
+    Examples::
+
+        the_actor.should(
+            See.the(
+                StreamedBodyOfTheLastResponse(),
+                HasBodyJSONValue("meta.total", 1_000_000),
+            )
+        )
+    """
+    line = "a JSON body with {expectation}"
+    matcher_function = has_body_json_value
@@ -0,0 +1,16 @@
+from screenpy.resolutions import BaseResolution
+
+from .matchers.streamed_body import has_body_length
+
+
+class HasBodyLength(BaseResolution):
+    """Match a streamed body that is exactly so many bytes long.
+
+    Examples::
+
+        the_actor.should(
+            See.the(StreamedBodyOfTheLastResponse(), HasBodyLength(1_048_576))
+        )
+    """
+    line = "a body {expectation} bytes long"
+    matcher_function = has_body_length
@@ -0,0 +1,16 @@
+from screenpy.resolutions import BaseResolution
+
+from .matchers.streamed_body import has_body_matching
+
+
+class HasBodyMatching(BaseResolution):
+    """Match a streamed body that a regular expression finds a match in.
+
+    Examples::
+
+        the_actor.should(
+            See.the(StreamedBodyOfTheLastResponse(), HasBodyMatching(r"rows: \\d+"))
+        )
+    """
+    line = "a body matching {expectation!r}"
+    matcher_function = has_body_matching
@@ -0,0 +1,19 @@
+from screenpy.resolutions import BaseResolution
+
+from .matchers.streamed_body import has_body_that
+
+
+class HasBodyThat(BaseResolution):
+    """Match a streamed body against several resolutions, reading it once.
+
+    Examples::
+
+        the_actor.should(
+            See.the(
+                StreamedBodyOfTheLastResponse(),
+                HasBodyThat(HasBodyLength(41), HasBodyContaining("galaxy")),
+            )
+        )
+    """
+    line = "a body that is {expectation}"
+    matcher_function = has_body_that
@@ -0,0 +1,316 @@
+"""
+Matchers that check a streamed response body a chunk at a time.
+"""
+
+import abc
+import hashlib
+import re
+from typing import Any, List, Optional, Sequence
+
+from hamcrest.core.base_matcher import BaseMatcher
+from hamcrest.core.description import Description
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+
+class ChunkMatcher(BaseMatcher, metaclass=abc.ABCMeta):
+    """A matcher that is fed a body one chunk at a time, in a single pass.
+
+    Subclasses ``start`` afresh, are ``feed`` each chunk until they are
+    ``done`` (or the body ends), and then ``finish`` with their answer.
+    """
+
+    done = False
+
+    def start(self) -> None:
+        """Get ready to read a new body."""
+        self.done = False
+
+    @abc.abstractmethod
+    def feed(self, chunk: bytes) -> None:
+        """Look at the next chunk of the body."""
+
+    @abc.abstractmethod
+    def finish(self) -> bool:
+        """Whether the body matched, now that it's all been read."""
+
+    def _matches(self, item: Any) -> bool:
+        """Read the body through, and see if it matches."""
+        return scan(item, [self])[0]
+
+    def describe_mismatch(self, item: Any, mismatch_description: Description) -> None:
+        """Description used when a match fails."""
+        mismatch_description.append_text(self.observed)
+
+    def describe_match(self, item: Any, match_description: Description) -> None:
+        """Description used when a negated match fails."""
+        match_description.append_text(self.observed)
+
+    @property
+    def observed(self) -> str:
+        """What was found in the body, for the mismatch description."""
+        return "it did not"
+
+
+def scan(body: Any, matchers: Sequence[ChunkMatcher]) -> List[bool]:
+    """Read a body once, feeding every chunk to every matcher still looking.
+
+    Stops reading early (and lets go of the connection) once every matcher
+    has made up its mind.
+    """
+    for matcher in matchers:
+        matcher.start()
+    for chunk in body.chunks():
+        for matcher in matchers:
+            if not matcher.done:
+                matcher.feed(chunk)
+        if all(matcher.done for matcher in matchers):
+            body.close()
+            break
+    return [matcher.finish() for matcher in matchers]
+
+
+class HasLength(ChunkMatcher):
+    """Assert that a body is exactly so many bytes long."""
+
+    def start(self) -> None:
+        super().start()
+        self.length = 0
+
+    def feed(self, chunk: bytes) -> None:
+        self.length += len(chunk)
+
+    def finish(self) -> bool:
+        return self.length == self.expected
+
+    def describe_to(self, description: Description) -> None:
+        """Describe the passing case."""
+        description.append_text(f"a body {self.expected} bytes long")
+
+    @property
+    def observed(self) -> str:
+        return f"it was {self.length} bytes long"
+
+    def __init__(self, expected: int) -> None:
+        self.expected = expected
+        self.length = 0
+
+
+class HasDigest(ChunkMatcher):
+    """Assert that a body hashes to the given hex digest."""
+
+    def start(self) -> None:
+        super().start()
+        self.hash = hashlib.new(self.algorithm)
+
+    def feed(self, chunk: bytes) -> None:
+        self.hash.update(chunk)
+
+    def finish(self) -> bool:
+        return self.hash.hexdigest() == self.expected.lower()
+
+    def describe_to(self, description: Description) -> None:
+        """Describe the passing case."""
+        description.append_text(f"a body whose {self.algorithm} is {self.expected}")
+
+    @property
+    def observed(self) -> str:
+        return f"its {self.algorithm} was {self.hash.hexdigest()}"
+
+    def __init__(self, expected: str, algorithm: str = "sha256") -> None:
+        self.expected = expected
+        self.algorithm = algorithm
+        self.hash = hashlib.new(algorithm)
+
+
+class Contains(ChunkMatcher):
+    """Assert that a body contains some text, even across chunk boundaries.
+
+    Only the last ``len(text) - 1`` bytes of the previous chunk are kept.
+    """
+
+    def start(self) -> None:
+        super().start()
+        self.tail = b""
+
+    def feed(self, chunk: bytes) -> None:
+        window = self.tail + chunk
+        if self.needle in window:
+            self.done = True
+        self.tail = window[-(len(self.needle) - 1) :] if len(self.needle) > 1 else b""
+
+    def finish(self) -> bool:
+        return self.done
+
+    def describe_to(self, description: Description) -> None:
+        """Describe the passing case."""
+        description.append_text(f"a body containing {self.text!r}")
+
+    @property
+    def observed(self) -> str:
+        return "it was found" if self.done else "it was not found"
+
+    def __init__(self, text: str, encoding: str = "utf-8") -> None:
+        self.text = text
+        self.needle = text.encode(encoding)
+        self.tail = b""
+
+
+class Matches(ChunkMatcher):
+    """Assert that a pattern matches somewhere in a body.
+
+    The pattern is matched against the body's bytes, carrying the last
+    ``window`` bytes over from chunk to chunk; a match can't be any longer.
+    """
+
+    def start(self) -> None:
+        super().start()
+        self.tail = b""
+        self.match: Optional[bytes] = None
+
+    def feed(self, chunk: bytes) -> None:
+        window = self.tail + chunk
+        found = self.pattern.search(window)
+        if found is not None:
+            self.match = found.group(0)
+            self.done = True
+        self.tail = window[-self.window :]
+
+    def finish(self) -> bool:
+        return self.done
+
+    def describe_to(self, description: Description) -> None:
+        """Describe the passing case."""
+        description.append_text(f"a body matching {self.pattern.pattern!r}")
+
+    @property
+    def observed(self) -> str:
+        return "it did not match" if self.match is None else f"found {self.match!r}"
+
+    def __init__(self, pattern: str, window: int = 64 * 1024) -> None:
+        self.pattern = re.compile(pattern.encode("utf-8"))
+        self.window = window
+        self.tail = b""
+        self.match = None
+
+
+class HasJSONValue(ChunkMatcher):
+    """Assert that a JSON body has a value at a path, without parsing it all.
+
+    Paths use ijson's prefixes: keys joined with dots, and ``item`` for
+    every element of an array, like ``"results.item.id"``. The first value
+    found at the path is the one compared. A body that isn't JSON (like an
+    error page) fails the match, rather than raising.
+    """
+
+    NOT_FOUND = object()
+
+    def start(self) -> None:
+        super().start()
+        self.found: Any = self.NOT_FOUND
+        self.error: Optional[Exception] = None
+        self.values: List[Any] = ijson.sendable_list()
+        self.parser = ijson.items_coro(self.values, self.path, use_float=True)
+
+    def feed(self, chunk: bytes) -> None:
+        try:
+            self.parser.send(chunk)
+        except ijson.JSONError as exc:
+            self.error = exc
+            self.done = True
+            return
+        if self.values:
+            self.found = self.values[0]
+            self.done = True
+
+    def finish(self) -> bool:
+        if not self.done:
+            try:
+                self.parser.close()
+            except ijson.JSONError as exc:
+                self.error = exc
+            if self.values:
+                self.found = self.values[0]
+        if self.error is not None:
+            return False
+        return self.found == self.expected
+
+    def describe_to(self, description: Description) -> None:
+        """Describe the passing case."""
+        description.append_text(f"a JSON body with {self.path} = {self.expected!r}")
+
+    @property
+    def observed(self) -> str:
+        if self.error is not None:
+            return f"the body was not valid JSON: {self.error}"
+        if self.found is self.NOT_FOUND:
+            return f"there was nothing at {self.path}"
+        return f"{self.path} was {self.found!r}"
+
+    def __init__(self, path: str, expected: Any) -> None:
+        if ijson is None:
+            raise ImportError("Checking streamed JSON needs ijson: pip install ijson")
+        self.path = path
+        self.expected = expected
+        self.found = self.NOT_FOUND
+        self.error = None
+
+
+class AllOfTheBody(BaseMatcher):
+    """Assert several things about a body, reading it only once."""
+
+    def _matches(self, item: Any) -> bool:
+        """Read the body through once, and see if every matcher matches."""
+        self.results = scan(item, self.matchers)
+        return all(self.results)
+
+    def describe_to(self, description: Description) -> None:
+        """Describe the passing case."""
+        for number, matcher in enumerate(self.matchers):
+            if number:
+                description.append_text(" and ")
+            matcher.describe_to(description)
+
+    def describe_mismatch(self, item: Any, mismatch_description: Description) -> None:
+        """Description used when a match fails."""
+        failures = [
+            matcher
+            for matcher, result in zip(self.matchers, self.results)
+            if not result
+        ]
+        for number, matcher in enumerate(failures):
+            if number:
+                mismatch_description.append_text(", and ")
+            matcher.describe_to(mismatch_description)
+            mismatch_description.append_text(f" failed: {matcher.observed}")
+
+    def __init__(self, *matchers: ChunkMatcher) -> None:
+        self.matchers = matchers
+        self.results: List[bool] = []
+
+
+def has_body_length(length: int) -> HasLength:
+    return HasLength(length)
+
+
+def has_body_digest(digest: str, algorithm: str = "sha256") -> HasDigest:
+    return HasDigest(digest, algorithm)
+
+
+def has_body_containing(text: str) -> Contains:
+    return Contains(text)
+
+
+def has_body_matching(pattern: str) -> Matches:
+    return Matches(pattern)
+
+
+def has_body_json_value(path: str, value: Any) -> HasJSONValue:
+    return HasJSONValue(path, value)
+
+
+def has_body_that(*resolutions: Any) -> AllOfTheBody:
+    return AllOfTheBody(*(resolution.matcher for resolution in resolutions))
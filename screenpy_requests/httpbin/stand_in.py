@@ -0,0 +1,295 @@
+"""
+A local stand-in for the parts of httpbin.org this suite uses.
+"""
+
+import asyncio
+import base64
+import binascii
+import json
+import random
+import threading
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+METHOD_ENDPOINTS = ("/delete", "/get", "/patch", "/post", "/put")
+
+
+class StandInRequest(NamedTuple):
+    """A request the stand-in received."""
+
+    method: str
+    target: str
+    headers: Dict[str, str]
+    body: bytes
+    origin: str
+
+    @property
+    def path(self) -> str:
+        """The request's path, without its query."""
+        return urlsplit(self.target).path
+
+    @property
+    def args(self) -> Dict[str, str]:
+        """The request's query parameters."""
+        return dict(parse_qsl(urlsplit(self.target).query, keep_blank_values=True))
+
+
+class StandInResponse(NamedTuple):
+    """A response for the stand-in to send."""
+
+    status: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+
+    @staticmethod
+    def of_json(content: Any, status: int = 200) -> "StandInResponse":
+        """Respond with some JSON, like httpbin does."""
+        body = json.dumps(content, indent=2).encode("utf-8") + b"\n"
+        return StandInResponse(status, [("Content-Type", "application/json")], body)
+
+    @staticmethod
+    def of_text(text: str, status: int = 200) -> "StandInResponse":
+        """Respond with some plain text."""
+        content_type = ("Content-Type", "text/html; charset=utf-8")
+        return StandInResponse(status, [content_type], text.encode("utf-8"))
+
+    def encode(self, keep_alive: bool) -> bytes:
+        """Spell the response out as HTTP/1.1."""
+        reason = HTTPStatus(self.status).phrase
+        lines = [f"HTTP/1.1 {self.status} {reason}"]
+        lines.extend(f"{name}: {value}" for name, value in self.headers)
+        lines.append(f"Content-Length: {len(self.body)}")
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        head = "\r\n".join(lines) + "\r\n\r\n"
+        return head.encode("latin-1") + self.body
+
+
+class StandInStats(NamedTuple):
+    """How busy the stand-in has been."""
+
+    connections: int
+    requests: int
+    errors_injected: int
+
+
+def echo(request: StandInRequest, url: str) -> Dict[str, Any]:
+    """Describe a request back to its sender, the way httpbin does."""
+    content: Dict[str, Any] = {
+        "args": request.args,
+        "headers": {name.title(): value for name, value in request.headers.items()},
+        "origin": request.origin,
+        "url": url,
+    }
+    if request.method != "GET":
+        data = request.body.decode("utf-8", errors="replace")
+        content_type = request.headers.get("content-type", "")
+        content["data"] = "" if "form" in content_type else data
+        content["form"] = dict(parse_qsl(data)) if "form" in content_type else {}
+        try:
+            content["json"] = json.loads(data) if "json" in content_type else None
+        except ValueError:
+            content["json"] = None
+    return content
+
+
+class StandInServer:
+    """An in-process, httpbin-compatible HTTP server, running on asyncio.
+
+    The server runs its own event loop on a background thread, so
+    synchronous tests can call it like any other server. It understands
+    HTTP/1.1 keep-alive, and serves ``/basic-auth``, ``/bearer``,
+    ``/cookies`` and ``/cookies/set``, ``/base64``, and the five method
+    endpoints (``/get``, ``/post``, and so on).
+
+    Every response waits ``latency`` seconds first. A fraction
+    (``error_rate``) of requests get an ``error_status`` response instead of
+    their real one; pass a ``seed`` to inject the same errors every run.
+
+    Examples::
+
+        with StandInServer() as stand_in:
+            the_actor.attempts_to(SendGETRequest.to(f"{stand_in.base_url}/get"))
+
+        StandInServer(latency=0.05, error_rate=0.01, seed=1234).start()
+    """
+
+    def _route(self, request: StandInRequest) -> StandInResponse:
+        """Work out the real response to a request."""
+        path = request.path
+        authorization = request.headers.get("authorization", "")
+
+        if path in METHOD_ENDPOINTS:
+            if request.method != path[1:].upper():
+                return StandInResponse.of_text("", status=405)
+            return StandInResponse.of_json(echo(request, self.url_for(request)))
+
+        if path.startswith("/basic-auth/"):
+            user, _, password = path[len("/basic-auth/") :].partition("/")
+            expected = base64.b64encode(f"{user}:{password}".encode()).decode()
+            if authorization != f"Basic {expected}":
+                response = StandInResponse.of_text("", status=401)
+                response.headers.append(("WWW-Authenticate", 'Basic realm="Fake"'))
+                return response
+            return StandInResponse.of_json({"authenticated": True, "user": user})
+
+        if path == "/bearer":
+            scheme, _, token = authorization.partition(" ")
+            if scheme != "Bearer" or not token:
+                response = StandInResponse.of_text("", status=401)
+                response.headers.append(("WWW-Authenticate", "Bearer"))
+                return response
+            return StandInResponse.of_json({"authenticated": True, "token": token})
+
+        if path == "/cookies/set":
+            response = StandInResponse.of_text("", status=302)
+            response.headers.append(("Location", "/cookies"))
+            for name, value in request.args.items():
+                response.headers.append(("Set-Cookie", f"{name}={value}; Path=/"))
+            return response
+
+        if path == "/cookies":
+            cookies = SimpleCookie(request.headers.get("cookie", ""))
+            jar = {name: morsel.value for name, morsel in cookies.items()}
+            return StandInResponse.of_json({"cookies": jar})
+
+        if path.startswith("/base64/"):
+            try:
+                decoded = base64.urlsafe_b64decode(path[len("/base64/") :])
+                return StandInResponse.of_text(decoded.decode("utf-8"))
+            except (binascii.Error, UnicodeDecodeError):
+                return StandInResponse.of_text(
+                    "Incorrect Base64 data try: SFRUUEJJTiBpcyBhd2Vzb21l"
+                )
+
+        return StandInResponse.of_text("", status=404)
+
+    def url_for(self, request: StandInRequest) -> str:
+        """The full URL a request was sent to."""
+        return f"{self.base_url}{request.target}"
+
+    async def _respond(self, request: StandInRequest) -> StandInResponse:
+        """Wait out the latency, then respond, or fail if it's time to."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.requests += 1
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.errors_injected += 1
+            return StandInResponse.of_text("Injected error.", status=self.error_status)
+        return self._route(request)
+
+    async def _read_request(
+        self, reader: asyncio.StreamReader, origin: str
+    ) -> Optional[StandInRequest]:
+        """Read the next request on a connection, or None if it has closed."""
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        method, target, _ = request_line.decode("latin-1").split(" ", 2)
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        body = await reader.readexactly(int(headers.get("content-length", 0)))
+        return StandInRequest(method, target, headers, body, origin)
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve requests on one connection until the client hangs up."""
+        task = asyncio.current_task()
+        if task is not None:
+            self._handlers.add(task)
+        self.connections += 1
+        origin = writer.get_extra_info("peername", ("127.0.0.1", 0))[0]
+        try:
+            while True:
+                request = await self._read_request(reader, origin)
+                if request is None:
+                    break
+                response = await self._respond(request)
+                keep_alive = request.headers.get("connection", "").lower() != "close"
+                writer.write(response.encode(keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+            if task is not None:
+                self._handlers.discard(task)
+
+    async def _stop_serving(self) -> None:
+        """Stop accepting connections, and hang up on the open ones."""
+        if self._server is not None:
+            self._server.close()
+        handlers = list(self._handlers)
+        for handler in handlers:
+            handler.cancel()
+        await asyncio.gather(*handlers, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    def start(self) -> "StandInServer":
+        """Start serving on a background thread."""
+        self._thread.start()
+        self._server = asyncio.run_coroutine_threadsafe(
+            asyncio.start_server(self._serve, self.host, self.port), self._loop
+        ).result()
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    def stop(self) -> None:
+        """Stop serving, and shut the background thread down."""
+        if not self._thread.is_alive():
+            return
+        asyncio.run_coroutine_threadsafe(self._stop_serving(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    @property
+    def base_url(self) -> str:
+        """Where to send requests, to have the stand-in answer them."""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def stats(self) -> StandInStats:
+        """Connections accepted, requests answered, and errors injected."""
+        return StandInStats(self.connections, self.requests, self.errors_injected)
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.host = host
+        self.port = port
+        self.connections = 0
+        self.requests = 0
+        self.errors_injected = 0
+        self._random = random.Random(seed)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._handlers: "Set[asyncio.Task]" = set()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
@@ -1,8 +1,12 @@
 """
 URLs to be tested via API requests.
+
+Set ``HTTPBIN_URL`` to test against another httpbin, like a local one.
 """
 
-BASE_URL = "https://httpbin.org"
+import os
+
+BASE_URL = os.environ.get("HTTPBIN_URL", "https://httpbin.org").rstrip("/")
 
 BASIC_AUTH_URL = f"{BASE_URL}/basic-auth"
 BEARER_AUTH_URL = f"{BASE_URL}/bearer"